@@ -7,25 +7,43 @@ Benchmark 可视化脚本
 3. 综合对比
 """
 
-import matplotlib.pyplot as plt
-import numpy as np
+import argparse
+import multiprocessing
 
-# 设置样式
-plt.rcParams['font.family'] = ['DejaVu Sans', 'sans-serif']
+import matplotlib
+
+# 仅输出文件，不需要交互式后端
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib import font_manager  # noqa: E402
+
+# 设置样式：DejaVu Sans 随 matplotlib 发布，使用单一字体避免逐级回退查找
+plt.rcParams['font.family'] = 'DejaVu Sans'
+font_manager.findfont('DejaVu Sans')
 plt.rcParams['axes.unicode_minus'] = False
 plt.style.use('seaborn-v0_8-whitegrid')
 
 # 数据：网格大小
-grid_sizes = [100, 150, 200, 250, 300, 350, 400]
-nodes = [s * s for s in grid_sizes]
+grid_sizes = np.array([100, 150, 200, 250, 300, 350, 400])
+nodes = grid_sizes ** 2
 
 # 最短路径数据 (ms) - 完整数据
-shortest_dijkstra = [1.13, 2.91, 5.33, 8.60, 12.12, 17.30, 24.78]
-shortest_bellman_ford = [1.29, 3.04, 7.67, 15.89, 24.76, 45.40, 69.62]
+shortest_dijkstra = np.array([1.13, 2.91, 5.33, 8.60, 12.12, 17.30, 24.78])
+shortest_bellman_ford = np.array([1.29, 3.04, 7.67, 15.89, 24.76, 45.40, 69.62])
 
 # 次短路径数据 (ms) - 完整数据
-second_dijkstra = [2.49, 5.96, 10.93, 17.90, 25.85, 38.75, 50.03]
-second_bellman_ford = [1.61, 4.31, 8.83, 21.61, 36.08, 57.39, 86.68]
+second_dijkstra = np.array([2.49, 5.96, 10.93, 17.90, 25.85, 38.75, 50.03])
+second_bellman_ford = np.array([1.61, 4.31, 8.83, 21.61, 36.08, 57.39, 86.68])
+
+# 坐标轴范围所需的最大值，只计算一次
+NODES_MAX = nodes.max()
+SHORTEST_BF_MAX = shortest_bellman_ford.max()
+SECOND_BF_MAX = second_bellman_ford.max()
+
+# 柱状图共用的 x 轴刻度标签
+GRID_TICK_LABELS = tuple(f'{s}×{s}\n({n:,})' for s, n in zip(grid_sizes, nodes))
 
 # 算法名称
 BELLMAN_FORD_SHORT = "Queue-Optimized\nBellman-Ford"
@@ -34,9 +52,19 @@ BELLMAN_FORD_SECOND = "State-Extended\nBellman-Ford"
 BELLMAN_FORD_SECOND_LABEL = "State-Extended Bellman-Ford"
 
 
-def plot_shortest_path():
-    """绘制最短路径对比图"""
-    fig, ax = plt.subplots(figsize=(12, 7))
+def _save_figure(fig, stem):
+    """将独立图保存为 PNG 和 PDF 并关闭"""
+    fig.savefig(f'{stem}.png', dpi=150, bbox_inches='tight')
+    fig.savefig(f'{stem}.pdf', bbox_inches='tight')
+    plt.close(fig)
+    print(f"Saved: {stem}.png, {stem}.pdf")
+
+
+def plot_shortest_path(ax=None):
+    """绘制最短路径对比图；传入 ax 时只在其上绘制，不单独保存"""
+    standalone = ax is None
+    if standalone:
+        fig, ax = plt.subplots(figsize=(12, 7), constrained_layout=True)
 
     x = np.arange(len(grid_sizes))
     width = 0.35
@@ -51,43 +79,31 @@ def plot_shortest_path():
     ax.set_title('Shortest Path: Dijkstra vs Queue-Optimized Bellman-Ford on Grid Graphs',
                  fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels([f'{s}×{s}\n({n:,})' for s, n in zip(grid_sizes, nodes)])
+    ax.set_xticklabels(GRID_TICK_LABELS)
     ax.legend(loc='upper left', fontsize=10)
 
     # 添加数值标签
-    for bar in bars1:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
-    for bar in bars2:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
+    ax.bar_label(bars1, fmt='%.1f', padding=3, fontsize=8)
+    ax.bar_label(bars2, fmt='%.1f', padding=3, fontsize=8)
 
     # Dijkstra 始终更快的区域着色
-    ax.fill_between([-0.5, 6.5], 0, max(shortest_bellman_ford) * 1.15,
-                    alpha=0.08, color='#2ecc71')
-    ax.text(3, max(shortest_bellman_ford) * 0.95, 'Dijkstra consistently faster',
+    ax.axvspan(-0.5, 6.5, alpha=0.08, color='#2ecc71')
+    ax.text(3, SHORTEST_BF_MAX * 0.95, 'Dijkstra consistently faster',
             ha='center', fontsize=11, color='#27ae60', fontweight='bold',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
 
     ax.set_xlim(-0.5, 6.5)
-    ax.set_ylim(0, max(shortest_bellman_ford) * 1.15)
+    ax.set_ylim(0, SHORTEST_BF_MAX * 1.15)
 
-    plt.tight_layout()
-    plt.savefig('shortest_path_benchmark.png', dpi=150, bbox_inches='tight')
-    plt.savefig('shortest_path_benchmark.pdf', bbox_inches='tight')
-    plt.close()
-    print("Saved: shortest_path_benchmark.png, shortest_path_benchmark.pdf")
+    if standalone:
+        _save_figure(fig, 'shortest_path_benchmark')
 
 
-def plot_second_shortest_path():
-    """绘制次短路径对比图"""
-    fig, ax = plt.subplots(figsize=(12, 7))
+def plot_second_shortest_path(ax=None):
+    """绘制次短路径对比图；传入 ax 时只在其上绘制，不单独保存"""
+    standalone = ax is None
+    if standalone:
+        fig, ax = plt.subplots(figsize=(12, 7), constrained_layout=True)
 
     x = np.arange(len(grid_sizes))
     width = 0.35
@@ -102,56 +118,44 @@ def plot_second_shortest_path():
     ax.set_title('Second Shortest Path: Two-Distance Dijkstra vs State-Extended Bellman-Ford',
                  fontsize=14, fontweight='bold')
     ax.set_xticks(x)
-    ax.set_xticklabels([f'{s}×{s}\n({n:,})' for s, n in zip(grid_sizes, nodes)])
+    ax.set_xticklabels(GRID_TICK_LABELS)
     ax.legend(loc='upper left', fontsize=10)
 
     # 添加数值标签
-    for bar in bars1:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
-    for bar in bars2:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontsize=8)
+    ax.bar_label(bars1, fmt='%.1f', padding=3, fontsize=8)
+    ax.bar_label(bars2, fmt='%.1f', padding=3, fontsize=8)
 
     # 标注转折点 (在 200x200 和 250x250 之间)
     crossover_x = 2.5
     ax.axvline(x=crossover_x, color='red', linestyle='--', alpha=0.7, linewidth=2)
     ax.annotate('Crossover Point\n(~62,500 nodes)',
-                xy=(crossover_x, max(second_bellman_ford) * 0.7),
+                xy=(crossover_x, SECOND_BF_MAX * 0.7),
                 ha='center', fontsize=10, color='red', fontweight='bold',
                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.9))
 
     # 添加区域着色
-    ax.fill_between([-0.5, crossover_x], 0, max(second_bellman_ford) * 1.15,
-                    alpha=0.08, color='#e67e22')
-    ax.fill_between([crossover_x, 6.5], 0, max(second_bellman_ford) * 1.15,
-                    alpha=0.08, color='#3498db')
+    ax.axvspan(-0.5, crossover_x, alpha=0.08, color='#e67e22')
+    ax.axvspan(crossover_x, 6.5, alpha=0.08, color='#3498db')
 
     # 区域标签
-    ax.text(1, max(second_bellman_ford) * 0.45, 'Bellman-Ford\nfaster',
+    ax.text(1, SECOND_BF_MAX * 0.45, 'Bellman-Ford\nfaster',
             ha='center', fontsize=10, color='#d35400', fontweight='bold')
-    ax.text(4.5, max(second_bellman_ford) * 0.45, 'Dijkstra\nfaster',
+    ax.text(4.5, SECOND_BF_MAX * 0.45, 'Dijkstra\nfaster',
             ha='center', fontsize=10, color='#2980b9', fontweight='bold')
 
     ax.set_xlim(-0.5, 6.5)
-    ax.set_ylim(0, max(second_bellman_ford) * 1.15)
+    ax.set_ylim(0, SECOND_BF_MAX * 1.15)
 
-    plt.tight_layout()
-    plt.savefig('second_shortest_path_benchmark.png', dpi=150, bbox_inches='tight')
-    plt.savefig('second_shortest_path_benchmark.pdf', bbox_inches='tight')
-    plt.close()
-    print("Saved: second_shortest_path_benchmark.png, second_shortest_path_benchmark.pdf")
+    if standalone:
+        _save_figure(fig, 'second_shortest_path_benchmark')
 
 
-def plot_combined():
-    """绘制综合对比图 - 折线图"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+def plot_combined(axes=None):
+    """绘制综合对比图 - 折线图；传入 (ax1, ax2) 时只在其上绘制，不单独保存"""
+    standalone = axes is None
+    if standalone:
+        fig, axes = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
+    ax1, ax2 = axes
 
     # 左图：最短路径
     ax1.plot(nodes, shortest_dijkstra, 'o-',
@@ -163,13 +167,12 @@ def plot_combined():
     ax1.set_ylabel('Time (ms)', fontsize=11)
     ax1.set_title('Shortest Path\n(Grid Graph)', fontsize=13, fontweight='bold')
     ax1.legend(loc='upper left', fontsize=9)
-    ax1.set_xlim(0, max(nodes) * 1.05)
-    ax1.set_ylim(0, max(shortest_bellman_ford) * 1.1)
+    ax1.set_xlim(0, NODES_MAX * 1.05)
+    ax1.set_ylim(0, SHORTEST_BF_MAX * 1.1)
 
     # 左图着色
-    ax1.fill_between(nodes, 0, [max(shortest_bellman_ford) * 1.1] * len(nodes),
-                     alpha=0.08, color='#2ecc71')
-    ax1.text(max(nodes) * 0.5, max(shortest_bellman_ford) * 0.85,
+    ax1.axvspan(nodes[0], nodes[-1], alpha=0.08, color='#2ecc71')
+    ax1.text(NODES_MAX * 0.5, SHORTEST_BF_MAX * 0.85,
              'Dijkstra always faster\non grid graphs',
              ha='center', fontsize=10, color='#27ae60', fontweight='bold',
              bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
@@ -195,31 +198,29 @@ def plot_combined():
     ax2.legend(loc='upper left', fontsize=9)
 
     # 右图区域着色
-    ax2.fill_between([0, crossover_nodes], 0, max(second_bellman_ford) * 1.1,
-                     alpha=0.08, color='#e67e22')
-    ax2.fill_between([crossover_nodes, max(nodes) * 1.05], 0, max(second_bellman_ford) * 1.1,
-                     alpha=0.08, color='#3498db')
+    ax2.axvspan(0, crossover_nodes, alpha=0.08, color='#e67e22')
+    ax2.axvspan(crossover_nodes, NODES_MAX * 1.05, alpha=0.08, color='#3498db')
 
-    ax2.set_xlim(0, max(nodes) * 1.05)
-    ax2.set_ylim(0, max(second_bellman_ford) * 1.1)
+    ax2.set_xlim(0, NODES_MAX * 1.05)
+    ax2.set_ylim(0, SECOND_BF_MAX * 1.1)
 
-    plt.suptitle('Algorithm Performance Comparison on Grid Graphs',
-                 fontsize=14, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig('combined_benchmark.png', dpi=150, bbox_inches='tight')
-    plt.savefig('combined_benchmark.pdf', bbox_inches='tight')
-    plt.close()
-    print("Saved: combined_benchmark.png, combined_benchmark.pdf")
+    if standalone:
+        fig.suptitle('Algorithm Performance Comparison on Grid Graphs',
+                     fontsize=14, fontweight='bold', y=1.02)
+        _save_figure(fig, 'combined_benchmark')
 
 
-def plot_speedup_line():
-    """绘制加速比折线图 - 更清晰地展示趋势"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+def plot_speedup_line(ax=None):
+    """绘制加速比折线图 - 更清晰地展示趋势；传入 ax 时只在其上绘制，不单独保存"""
+    standalone = ax is None
+    if standalone:
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
 
     # 计算加速比：Bellman-Ford 时间 / Dijkstra 时间
     # > 1 表示 Dijkstra 更快，< 1 表示 Bellman-Ford 更快
-    shortest_ratio = [s / d for d, s in zip(shortest_dijkstra, shortest_bellman_ford)]
-    second_ratio = [s / d for d, s in zip(second_dijkstra, second_bellman_ford)]
+    shortest_ratio = shortest_bellman_ford / shortest_dijkstra
+    second_ratio = second_bellman_ford / second_dijkstra
+    ratio_max = max(shortest_ratio.max(), second_ratio.max())
 
     ax.plot(nodes, shortest_ratio, 'o-',
             color='#27ae60', linewidth=2.5, markersize=10,
@@ -230,18 +231,16 @@ def plot_speedup_line():
 
     # 基准线
     ax.axhline(y=1, color='black', linestyle='-', linewidth=1.5, alpha=0.7)
-    ax.text(max(nodes) * 0.95, 1.08, 'Equal Performance', ha='right', fontsize=9,
+    ax.text(NODES_MAX * 0.95, 1.08, 'Equal Performance', ha='right', fontsize=9,
             fontstyle='italic')
 
     # 区域着色
-    ax.fill_between([0, max(nodes) * 1.05], 1, max(max(shortest_ratio), max(second_ratio)) * 1.1,
-                    alpha=0.1, color='#3498db', label='_Dijkstra faster region')
-    ax.fill_between([0, max(nodes) * 1.05], 0, 1,
-                    alpha=0.1, color='#e74c3c', label='_Bellman-Ford faster region')
+    ax.axhspan(1, ratio_max * 1.1, alpha=0.1, color='#3498db', label='_Dijkstra faster region')
+    ax.axhspan(0, 1, alpha=0.1, color='#e74c3c', label='_Bellman-Ford faster region')
 
-    ax.text(max(nodes) * 0.7, 0.75, 'Bellman-Ford faster', ha='center', fontsize=11,
+    ax.text(NODES_MAX * 0.7, 0.75, 'Bellman-Ford faster', ha='center', fontsize=11,
             color='#c0392b', fontweight='bold')
-    ax.text(max(nodes) * 0.7, 2.2, 'Dijkstra faster', ha='center', fontsize=11,
+    ax.text(NODES_MAX * 0.7, 2.2, 'Dijkstra faster', ha='center', fontsize=11,
             color='#2980b9', fontweight='bold')
 
     ax.set_xlabel('Number of Nodes', fontsize=12)
@@ -251,8 +250,8 @@ def plot_speedup_line():
                  fontsize=13, fontweight='bold')
     ax.legend(loc='upper left', fontsize=10)
 
-    ax.set_xlim(0, max(nodes) * 1.05)
-    ax.set_ylim(0, max(max(shortest_ratio), max(second_ratio)) * 1.15)
+    ax.set_xlim(0, NODES_MAX * 1.05)
+    ax.set_ylim(0, ratio_max * 1.15)
 
     # 添加数据点标签
     for i, (n, r1, r2) in enumerate(zip(nodes, shortest_ratio, second_ratio)):
@@ -262,21 +261,54 @@ def plot_speedup_line():
         ax.annotate(f'{r2:.2f}x', (n, r2), textcoords="offset points",
                     xytext=(0, offset), ha='center', fontsize=8, color='#e67e22')
 
-    plt.tight_layout()
-    plt.savefig('speedup_ratio.png', dpi=150, bbox_inches='tight')
-    plt.savefig('speedup_ratio.pdf', bbox_inches='tight')
-    plt.close()
-    print("Saved: speedup_ratio.png, speedup_ratio.pdf")
+    if standalone:
+        _save_figure(fig, 'speedup_ratio')
+
+
+PLOT_TASKS = (plot_shortest_path, plot_second_shortest_path, plot_combined, plot_speedup_line)
+
+
+def _run_plot(plot_func):
+    """在工作进程中执行单个绘图函数"""
+    plot_func()
+
+
+def plot_dashboard():
+    """将全部图表绘制到一张画布上，只做一次 savefig"""
+    fig, axes = plt.subplot_mosaic(
+        [['shortest', 'second'],
+         ['combined_shortest', 'combined_second'],
+         ['speedup', 'speedup']],
+        figsize=(24, 21), constrained_layout=True)
+
+    plot_shortest_path(axes['shortest'])
+    plot_second_shortest_path(axes['second'])
+    plot_combined((axes['combined_shortest'], axes['combined_second']))
+    plot_speedup_line(axes['speedup'])
+
+    fig.suptitle('Algorithm Performance Comparison on Grid Graphs',
+                 fontsize=16, fontweight='bold')
+    fig.savefig('benchmark_dashboard.png', dpi=150)
+    plt.close(fig)
+    print("Saved: benchmark_dashboard.png")
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='生成 benchmark 可视化图表')
+    parser.add_argument('--dashboard', action='store_true',
+                        help='只生成一张包含全部子图的 benchmark_dashboard.png')
+    args = parser.parse_args()
+
     print("Generating benchmark visualizations...")
     print()
 
-    plot_shortest_path()
-    plot_second_shortest_path()
-    plot_combined()
-    plot_speedup_line()
+    if args.dashboard:
+        plot_dashboard()
+        raise SystemExit(0)
+
+    # 四张图彼此独立，分别在子进程中渲染
+    with multiprocessing.Pool(len(PLOT_TASKS)) as pool:
+        pool.map(_run_plot, PLOT_TASKS)
 
     print()
     print("All images generated successfully!")
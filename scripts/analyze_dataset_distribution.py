@@ -3,47 +3,45 @@ import matplotlib.pyplot as plt
 import os
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
+
 def analyze_distribution():
     data_path = 'data/leetcode/leetcode_second_shortest_path.json'
     if not os.path.exists(data_path):
         print(f"Error: {data_path} not found.")
         return
 
-    with open(data_path, 'r') as f:
-        data = json.load(f)
+    with open(data_path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     test_cases = data['test_cases']
-    
+    count = len(test_cases)
+
+    ids = np.fromiter((tc['id'] for tc in test_cases), dtype=np.int32, count=count)
+    ns = np.fromiter((tc['n'] for tc in test_cases), dtype=np.int32, count=count)
+    ms = np.fromiter((len(tc['edges']) for tc in test_cases), dtype=np.int32, count=count)
+
     categories = {
-        'Official': [],
-        'Random': [],
-        'Special': []
+        'Official': ids < 100,
+        'Random': (ids >= 100) & (ids < 200),
+        'Special': ids >= 200
     }
 
-    for tc in test_cases:
-        cid = tc['id']
-        n = tc['n']
-        m = len(tc['edges'])
-        
-        if cid < 100:
-            categories['Official'].append((n, m))
-        elif 100 <= cid < 200:
-            categories['Random'].append((n, m))
-        else:
-            categories['Special'].append((n, m))
-
     print(f"{ 'Category':<15} | { 'Count':<5} | { 'Node Range':<15} | { 'Edge Range':<15}")
     print("-" * 60)
     
-    for cat, points in categories.items():
-        if not points:
+    for cat, mask in categories.items():
+        if not mask.any():
             continue
-        count = len(points)
-        ns = [p[0] for p in points]
-        ms = [p[1] for p in points]
-        n_range = f"{min(ns)}-{max(ns)}"
-        m_range = f"{min(ms)}-{max(ms)}"
-        print(f"{cat:<15} | {count:<5} | {n_range:<15} | {m_range:<15}")
+        cat_ns = ns[mask]
+        cat_ms = ms[mask]
+        n_range = f"{cat_ns.min()}-{cat_ns.max()}"
+        m_range = f"{cat_ms.min()}-{cat_ms.max()}"
+        print(f"{cat:<15} | {int(mask.sum()):<5} | {n_range:<15} | {m_range:<15}")
 
     # Plotting
     plt.figure(figsize=(10, 6))
@@ -51,12 +49,11 @@ def analyze_distribution():
     colors = {'Official': 'blue', 'Random': 'green', 'Special': 'red'}
     markers = {'Official': 'o', 'Random': 'x', 'Special': 's'}
     
-    for cat, points in categories.items():
-        if not points:
+    for cat, mask in categories.items():
+        if not mask.any():
             continue
-        ns = [p[0] for p in points]
-        ms = [p[1] for p in points]
-        plt.scatter(ns, ms, label=cat, c=colors[cat], marker=markers[cat], alpha=0.7, s=100)
+        plt.scatter(ns[mask], ms[mask], label=cat, c=colors[cat], marker=markers[cat],
+                    alpha=0.7, s=100)
 
     plt.title('Dataset Distribution: Nodes vs Edges')
     plt.xlabel('Number of Nodes (N)')
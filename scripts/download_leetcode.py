@@ -11,12 +11,6 @@ import logging
 import sys
 from pathlib import Path
 
-# src布局路径修正
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-
-# 导入项目模块
-from second_shortest_path.data import DataLoader
-
 # 配置日志
 logging.basicConfig(
     level=logging.INFO,
@@ -25,12 +19,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def download_leetcode_data(problem_id: int, output_dir: str) -> None:
+def download_leetcode_data(problem_id: int, output_dir: str, pretty: bool = False) -> None:
     """下载LeetCode测试数据
     
     Args:
         problem_id: LeetCode题目ID
         output_dir: 输出目录
+        pretty: 是否以缩进格式写出JSON（默认紧凑格式）
     """
     logger.info(f"开始下载LeetCode {problem_id} 题数据")
     
@@ -65,7 +60,10 @@ def download_leetcode_data(problem_id: int, output_dir: str) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(sample_data, f, indent=2, ensure_ascii=False)
+        if pretty:
+            json.dump(sample_data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(sample_data, f, separators=(',', ':'), ensure_ascii=False)
     
     logger.info(f"数据已保存到: {output_path}")
     logger.info(f"共下载 {len(sample_data['test_cases'])} 个测试用例")
@@ -88,11 +86,16 @@ def main():
         default='data/leetcode',
         help='输出目录（默认: data/leetcode）'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='以缩进格式写出JSON（默认紧凑格式）'
+    )
     
     args = parser.parse_args()
     
     try:
-        download_leetcode_data(args.problem_id, args.output)
+        download_leetcode_data(args.problem_id, args.output, args.pretty)
         logger.info("✅ 数据下载完成")
     except Exception as e:
         logger.error(f"❌ 数据下载失败: {e}")
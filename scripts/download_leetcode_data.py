@@ -4,85 +4,185 @@ LeetCode 2045 数据集下载和准备脚本
 包含官方测试用例和生成的补充测试数据
 """
 
+import functools
 import json
 import os
-import random
 from pathlib import Path
 from typing import List, Tuple, Dict
 import networkx as nx
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
+
+
+def _dump_json_bytes(data: Dict, pretty: bool = False) -> bytes:
+    """
+    将数据序列化为 UTF-8 JSON 字节串
+
+    默认输出紧凑格式（数据文件只被程序读取），pretty=True 时使用 2 空格缩进
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+# LeetCode 2045 官方测试用例（常量，模块级只构建一次）
+_OFFICIAL_TEST_CASES = (
+    {
+        "id": 1,
+        "name": "Example 1 - Medium graph",
+        "n": 5,
+        "edges": [[1, 2], [1, 3], [1, 4], [3, 4], [4, 5]],
+        "source": 1,
+        "target": 5,
+        "expected_shortest": 2,  # 路径长度（边数）
+        "expected_second_shortest": 3,  # 第二短路径长度
+        "description": "中等规模图，存在多条路径"
+    },
+    {
+        "id": 2,
+        "name": "Example 2 - Simple path",
+        "n": 2,
+        "edges": [[1, 2]],
+        "source": 1,
+        "target": 2,
+        "expected_shortest": 1,
+        "expected_second_shortest": 3,  # 需要往返
+        "description": "只有一条边的简单路径"
+    },
+    {
+        "id": 3,
+        "name": "Triangle graph",
+        "n": 3,
+        "edges": [[1, 2], [2, 3], [1, 3]],
+        "source": 1,
+        "target": 3,
+        "expected_shortest": 1,
+        "expected_second_shortest": 2,
+        "description": "三角形图，有两条路径"
+    },
+    {
+        "id": 4,
+        "name": "Square graph",
+        "n": 4,
+        "edges": [[1, 2], [2, 3], [3, 4], [4, 1], [1, 3]],
+        "source": 1,
+        "target": 3,
+        "expected_shortest": 1,
+        "expected_second_shortest": 2,
+        "description": "正方形图，有多条路径"
+    },
+    {
+        "id": 5,
+        "name": "Linear chain",
+        "n": 5,
+        "edges": [[1, 2], [2, 3], [3, 4], [4, 5]],
+        "source": 1,
+        "target": 5,
+        "expected_shortest": 4,
+        "expected_second_shortest": 6,
+        "description": "线性链，只能往返"
+    },
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_special_cases() -> Tuple[Dict, ...]:
+    """构建特殊测试用例（结果为常量，只构建一次）"""
+    test_cases = []
+
+    # 完全图
+    n = 6
+    u, v = np.triu_indices(n, k=1)
+    edges = np.stack([u + 1, v + 1], axis=1).tolist()
+    test_cases.append({
+        "id": 200,
+        "name": "Complete graph K6",
+        "n": n,
+        "edges": edges,
+        "source": 1,
+        "target": 6,
+        "expected_shortest": 1,
+        "expected_second_shortest": 2,
+        "description": "完全图"
+    })
+
+    # 星形图
+    n = 10
+    center = 1
+    edges = [[center, i] for i in range(2, n + 1)]
+    test_cases.append({
+        "id": 201,
+        "name": "Star graph",
+        "n": n,
+        "edges": edges,
+        "source": 1,
+        "target": 10,
+        "expected_shortest": 2,
+        "expected_second_shortest": 4,
+        "description": "星形图"
+    })
+
+    # 二分图
+    n = 8
+    left, right = np.meshgrid(np.arange(1, 5), np.arange(5, 9), indexing='ij')
+    edges = np.stack([left.ravel(), right.ravel()], axis=1).tolist()
+    test_cases.append({
+        "id": 202,
+        "name": "Complete bipartite graph K4,4",
+        "n": n,
+        "edges": edges,
+        "source": 1,
+        "target": 8,
+        "expected_shortest": 2,
+        "expected_second_shortest": 4,
+        "description": "完全二分图"
+    })
+
+    # 网格图
+    rows, cols = 4, 4
+    n = rows * cols
+    grid = np.arange(1, n + 1).reshape(rows, cols)
+    horizontal = np.stack([grid[:, :-1].ravel(), grid[:, 1:].ravel()], axis=1)
+    vertical = np.stack([grid[:-1, :].ravel(), grid[1:, :].ravel()], axis=1)
+    edges = np.concatenate([horizontal, vertical], axis=0).tolist()
+
+    test_cases.append({
+        "id": 203,
+        "name": "Grid graph 4x4",
+        "n": n,
+        "edges": edges,
+        "source": 1,
+        "target": n,
+        "expected_shortest": 6,  # Manhattan distance
+        "expected_second_shortest": 8,
+        "description": "网格图"
+    })
+
+    return tuple(test_cases)
 
 
 class LeetCodeDataDownloader:
     """LeetCode 数据下载器"""
     
-    def __init__(self, output_dir: str = "~/Downloads"):
+    def __init__(self, output_dir: str = "~/Downloads", pretty: bool = False):
         self.output_dir = Path(output_dir).expanduser()
+        self.pretty = pretty
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
     def get_official_test_cases(self) -> List[Dict]:
         """
         获取 LeetCode 2045 官方测试用例
         这些是从 LeetCode 题目描述中手动整理的
+
+        返回列表为浅拷贝，其中的用例字典为共享常量，请勿原地修改
         """
-        test_cases = [
-            {
-                "id": 1,
-                "name": "Example 1 - Medium graph",
-                "n": 5,
-                "edges": [[1, 2], [1, 3], [1, 4], [3, 4], [4, 5]],
-                "source": 1,
-                "target": 5,
-                "expected_shortest": 2,  # 路径长度（边数）
-                "expected_second_shortest": 3,  # 第二短路径长度
-                "description": "中等规模图，存在多条路径"
-            },
-            {
-                "id": 2,
-                "name": "Example 2 - Simple path",
-                "n": 2,
-                "edges": [[1, 2]],
-                "source": 1,
-                "target": 2,
-                "expected_shortest": 1,
-                "expected_second_shortest": 3,  # 需要往返
-                "description": "只有一条边的简单路径"
-            },
-            {
-                "id": 3,
-                "name": "Triangle graph",
-                "n": 3,
-                "edges": [[1, 2], [2, 3], [1, 3]],
-                "source": 1,
-                "target": 3,
-                "expected_shortest": 1,
-                "expected_second_shortest": 2,
-                "description": "三角形图，有两条路径"
-            },
-            {
-                "id": 4,
-                "name": "Square graph",
-                "n": 4,
-                "edges": [[1, 2], [2, 3], [3, 4], [4, 1], [1, 3]],
-                "source": 1,
-                "target": 3,
-                "expected_shortest": 1,
-                "expected_second_shortest": 2,
-                "description": "正方形图，有多条路径"
-            },
-            {
-                "id": 5,
-                "name": "Linear chain",
-                "n": 5,
-                "edges": [[1, 2], [2, 3], [3, 4], [4, 5]],
-                "source": 1,
-                "target": 5,
-                "expected_shortest": 4,
-                "expected_second_shortest": 6,
-                "description": "线性链，只能往返"
-            },
-        ]
-        
-        return test_cases
+        return list(_OFFICIAL_TEST_CASES)
     
     def generate_random_graphs(self, num_graphs: int = 20) -> List[Dict]:
         """生成随机图测试用例"""
@@ -97,10 +197,15 @@ class LeetCodeDataDownloader:
         ]
         
         case_id = 100  # 从 100 开始编号
+        rng = np.random.default_rng()
         
         for config in graph_configs:
-            for _ in range(config["count"]):
-                n = random.randint(*config["n_range"])
+            # 每种配置一次性抽取所有节点数与目标节点
+            low, high = config["n_range"]
+            ns = rng.integers(low, high + 1, size=config["count"])
+            targets = rng.integers(2, ns + 1)
+            
+            for n, target in zip(ns.tolist(), targets.tolist()):
                 
                 # 根据密度确定边数
                 if config["density"] == "sparse":
@@ -114,11 +219,9 @@ class LeetCodeDataDownloader:
                 G = self._generate_connected_graph(n, m)
                 
                 # 转换为边列表（1-indexed）
-                edges = [[u + 1, v + 1] for u, v in G.edges()]
+                edges = (np.asarray(list(G.edges()), dtype=np.int32) + 1).tolist()
                 
-                # 随机选择源和目标
                 source = 1
-                target = random.randint(2, n)
                 
                 test_cases.append({
                     "id": case_id,
@@ -138,110 +241,33 @@ class LeetCodeDataDownloader:
     
     def _generate_connected_graph(self, n: int, m: int) -> nx.Graph:
         """生成连通的随机图"""
-        # 先生成一棵生成树保证连通性
+        rng = np.random.default_rng()
+
+        # 先生成一棵生成树保证连通性：第 i 个节点连接到前面的随机节点
+        nodes = rng.permutation(n)
+        parents = (rng.random(n - 1) * np.arange(1, n)).astype(np.int64)
+        child, parent = nodes[1:], nodes[parents]
+        tree_u = np.minimum(child, parent)
+        tree_v = np.maximum(child, parent)
+
         G = nx.Graph()
         G.add_nodes_from(range(n))
-        
-        # 使用随机生成树
-        nodes = list(range(n))
-        random.shuffle(nodes)
-        
-        for i in range(1, n):
-            # 连接到前面的随机节点
-            j = random.randint(0, i - 1)
-            G.add_edge(nodes[i], nodes[j])
-        
-        # 添加额外的边
+        G.add_edges_from(zip(tree_u.tolist(), tree_v.tolist()))
+
+        # 添加额外的边：在上三角的非树边中无放回均匀抽样
         edges_to_add = m - (n - 1)
-        possible_edges = [
-            (i, j) for i in range(n) for j in range(i + 1, n)
-            if not G.has_edge(i, j)
-        ]
-        
-        if edges_to_add > 0 and possible_edges:
-            random.shuffle(possible_edges)
-            for i in range(min(edges_to_add, len(possible_edges))):
-                G.add_edge(*possible_edges[i])
+        iu, ju = np.triu_indices(n, k=1)
+        free = np.flatnonzero(~np.isin(iu * n + ju, tree_u * n + tree_v))
+
+        if edges_to_add > 0 and free.size:
+            picks = rng.choice(free, size=min(edges_to_add, free.size), replace=False)
+            G.add_edges_from(zip(iu[picks].tolist(), ju[picks].tolist()))
         
         return G
     
     def generate_special_cases(self) -> List[Dict]:
-        """生成特殊测试用例"""
-        test_cases = []
-        
-        # 完全图
-        n = 6
-        edges = [[i, j] for i in range(1, n + 1) for j in range(i + 1, n + 1)]
-        test_cases.append({
-            "id": 200,
-            "name": "Complete graph K6",
-            "n": n,
-            "edges": edges,
-            "source": 1,
-            "target": 6,
-            "expected_shortest": 1,
-            "expected_second_shortest": 2,
-            "description": "完全图"
-        })
-        
-        # 星形图
-        n = 10
-        center = 1
-        edges = [[center, i] for i in range(2, n + 1)]
-        test_cases.append({
-            "id": 201,
-            "name": "Star graph",
-            "n": n,
-            "edges": edges,
-            "source": 1,
-            "target": 10,
-            "expected_shortest": 2,
-            "expected_second_shortest": 4,
-            "description": "星形图"
-        })
-        
-        # 二分图
-        n = 8
-        left = range(1, 5)
-        right = range(5, 9)
-        edges = [[i, j] for i in left for j in right]
-        test_cases.append({
-            "id": 202,
-            "name": "Complete bipartite graph K4,4",
-            "n": n,
-            "edges": edges,
-            "source": 1,
-            "target": 8,
-            "expected_shortest": 2,
-            "expected_second_shortest": 4,
-            "description": "完全二分图"
-        })
-        
-        # 网格图
-        rows, cols = 4, 4
-        n = rows * cols
-        edges = []
-        for i in range(rows):
-            for j in range(cols):
-                node = i * cols + j + 1
-                if j < cols - 1:
-                    edges.append([node, node + 1])
-                if i < rows - 1:
-                    edges.append([node, node + cols])
-        
-        test_cases.append({
-            "id": 203,
-            "name": "Grid graph 4x4",
-            "n": n,
-            "edges": edges,
-            "source": 1,
-            "target": n,
-            "expected_shortest": 6,  # Manhattan distance
-            "expected_second_shortest": 8,
-            "description": "网格图"
-        })
-        
-        return test_cases
+        """生成特殊测试用例（浅拷贝，用例字典为共享常量）"""
+        return list(_build_special_cases())
     
     def convert_to_standard_format(self, test_cases: List[Dict]) -> Dict:
         """转换为标准的数据集格式"""
@@ -259,16 +285,22 @@ class LeetCodeDataDownloader:
         return dataset
     
     def save_dataset(self, dataset: Dict, filename: str = "leetcode_second_shortest_path.json"):
-        """保存数据集到文件"""
+        """
+        保存数据集到文件
+
+        Returns:
+            (payload, output_path)：序列化后的字节串与文件路径，
+            payload 可直接复用写入其他位置，避免重复编码
+        """
         output_path = self.output_dir / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(dataset, f, indent=2, ensure_ascii=False)
+        payload = _dump_json_bytes(dataset, pretty=self.pretty)
+        output_path.write_bytes(payload)
         
         print(f"✅ 数据集已保存到: {output_path}")
         print(f"📊 总共 {len(dataset['test_cases'])} 个测试用例")
         
-        return output_path
+        return payload, output_path
     
     def generate_summary(self, dataset: Dict):
         """生成数据集摘要"""
@@ -332,15 +364,14 @@ class LeetCodeDataDownloader:
         
         # 6. 保存数据集
         print("\n💾 保存数据集...")
-        output_path = self.save_dataset(dataset)
+        payload, output_path = self.save_dataset(dataset)
         
         # 7. 生成摘要
         self.generate_summary(dataset)
         
         # 8. 另存一份到当前目录（方便项目使用）
         local_path = Path("leetcode_dataset.json")
-        with open(local_path, 'w', encoding='utf-8') as f:
-            json.dump(dataset, f, indent=2, ensure_ascii=False)
+        local_path.write_bytes(payload)
         print(f"📁 同时保存了一份到当前目录: {local_path}")
         
         return output_path
@@ -359,11 +390,16 @@ def main():
         default="./data/leetcode",
         help="输出目录（默认: ./data/leetcode）"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="以缩进格式写出 JSON（默认紧凑格式）"
+    )
     
     args = parser.parse_args()
     
     # 创建下载器并执行
-    downloader = LeetCodeDataDownloader(output_dir=args.output)
+    downloader = LeetCodeDataDownloader(output_dir=args.output, pretty=args.pretty)
     output_path = downloader.download_all()
     
     print("\n✨ 数据集准备完成！")
@@ -9,6 +9,10 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pandas 在函数内按需导入，此处只用于类型注解
+    import pandas as pd
 
 # src布局路径修正
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -21,12 +25,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def generate_report(results_dir: str, output_file: str) -> None:
+def generate_report(
+    results_dir: str,
+    output_file: str,
+    df: "pd.DataFrame | None" = None
+) -> None:
     """生成实验报告
     
     Args:
         results_dir: 实验结果目录
         output_file: 输出PDF文件路径
+        df: 已加载的基准测试结果（``benchmark_results.csv`` 的内容），
+            调用方已读入时传入以免重复读取；为None时从结果目录读取CSV
     """
     results_path = Path(results_dir)
     output_path = Path(output_file)
@@ -51,12 +61,23 @@ def generate_report(results_dir: str, output_file: str) -> None:
     # 读取结果数据
     import pandas as pd
     
-    results_file = metrics_dir / "benchmark_results.csv"
-    if not results_file.exists():
-        raise FileNotFoundError(f"基准测试结果文件不存在: {results_file}")
-    
-    logger.info(f"📊 加载结果数据: {results_file}")
-    df = pd.read_csv(results_file)
+    if df is None:
+        results_file = metrics_dir / "benchmark_results.csv"
+        if not results_file.exists():
+            raise FileNotFoundError(f"基准测试结果文件不存在: {results_file}")
+        
+        logger.info(f"📊 加载结果数据: {results_file}")
+        df = pd.read_csv(results_file)
+    
+    # 算法名只有少数几种取值，转为分类类型后比较与分组基于整数编码
+    # （assign 返回新表，不修改调用方传入的DataFrame）
+    df = df.assign(algorithm=df['algorithm'].astype('category'))
+    
+    # 各算法的运行时间统计一次聚合完成
+    algos = df['algorithm'].unique().tolist()
+    time_stats = df.groupby('algorithm', sort=False, observed=True)['time'].agg(
+        ['mean', 'median', 'std', 'min', 'max']
+    )
     
     # TODO: 实现PDF报告生成
     # 这里提供一个简单的文本报告作为示例
@@ -70,7 +91,7 @@ def generate_report(results_dir: str, output_file: str) -> None:
         "",
         "## 1. 实验概述",
         "",
-        f"- 测试算法数量: {df['algorithm'].nunique()}",
+        f"- 测试算法数量: {len(algos)}",
         f"- 测试用例数量: {len(df)}",
         f"- 图规模范围: {df['n'].min()} - {df['n'].max()} 节点",
         "",
@@ -78,8 +99,7 @@ def generate_report(results_dir: str, output_file: str) -> None:
         "",
     ]
     
-    for algo in df['algorithm'].unique():
-        report_lines.append(f"- {algo}")
+    report_lines.extend(f"- {algo}" for algo in algos)
     
     report_lines.extend([
         "",
@@ -87,15 +107,15 @@ def generate_report(results_dir: str, output_file: str) -> None:
         "",
     ])
     
-    for algo in df['algorithm'].unique():
-        algo_df = df[df['algorithm'] == algo]
+    for algo in algos:
+        row = time_stats.loc[algo]
         report_lines.extend([
             f"### {algo}",
-            f"- 平均运行时间: {algo_df['time'].mean():.6f}s",
-            f"- 中位数: {algo_df['time'].median():.6f}s",
-            f"- 标准差: {algo_df['time'].std():.6f}s",
-            f"- 最小值: {algo_df['time'].min():.6f}s",
-            f"- 最大值: {algo_df['time'].max():.6f}s",
+            f"- 平均运行时间: {row['mean']:.6f}s",
+            f"- 中位数: {row['median']:.6f}s",
+            f"- 标准差: {row['std']:.6f}s",
+            f"- 最小值: {row['min']:.6f}s",
+            f"- 最大值: {row['max']:.6f}s",
             "",
         ])
     
@@ -116,8 +136,7 @@ def generate_report(results_dir: str, output_file: str) -> None:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     text_output = output_path.with_suffix('.txt')
     
-    with open(text_output, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(report_lines))
+    text_output.write_text('\n'.join(report_lines) + '\n', encoding='utf-8')
     
     logger.info(f"✅ 文本报告已生成: {text_output}")
     
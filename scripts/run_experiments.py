@@ -6,6 +6,7 @@
 """
 
 import argparse
+import csv
 import logging
 import sys
 from pathlib import Path
@@ -17,6 +18,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 from second_shortest_path.algorithms import StateExtendedSPFA, TwoDistanceDijkstra
 from second_shortest_path.data import GraphGenerator
 from second_shortest_path.evaluation import PerformanceMetrics, Visualizer
+from second_shortest_path.utils import adjacency_to_csr
+
+from generate_report import generate_report
 
 # 配置日志
 logging.basicConfig(
@@ -25,6 +29,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# run_single_test 返回的基础字段，算法统计字段在运行时追加
+RESULT_FIELDS = (
+    'algorithm', 'n', 'm', 'source', 'target',
+    'time_ns', 'time', 'shortest', 'second_shortest',
+)
+
+# 输出文件名 -> 日志描述
+PLOT_LABELS = {
+    'runtime_comparison.png': '运行时间对比图',
+    'scalability.png': '可扩展性分析图',
+    'complexity_verification.png': '复杂度验证图',
+    'operations_comparison.png': '操作次数对比图',
+    'percentile_comparison.png': '百分位数对比图',
+    'performance_heatmap.png': '性能热力图',
+}
+
 
 def run_experiments(
     graph_sizes: list[int],
@@ -59,7 +79,7 @@ def run_experiments(
     
     logger.info(f"✅ 生成 {len(test_suite)} 个测试图")
     
-    # 2. 初始化算法（注意：需要为每个测试单独创建实例）
+    # 2. 初始化算法（每个测试图只构建一次按权重排序的CSR数组，各算法实例共享）
     logger.info("🔧 初始化算法")
     algorithm_classes = [TwoDistanceDijkstra, StateExtendedSPFA]
     
@@ -67,23 +87,41 @@ def run_experiments(
     logger.info("🚀 开始基准测试")
     metrics = PerformanceMetrics()
     
-    # 为每个测试用例创建新的算法实例
-    results_list = []
-    for graph_data in test_suite:
-        graph = graph_data['graph']
-        source = graph_data.get('source', 0)
-        target = graph_data.get('target', graph_data['n'] - 1)
-        
-        for AlgoClass in algorithm_classes:
-            algo = AlgoClass(graph)
-            result = metrics.run_single_test(algo, graph, source, target)
-            result['test_name'] = graph_data.get('test_name', 'unknown')
-            result['graph_type'] = graph_data.get('graph_type', 'random')
-            results_list.append(result)
-    
-    # 转换为DataFrame
+    # 每个测试完成后立即写出一行 CSV，结束后再读回用于统计和绘图
+    csv_path = metrics_dir / "benchmark_results.csv"
+    writer = None
+    
+    with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
+        for graph_data in test_suite:
+            graph = graph_data['graph']
+            source = graph_data.get('source', 0)
+            target = graph_data.get('target', graph_data['n'] - 1)
+            test_name = graph_data.get('test_name', 'unknown')
+            graph_type = graph_data.get('graph_type', 'random')
+            
+            # 每个测试图只转换一次内部表示，再由同一份CSR数组构造全部算法实例
+            csr = adjacency_to_csr(graph, sort_by_weight=True)
+            algorithms = [
+                AlgoClass.from_csr(*csr, enable_stats=True) for AlgoClass in algorithm_classes
+            ]
+            
+            if writer is None:
+                # 各算法的统计字段不同，表头取并集，缺失字段留空
+                stat_fields = [key for algo in algorithms for key in algo.get_statistics()]
+                fieldnames = list(dict.fromkeys(
+                    [*RESULT_FIELDS, *stat_fields, 'test_name', 'graph_type']
+                ))
+                writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+                writer.writeheader()
+            
+            for algo in algorithms:
+                result = metrics.run_single_test(algo, graph, source, target)
+                result['test_name'] = test_name
+                result['graph_type'] = graph_type
+                writer.writerow(result)
+    
     import pandas as pd
-    results_df = pd.DataFrame(results_list)
+    results_df = pd.read_csv(csv_path)
     
     logger.info("✅ 基准测试完成")
     
@@ -97,48 +135,19 @@ def run_experiments(
         logger.info(f"  中位数: {algo_stats['time_median']:.6f}s")
         logger.info(f"  P95: {algo_stats['time_p95']:.6f}s")
     
-    # 5. 导出结果
-    logger.info("💾 导出结果数据")
-    metrics.export_results(metrics_dir / "benchmark_results.csv")
+    # 5. 导出结果（已在基准测试过程中逐行写出）
+    logger.info(f"💾 结果数据已导出: {csv_path}")
     
     # 6. 生成可视化
     logger.info("🎨 生成可视化图表")
     
-    Visualizer.plot_runtime_comparison(
-        results_df,
-        viz_dir / "runtime_comparison.png"
-    )
-    logger.info("  ✅ 运行时间对比图")
-    
-    Visualizer.plot_scalability(
-        results_df,
-        viz_dir / "scalability.png"
-    )
-    logger.info("  ✅ 可扩展性分析图")
+    # 各图相互独立且为CPU密集型，由 Visualizer.plot_all 使用进程池并行渲染
+    for plot_path in Visualizer.plot_all(results_df, viz_dir):
+        logger.info(f"  ✅ {PLOT_LABELS[plot_path.name]}")
     
-    Visualizer.plot_complexity_verification(
-        results_df,
-        viz_dir / "complexity_verification.png"
-    )
-    logger.info("  ✅ 复杂度验证图")
-    
-    Visualizer.plot_operations_comparison(
-        results_df,
-        viz_dir / "operations_comparison.png"
-    )
-    logger.info("  ✅ 操作次数对比图")
-    
-    Visualizer.plot_percentile_comparison(
-        results_df,
-        viz_dir / "percentile_comparison.png"
-    )
-    logger.info("  ✅ 百分位数对比图")
-    
-    Visualizer.plot_heatmap(
-        results_df,
-        viz_dir / "performance_heatmap.png"
-    )
-    logger.info("  ✅ 性能热力图")
+    # 7. 生成报告（直接使用内存中的结果，无需再次解析CSV）
+    logger.info("📝 生成实验报告")
+    generate_report(output_path, output_path / "report.pdf", df=results_df)
     
     logger.info("=" * 60)
     logger.info("✅ 实验完成！")
@@ -185,7 +194,7 @@ def main():
         graph_sizes = args.sizes
     
     try:
-        run_experiments(graph_sizes, arg s.density, args.output)
+        run_experiments(graph_sizes, args.density, args.output)
     except Exception as e:
         logger.error(f"❌ 实验运行失败: {e}", exc_info=True)
         sys.exit(1)
@@ -6,14 +6,32 @@
 """
 
 import argparse
+import csv
 import json
 import logging
+import mmap
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from timeit import Timer
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 
+try:
+    import ijson
+except ImportError:  # ijson 为可选依赖，缺失时整体加载
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
+
 # src布局路径修正
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
@@ -27,40 +45,243 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 计时重复次数（取最小值）；超过该节点数的图单次运行已足够稳定，只计时一次
+TIMING_REPEAT = 5
+SINGLE_RUN_MIN_NODES = 1000
 
-def convert_leetcode_case_to_graph(test_case: dict) -> tuple:
+
+def convert_leetcode_case_to_graph(test_case: dict, csr: bool = False) -> tuple:
     """将LeetCode测试用例转换为图表示
     
     Args:
         test_case: LeetCode测试用例
+        csr: 为True时返回CSR数组而非邻接表列表
     
     Returns:
-        (graph, source, target) 三元组
+        默认返回 (graph, source, target) 三元组；
+        ``csr=True`` 时返回 (indptr, indices, source, target)，
+        节点 u 的邻居为 ``indices[indptr[u]:indptr[u + 1]]``（边权重均为1，省略）
     """
     n = test_case['n']
     edges = test_case['edges']
     source = test_case['source']
     target = test_case['target']
     
-    # 构建邻接表（无向图，边权重为1）
-    graph = {i: [] for i in range(n + 1)}  # LeetCode使用1-indexed
+    # 每条无向边展开为 (u, v)、(v, u) 两条弧，按起点稳定排序后即为CSR
+    edges_arr = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    tails = edges_arr.ravel()
+    heads = edges_arr[:, ::-1].ravel()
+    
+    degrees = np.bincount(tails, minlength=n + 1)  # LeetCode使用1-indexed
+    indptr = np.empty(n + 2, dtype=np.int32)
+    indptr[0] = 0
+    np.cumsum(degrees, out=indptr[1:])
+    indices = heads[np.argsort(tails, kind='stable')]
     
-    for u, v in edges:
-        graph[u].append((v, 1))
-        graph[v].append((u, 1))
+    if csr:
+        return indptr, indices, source, target
+    
+    # 由CSR切片构建邻接表列表（无向图，边权重为1；节点编号连续，无需字典）
+    bounds = indptr.tolist()
+    neighbors = indices.tolist()
+    graph = [
+        list(zip(neighbors[bounds[u]:bounds[u + 1]], repeat(1)))
+        for u in range(n + 1)
+    ]
     
     return graph, source, target
 
 
+def time_algorithm(algorithm, source: int, target: int, n: int) -> tuple:
+    """多次运行算法并返回结果与最小耗时
+    
+    小图单次运行耗时接近计时器分辨率，重复 ``TIMING_REPEAT`` 次取最小值以降低噪声；
+    大图（n > ``SINGLE_RUN_MIN_NODES``）只运行一次，避免拉长总实验时间。
+    
+    Args:
+        algorithm: 算法实例（需要有find_second_shortest方法）
+        source: 源节点
+        target: 目标节点
+        n: 图的节点数
+    
+    Returns:
+        ((shortest, second_shortest), 最小耗时秒数) 二元组
+    """
+    start_ns = time.perf_counter_ns()
+    result = algorithm.find_second_shortest(source, target)
+    best_ns = time.perf_counter_ns() - start_ns
+    
+    if n <= SINGLE_RUN_MIN_NODES:
+        timer = Timer(lambda: algorithm.find_second_shortest(source, target),
+                      timer=time.perf_counter_ns)
+        best_ns = min(best_ns, *timer.repeat(repeat=TIMING_REPEAT - 1, number=1))
+    
+    return result, best_ns / 1e9
+
+
+def iter_test_cases(data_file: str) -> Iterator[dict]:
+    """逐个产出数据文件中的测试用例
+    
+    安装了 ijson 时流式解析 ``test_cases`` 数组，内存占用只与单个用例相关；
+    否则将文件内存映射后一次性解析（优先使用 orjson 直接解析字节）。
+    
+    Args:
+        data_file: LeetCode数据文件路径
+    
+    Yields:
+        测试用例字典
+    """
+    if ijson is not None:
+        with open(data_file, 'rb') as f:
+            yield from ijson.items(f, 'test_cases.item')
+        return
+    
+    with open(data_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+        data = orjson.loads(view) if orjson is not None else json.loads(view.tobytes())
+    yield from data['test_cases']
+
+
+def _algorithm_frame(df: pd.DataFrame, prefix: str, label: str, ops_column: str) -> pd.DataFrame:
+    """从宽表中切出单个算法的列并重命名为长表格式
+    
+    Args:
+        df: 每个用例一行的宽表结果
+        prefix: 算法列名前缀（如 ``dijkstra``）
+        label: 长表中 ``algorithm`` 列的取值
+        ops_column: 该算法的队列操作数列名
+    
+    Returns:
+        列名统一后的单算法结果表
+    """
+    columns = {
+        f'{prefix}_time': 'time',
+        f'{prefix}_shortest': 'shortest',
+        f'{prefix}_second': 'second',
+        f'{prefix}_correct': 'correct',
+        ops_column: 'operations',
+        f'{prefix}_push_count': 'push_count',
+        f'{prefix}_pop_count': 'pop_count',
+        f'{prefix}_edge_relax': 'edge_relaxations',
+        f'{prefix}_d1_updates': 'd1_updates',
+        f'{prefix}_d2_updates': 'd2_updates',
+    }
+    frame = df[['case_id', 'name', 'n', 'm', *columns]].rename(columns=columns)
+    frame.insert(4, 'algorithm', label)
+    return frame
+
+
+def bench_case(job: tuple) -> dict:
+    """在单个测试用例上运行两种算法并汇总结果
+    
+    Args:
+        job: (idx, test_case) 二元组，idx 为用例序号（从1开始）
+    
+    Returns:
+        该用例的结果字典（对应 CSV 中的一行）
+    """
+    idx, test_case = job
+    case_id = test_case.get('id', idx)
+    name = test_case.get('name', f'Test {case_id}')
+    n = test_case['n']
+    edges = test_case['edges']
+    expected_shortest = test_case.get('expected_shortest')
+    expected_second = test_case.get('expected_second_shortest')
+    
+    # 转换图
+    graph, source, target = convert_leetcode_case_to_graph(test_case)
+    
+    # 记录用例类型
+    has_expected = expected_shortest is not None and expected_second is not None
+    
+    # 测试 Two-Distance Dijkstra
+    dijkstra = TwoDistanceDijkstra(graph, enable_stats=True)
+    (d_shortest, d_second), d_time = time_algorithm(dijkstra, source, target, n)
+    d_stats = dijkstra.get_statistics()
+    
+    # 测试 State-Extended SPFA
+    spfa = StateExtendedSPFA(graph, enable_stats=True)
+    (s_shortest, s_second), s_time = time_algorithm(spfa, source, target, n)
+    s_stats = spfa.get_statistics()
+    
+    # 验证结果（如果有预期）
+    dijkstra_correct = None
+    spfa_correct = None
+    
+    if has_expected:
+        dijkstra_correct = (d_shortest == expected_shortest and 
+                           d_second == expected_second)
+        spfa_correct = (s_shortest == expected_shortest and 
+                       s_second == expected_second)
+    
+    return {
+        'case_id': case_id,
+        'name': name,
+        'n': n,
+        'm': len(edges),
+        'has_expected': has_expected,
+        'dijkstra_time': d_time,
+        'dijkstra_shortest': d_shortest,
+        'dijkstra_second': d_second,
+        'dijkstra_correct': dijkstra_correct,
+        'dijkstra_pq_ops': d_stats.get('pq_operations', 0),
+        'dijkstra_push_count': d_stats.get('push_count', 0),
+        'dijkstra_pop_count': d_stats.get('pop_count', 0),
+        'dijkstra_edge_relax': d_stats.get('edge_relaxations', 0),
+        'dijkstra_d1_updates': d_stats.get('d1_updates', 0),
+        'dijkstra_d2_updates': d_stats.get('d2_updates', 0),
+        'spfa_time': s_time,
+        'spfa_shortest': s_shortest,
+        'spfa_second': s_second,
+        'spfa_correct': spfa_correct,
+        'spfa_queue_ops': s_stats.get('enqueue_operations', 0),
+        'spfa_push_count': s_stats.get('push_count', 0),
+        'spfa_pop_count': s_stats.get('pop_count', 0),
+        'spfa_edge_relax': s_stats.get('edge_relaxations', 0),
+        'spfa_d1_updates': s_stats.get('d1_updates', 0),
+        'spfa_d2_updates': s_stats.get('d2_updates', 0),
+    }
+
+
+def _log_case_result(idx: int, result: dict) -> None:
+    """输出单个用例的运行结果
+    
+    Args:
+        idx: 用例序号
+        result: bench_case 返回的结果字典
+    """
+    # 日志级别高于INFO时跳过逐用例结果的格式化
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    logger.info("[%d] %s (n=%d, m=%d)", idx, result['name'], result['n'], result['m'])
+    
+    d_status = s_status = ""
+    if result['has_expected']:
+        d_status = "✅ " if result['dijkstra_correct'] else "❌ "
+        s_status = "✅ " if result['spfa_correct'] else "❌ "
+    
+    logger.info("  Dijkstra: %s最短=%s, 次短=%s (耗时: %.2fms)",
+                d_status, result['dijkstra_shortest'], result['dijkstra_second'],
+                result['dijkstra_time'] * 1000)
+    logger.info("  SPFA:     %s最短=%s, 次短=%s (耗时: %.2fms)",
+                s_status, result['spfa_shortest'], result['spfa_second'],
+                result['spfa_time'] * 1000)
+    logger.info("")
+
+
 def run_leetcode_experiments(
     data_file: str,
-    output_dir: str = 'results/leetcode_experiments'
+    output_dir: str = 'results/leetcode_experiments',
+    parallel: bool = False
 ) -> None:
     """在LeetCode数据上运行完整实验
     
     Args:
         data_file: LeetCode数据文件路径
         output_dir: 输出目录
+        parallel: 是否用多进程并行运行各用例（计时不可靠，仅用于吞吐量测试）
     """
     output_path = Path(output_dir)
     metrics_dir = output_path / "metrics"
@@ -73,189 +294,87 @@ def run_leetcode_experiments(
     logger.info("LeetCode 算法性能实验")
     logger.info("=" * 70)
     
-    # 加载数据
-    logger.info(f"📥 加载数据: {data_file}")
-    with open(data_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    test_cases = data['test_cases']
-    total_cases = len(test_cases)
-    
-    logger.info(f"✅ 加载了 {total_cases} 个测试用例\n")
+    logger.info(f"📥 数据文件: {data_file}")
     
     # 初始化统计
     results = []
-    official_cases = []  # 有预期结果的用例
-    generated_cases = []  # 无预期结果的用例
     
     # 运行实验
     logger.info("🚀 开始运行实验...\n")
     
-    for idx, test_case in enumerate(test_cases, 1):
-        case_id = test_case.get('id', idx)
-        name = test_case.get('name', f'Test {case_id}')
-        n = test_case['n']
-        edges = test_case['edges']
-        expected_shortest = test_case.get('expected_shortest')
-        expected_second = test_case.get('expected_second_shortest')
-        
-        logger.info(f"[{idx}/{total_cases}] {name} (n={n}, m={len(edges)})")
-        
-        # 转换图
-        graph, source, target = convert_leetcode_case_to_graph(test_case)
-        
-        # 记录用例类型
-        has_expected = expected_shortest is not None and expected_second is not None
-        
-        # 测试 Two-Distance Dijkstra
-        dijkstra = TwoDistanceDijkstra(graph)
-        start_time = time.perf_counter()
-        d_shortest, d_second = dijkstra.find_second_shortest(source, target)
-        d_time = time.perf_counter() - start_time
-        d_stats = dijkstra.get_statistics()
-        
-        # 测试 State-Extended SPFA
-        spfa = StateExtendedSPFA(graph)
-        start_time = time.perf_counter()
-        s_shortest, s_second = spfa.find_second_shortest(source, target)
-        s_time = time.perf_counter() - start_time
-        s_stats = spfa.get_statistics()
-        
-        # 验证结果（如果有预期）
-        dijkstra_correct = None
-        spfa_correct = None
+    # 逐行写出 CSV 报告，无需在结束时整体序列化
+    csv_path = metrics_dir / "leetcode_results.csv"
+    writer = None
+    
+    with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
+        cases = enumerate(iter_test_cases(data_file), 1)
         
-        if has_expected:
-            dijkstra_correct = (d_shortest == expected_shortest and 
-                               d_second == expected_second)
-            spfa_correct = (s_shortest == expected_shortest and 
-                           s_second == expected_second)
-            
-            d_status = "✅" if dijkstra_correct else "❌"
-            s_status = "✅" if spfa_correct else "❌"
-            
-            logger.info(f"  Dijkstra: {d_status} 最短={d_shortest}, 次短={d_second} "
-                       f"(耗时: {d_time*1000:.2f}ms)")
-            logger.info(f"  SPFA:     {s_status} 最短={s_shortest}, 次短={s_second} "
-                       f"(耗时: {s_time*1000:.2f}ms)")
-            
-            official_cases.append({
-                'case_id': case_id,
-                'name': name,
-                'dijkstra_correct': dijkstra_correct,
-                'spfa_correct': spfa_correct,
-            })
+        if parallel:
+            # 各用例相互独立，按进程并行；计时受资源争用影响，仅用于吞吐量测试
+            executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            case_results = executor.map(bench_case, cases, chunksize=16)
         else:
-            logger.info(f"  Dijkstra: 最短={d_shortest}, 次短={d_second} "
-                       f"(耗时: {d_time*1000:.2f}ms)")
-            logger.info(f"  SPFA:     最短={s_shortest}, 次短={s_second} "
-                       f"(耗时: {s_time*1000:.2f}ms)")
-            
-            generated_cases.append({
-                'case_id': case_id,
-                'name': name,
-            })
+            executor = None
+            case_results = map(bench_case, cases)
         
-        # 记录结果
-        results.append({
-            'case_id': case_id,
-            'name': name,
-            'n': n,
-            'm': len(edges),
-            'has_expected': has_expected,
-            'dijkstra_time': d_time,
-            'dijkstra_shortest': d_shortest,
-            'dijkstra_second': d_second,
-            'dijkstra_correct': dijkstra_correct,
-            'dijkstra_pq_ops': d_stats.get('pq_operations', 0),
-            'dijkstra_push_count': d_stats.get('push_count', 0),
-            'dijkstra_pop_count': d_stats.get('pop_count', 0),
-            'dijkstra_edge_relax': d_stats.get('edge_relaxations', 0),
-            'dijkstra_d1_updates': d_stats.get('d1_updates', 0),
-            'dijkstra_d2_updates': d_stats.get('d2_updates', 0),
-            'spfa_time': s_time,
-            'spfa_shortest': s_shortest,
-            'spfa_second': s_second,
-            'spfa_correct': spfa_correct,
-            'spfa_queue_ops': s_stats.get('enqueue_operations', 0),
-            'spfa_push_count': s_stats.get('push_count', 0),
-            'spfa_pop_count': s_stats.get('pop_count', 0),
-            'spfa_edge_relax': s_stats.get('edge_relaxations', 0),
-            'spfa_d1_updates': s_stats.get('d1_updates', 0),
-            'spfa_d2_updates': s_stats.get('d2_updates', 0),
-        })
-        
-        logger.info("")
+        try:
+            for idx, result in enumerate(case_results, 1):
+                _log_case_result(idx, result)
+                results.append(result)
+                
+                if writer is None:
+                    writer = csv.DictWriter(csv_file, fieldnames=list(result))
+                    writer.writeheader()
+                writer.writerow(result)
+        finally:
+            if executor is not None:
+                executor.shutdown()
     
     # 生成总结
     logger.info("=" * 70)
     logger.info("实验总结")
     logger.info("=" * 70)
     
+    total_cases = len(results)
+    logger.info(f"✅ 共运行 {total_cases} 个测试用例")
+    
     df = pd.DataFrame(results)
     
     # 转换为长格式（长表格式）以兼容可视化函数
-    # 创建两个算法的结果列表
-    viz_results = []
-    
-    for _, row in df.iterrows():
-        # Dijkstra 结果
-        viz_results.append({
-            'case_id': row['case_id'],
-            'name': row['name'],
-            'n': row['n'],
-            'm': row['m'],
-            'algorithm': 'Dijkstra',
-            'time': row['dijkstra_time'],
-            'shortest': row['dijkstra_shortest'],
-            'second': row['dijkstra_second'],
-            'correct': row['dijkstra_correct'],
-            'operations': row['dijkstra_pq_ops'],
-            'push_count': row['dijkstra_push_count'],
-            'pop_count': row['dijkstra_pop_count'],
-            'edge_relaxations': row['dijkstra_edge_relax'],
-            'd1_updates': row['dijkstra_d1_updates'],
-            'd2_updates': row['dijkstra_d2_updates'],
-        })
-        
-        # Queue-Optimized Bellman-Ford 结果
-        viz_results.append({
-            'case_id': row['case_id'],
-            'name': row['name'],
-            'n': row['n'],
-            'm': row['m'],
-            'algorithm': 'Queue-Optimized Bellman-Ford',
-            'time': row['spfa_time'],
-            'shortest': row['spfa_shortest'],
-            'second': row['spfa_second'],
-            'correct': row['spfa_correct'],
-            'operations': row['spfa_queue_ops'],
-            'push_count': row['spfa_push_count'],
-            'pop_count': row['spfa_pop_count'],
-            'edge_relaxations': row['spfa_edge_relax'],
-            'd1_updates': row['spfa_d1_updates'],
-            'd2_updates': row['spfa_d2_updates'],
-        })
-    
-    viz_df = pd.DataFrame(viz_results)
-    
-    # 官方用例统计
-    official_correct = [r for r in results if r['has_expected'] and r['dijkstra_correct']]
-    official_total = len([r for r in results if r['has_expected']])
+    # 按列切片重命名后拼接，避免逐行 iterrows
+    viz_df = pd.concat(
+        [
+            _algorithm_frame(df, 'dijkstra', 'Dijkstra', 'dijkstra_pq_ops'),
+            _algorithm_frame(df, 'spfa', 'Queue-Optimized Bellman-Ford', 'spfa_queue_ops'),
+        ]
+    ).sort_index(kind='stable').reset_index(drop=True)
+    
+    # 官方用例统计（布尔列一次归约）
+    mask = df['has_expected'].astype(bool)
+    official_total = int(mask.sum())
+    d_ok = int((mask & df['dijkstra_correct'].fillna(False).astype(bool)).sum())
+    s_ok = int((mask & df['spfa_correct'].fillna(False).astype(bool)).sum())
     
     logger.info(f"\n📊 官方测试用例:")
     logger.info(f"  总数: {official_total}")
-    logger.info(f"  Dijkstra 通过: {sum(1 for r in results if r['has_expected'] and r['dijkstra_correct'])}/{official_total}")
-    logger.info(f"  SPFA 通过: {sum(1 for r in results if r['has_expected'] and r['spfa_correct'])}/{official_total}")
+    logger.info(f"  Dijkstra 通过: {d_ok}/{official_total}")
+    logger.info(f"  SPFA 通过: {s_ok}/{official_total}")
     
     if official_total > 0:
-        logger.info(f"  Dijkstra 正确率: {sum(1 for r in results if r['has_expected'] and r['dijkstra_correct'])/official_total*100:.1f}%")
-        logger.info(f"  SPFA 正确率: {sum(1 for r in results if r['has_expected'] and r['spfa_correct'])/official_total*100:.1f}%")
+        logger.info(f"  Dijkstra 正确率: {d_ok/official_total*100:.1f}%")
+        logger.info(f"  SPFA 正确率: {s_ok/official_total*100:.1f}%")
+    
+    # 各数值列的均值一次归约得到
+    counters = ('time', 'push_count', 'pop_count', 'edge_relax', 'd1_updates', 'd2_updates')
+    avgs = df[[
+        *(f'dijkstra_{c}' for c in counters), 'dijkstra_pq_ops',
+        *(f'spfa_{c}' for c in counters), 'spfa_queue_ops',
+    ]].mean()
     
     # 性能统计
     logger.info(f"\n⚡ 性能对比:")
-    dijkstra_avg_time = df['dijkstra_time'].mean()
-    spfa_avg_time = df['spfa_time'].mean()
+    dijkstra_avg_time = avgs['dijkstra_time']
+    spfa_avg_time = avgs['spfa_time']
     
     logger.info(f"  Dijkstra 平均耗时: {dijkstra_avg_time*1000:.2f}ms")
     logger.info(f"  SPFA 平均耗时: {spfa_avg_time*1000:.2f}ms")
@@ -266,8 +385,8 @@ def run_leetcode_experiments(
         logger.info(f"  {faster} 快 {abs(speedup - 1)*100:.1f}%")
     
     # 操作统计
-    dijkstra_avg_ops = df['dijkstra_pq_ops'].mean()
-    spfa_avg_ops = df['spfa_queue_ops'].mean()
+    dijkstra_avg_ops = avgs['dijkstra_pq_ops']
+    spfa_avg_ops = avgs['spfa_queue_ops']
     
     logger.info(f"\n📈 操作统计:")
     logger.info(f"  Dijkstra 平均PQ操作数: {dijkstra_avg_ops:.0f}")
@@ -283,32 +402,32 @@ def run_leetcode_experiments(
         'metadata': {
             'total_cases': total_cases,
             'official_cases': official_total,
-            'generated_cases': len(generated_cases),
+            'generated_cases': total_cases - official_total,
         },
         'summary': {
             'dijkstra': {
                 'avg_time': float(dijkstra_avg_time),
-                'correct_count': sum(1 for r in results if r['has_expected'] and r['dijkstra_correct']),
+                'correct_count': d_ok,
                 'total': official_total,
-                'accuracy': sum(1 for r in results if r['has_expected'] and r['dijkstra_correct']) / official_total if official_total > 0 else 0,
+                'accuracy': d_ok / official_total if official_total > 0 else 0,
                 'avg_pq_ops': float(dijkstra_avg_ops),
-                'avg_push_count': float(df['dijkstra_push_count'].mean()),
-                'avg_pop_count': float(df['dijkstra_pop_count'].mean()),
-                'avg_edge_relax': float(df['dijkstra_edge_relax'].mean()),
-                'avg_d1_updates': float(df['dijkstra_d1_updates'].mean()),
-                'avg_d2_updates': float(df['dijkstra_d2_updates'].mean()),
+                'avg_push_count': float(avgs['dijkstra_push_count']),
+                'avg_pop_count': float(avgs['dijkstra_pop_count']),
+                'avg_edge_relax': float(avgs['dijkstra_edge_relax']),
+                'avg_d1_updates': float(avgs['dijkstra_d1_updates']),
+                'avg_d2_updates': float(avgs['dijkstra_d2_updates']),
             },
             'spfa': {
                 'avg_time': float(spfa_avg_time),
-                'correct_count': sum(1 for r in results if r['has_expected'] and r['spfa_correct']),
+                'correct_count': s_ok,
                 'total': official_total,
-                'accuracy': sum(1 for r in results if r['has_expected'] and r['spfa_correct']) / official_total if official_total > 0 else 0,
+                'accuracy': s_ok / official_total if official_total > 0 else 0,
                 'avg_queue_ops': float(spfa_avg_ops),
-                'avg_push_count': float(df['spfa_push_count'].mean()),
-                'avg_pop_count': float(df['spfa_pop_count'].mean()),
-                'avg_edge_relax': float(df['spfa_edge_relax'].mean()),
-                'avg_d1_updates': float(df['spfa_d1_updates'].mean()),
-                'avg_d2_updates': float(df['spfa_d2_updates'].mean()),
+                'avg_push_count': float(avgs['spfa_push_count']),
+                'avg_pop_count': float(avgs['spfa_pop_count']),
+                'avg_edge_relax': float(avgs['spfa_edge_relax']),
+                'avg_d1_updates': float(avgs['spfa_d1_updates']),
+                'avg_d2_updates': float(avgs['spfa_d2_updates']),
             },
         },
         'details': results,
@@ -320,9 +439,6 @@ def run_leetcode_experiments(
     
     logger.info(f"✅ JSON 报告: {report_path}")
     
-    # CSV 报告
-    csv_path = metrics_dir / "leetcode_results.csv"
-    df.to_csv(csv_path, index=False)
     logger.info(f"✅ CSV 报告: {csv_path}")
     
     # 生成可视化
@@ -387,6 +503,11 @@ def main():
         default='results/leetcode_experiments',
         help='输出目录'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='多进程并行运行各用例（计时受争用影响，仅用于吞吐量测试）'
+    )
     
     args = parser.parse_args()
     
@@ -396,7 +517,7 @@ def main():
         sys.exit(1)
     
     try:
-        run_leetcode_experiments(str(data_path), args.output)
+        run_leetcode_experiments(str(data_path), args.output, args.parallel)
     except Exception as e:
         logger.error(f"❌ 实验运行失败: {e}", exc_info=True)
         sys.exit(1)
@@ -1,6 +1,4 @@
 import json
-import matplotlib.pyplot as plt
-import networkx as nx
 import os
 import math
 
@@ -13,6 +11,13 @@ def visualize_samples():
     with open(data_path, 'r') as f:
         data = json.load(f)
     
+    # Heavy plotting imports are deferred until rendering; Agg needs no display
+    import matplotlib
+    if not os.environ.get('DISPLAY'):
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    
     # Select representative cases
     # 1. Official: ID 1 (Medium graph)
     # 2. Random: Pick one with moderate size (e.g., first one with 10 <= n <= 20)
@@ -69,7 +74,9 @@ def visualize_samples():
         elif "Star" in case['name']:
             pos = nx.spring_layout(G, k=0.5, seed=42) # standard
         else:
-            pos = nx.kamada_kawai_layout(G) # usually good for general graphs
+            # Force-directed layout; spring_layout runs vectorized numpy/scipy
+            # updates instead of kamada_kawai's per-node Python optimization
+            pos = nx.spring_layout(G, k=1 / math.sqrt(n), iterations=50, seed=42)
 
         # Draw nodes
         node_colors = []
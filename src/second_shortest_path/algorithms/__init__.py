@@ -1,9 +1,11 @@
 """
 算法实现模块
 
-包含Two-Distance Dijkstra和State-Extended SPFA两种算法的实现。
+包含Two-Distance Dijkstra和State-Extended SPFA两种算法的实现，
+以及单位权图专用的两层BFS。
 """
 
+from second_shortest_path.algorithms.bfs_two_level import find_second_shortest_bfs, is_unit_weight
 from second_shortest_path.algorithms.dijkstra_two_dist import TwoDistanceDijkstra
 from second_shortest_path.algorithms.spfa_extended import StateExtendedSPFA
 # from second_shortest_path.algorithms.second_shortest_path_cpp import StateExtendedSPFA, TwoDistanceDijkstra
@@ -11,5 +13,7 @@ from second_shortest_path.algorithms.spfa_extended import StateExtendedSPFA
 __all__ = [
     "TwoDistanceDijkstra",
     "StateExtendedSPFA",
+    "find_second_shortest_bfs",
+    "is_unit_weight",
 ]
 
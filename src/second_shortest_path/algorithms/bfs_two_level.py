@@ -0,0 +1,85 @@
+"""
+单位权图上的两层BFS算法实现
+
+所有边权均为1时，按层遍历即可保证出队距离单调不减，无需优先队列。
+理论时间复杂度: O(N + M)
+"""
+
+import logging
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 整数"无穷大"距离，与其他算法实现保持一致
+_INF = 1 << 62
+
+
+def is_unit_weight(graph: dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]]) -> bool:
+    """判断图中所有边权是否均为1
+    
+    Args:
+        graph: 图的邻接表表示（字典或以节点编号为下标的列表）
+    
+    Returns:
+        所有边权均为1时返回True（空图也视为单位权图）
+    """
+    adjacency = graph.values() if isinstance(graph, dict) else graph
+    return all(weight == 1 for edges in adjacency for _, weight in edges)
+
+
+def find_second_shortest_bfs(
+    graph: dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]],
+    source: int,
+    target: int
+) -> tuple[Optional[int], Optional[int]]:
+    """在单位权图上查找从源点到目标点的最短和次短路径长度
+    
+    每个节点维护最短距离 d1 和严格更大的次短距离 d2，队列元素为 (节点, 距离)。
+    由于边权均为1，FIFO队列中的距离单调不减，目标的 d2 首次被赋值时即为最终结果。
+    
+    Args:
+        graph: 图的邻接表表示（字典或列表），格式为 {node: [(neighbor, 1), ...]}，节点编号为 0..n-1
+        source: 源节点
+        target: 目标节点
+    
+    Returns:
+        (shortest_distance, second_shortest_distance) 元组
+        如果不存在路径，对应值为 None
+    
+    Raises:
+        ValueError: 如果源点或目标点不在图中
+    """
+    n = len(graph)
+    if not 0 <= source < n:
+        raise ValueError(f"源节点 {source} 不在图中")
+    if not 0 <= target < n:
+        raise ValueError(f"目标节点 {target} 不在图中")
+    
+    d1 = [_INF] * n
+    d2 = [_INF] * n
+    d1[source] = 0
+    queue = deque([(source, 0)])
+    
+    while queue:
+        u, dist = queue.popleft()
+        new_dist = dist + 1
+        
+        for v, _ in graph[u]:
+            if new_dist < d1[v]:
+                d1[v] = new_dist
+                queue.append((v, new_dist))
+            elif d1[v] < new_dist < d2[v]:
+                d2[v] = new_dist
+                if v == target:
+                    # 按层遍历，首次得到的次短距离即为最终结果
+                    queue.clear()
+                    break
+                queue.append((v, new_dist))
+    
+    shortest = d1[target] if d1[target] != _INF else None
+    second_shortest = d2[target] if d2[target] != _INF else None
+    
+    logger.debug(f"BFS搜索完成: 最短={shortest}, 次短={second_shortest}")
+    
+    return shortest, second_shortest
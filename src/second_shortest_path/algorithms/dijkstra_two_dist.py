@@ -5,12 +5,230 @@ Two-Distance Dijkstra算法实现
 理论时间复杂度: O(M log N)
 """
 
+import functools
 import heapq
 import logging
-from typing import Optional
+import types
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from second_shortest_path.utils.graph import adjacency_to_csr, sort_csr_by_weight
+
+# 声明为 Any：numba 缺失时回退为 None，与 numba 的装饰器类型不兼容
+njit: Any
+try:
+    from numba import njit
+except ImportError:  # numba 为可选依赖，缺失时使用纯Python实现
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# 整数"无穷大"距离：整数比较比 float('inf') 更快，且可直接存入 int64 数组；
+# 编译内核的打包堆键 dist * stride 需保持在 int64 范围内
+_INF = 1 << 62
+
+# 内核返回的统计计数器下标
+_PQ_OPS, _PUSH, _POP, _RELAX, _D1_UPD, _D2_UPD, _ITERS = range(7)
+
+
+def _jit(func):
+    """安装了 numba 时以 ``njit(cache=True)`` 编译函数，否则原样返回"""
+    return njit(cache=True)(func) if _NUMBA_KERNELS else func
+
+
+# 模块经 mypyc 编译后函数不再是Python函数对象，numba 无法再编译，此时使用纯Python实现
+_NUMBA_KERNELS = njit is not None and isinstance(_jit, types.FunctionType)
+
+
+@_jit
+def _heap_sift_up(heap, pos, i, stride):
+    """将位置 i 的键上移至满足堆序，并同步状态位置表"""
+    key = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent] <= key:
+            break
+        heap[i] = heap[parent]
+        pos[heap[i] % stride] = i
+        i = parent
+    heap[i] = key
+    pos[key % stride] = i
+
+
+@_jit
+def _heap_push_or_decrease(heap, pos, size, key, stride):
+    """插入状态或降低其键（decrease-key），返回新的堆大小
+    
+    状态编号为 ``key % stride``（即 ``2 * node + is_second``），
+    ``pos[state]`` 为其在堆中的下标，不在堆中时为 -1。
+    """
+    i = pos[key % stride]
+    if i < 0:
+        i = size
+        size += 1
+    heap[i] = key
+    _heap_sift_up(heap, pos, i, stride)
+    return size
+
+
+@_jit
+def _heap_pop(heap, pos, size, stride):
+    """弹出堆顶键，返回 (key, 新的堆大小)"""
+    top = heap[0]
+    pos[top % stride] = -1
+    size -= 1
+    if size == 0:
+        return top, size
+    last = heap[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= last:
+            break
+        heap[i] = heap[child]
+        pos[heap[i] % stride] = i
+        i = child
+    heap[i] = last
+    pos[last % stride] = i
+    return top, size
+
+
+@_jit
+def _dijkstra_two_dist(indptr, indices, weights, source, target, n):
+    """在CSR数组上运行 Two-Distance Dijkstra 主循环
+    
+    堆元素为打包的 int64 键 ``dist * stride + 2 * node + is_second``，
+    其排序与 ``(dist, node, is_second)`` 元组一致。堆按状态索引并支持
+    decrease-key，每个状态在堆中至多一项，因此不存在过时状态的弹出；
+    除弹出次数外，松弛与标签更新的顺序及统计计数与纯Python实现相同。
+    
+    Returns:
+        (shortest, second_shortest, counters)，不可达时距离为 -1
+    """
+    d1 = np.full(n, _INF, np.int64)
+    d2 = np.full(n, _INF, np.int64)
+    heap = np.empty(2 * n, np.int64)
+    pos = np.full(2 * n, -1, np.int64)
+    return _dijkstra_two_dist_into(
+        indptr, indices, weights, source, target, n, d1, d2, heap, pos
+    )
+
+
+@_jit
+def _dijkstra_two_dist_into(indptr, indices, weights, source, target, n, d1, d2, heap, pos):
+    """在调用方提供的缓冲区上运行主循环
+    
+    ``d1``/``d2`` 的前 n 个元素须已填充为 ``_INF``，``pos`` 的前 2n 个元素须为 -1，
+    ``heap`` 容量不小于 2n；缓冲区可以比当前图大，以便批量求解时复用。
+    """
+    stride = 2 * (n + 1)
+    counters = np.zeros(7, np.int64)
+    
+    size = _heap_push_or_decrease(heap, pos, 0, 2 * source, stride)
+    d1[source] = 0
+    counters[_PQ_OPS] += 1
+    counters[_PUSH] += 1
+    
+    while size > 0:
+        counters[_ITERS] += 1
+        key, size = _heap_pop(heap, pos, size, stride)
+        counters[_PQ_OPS] += 1
+        counters[_POP] += 1
+        
+        dist = key // stride
+        u = (key - dist * stride) >> 1
+        
+        # 堆顶距离不小于目标的次短距离时，剩余状态都无法再改进目标
+        if dist >= d2[target]:
+            break
+        
+        for k in range(int(indptr[u]), int(indptr[u + 1])):
+            new_dist = dist + weights[k]
+            # 出边按权重升序：此后的边都无法改进目标
+            if new_dist >= d2[target]:
+                break
+            v = indices[k]
+            counters[_RELAX] += 1
+            
+            # 无分支地合并新距离：d1 取较小者，d2 取严格大于 d1 的次小者
+            # （new_dist 等于 d1 时不构成次短距离）；之后只按前后值是否变化入堆
+            old_d1 = d1[v]
+            old_d2 = d2[v]
+            runner_up = max(old_d1, new_dist) if new_dist != old_d1 else _INF
+            new_d1 = min(old_d1, new_dist)
+            new_d2 = min(old_d2, runner_up)
+            d1[v] = new_d1
+            d2[v] = new_d2
+            
+            if new_d1 < old_d1:
+                counters[_D1_UPD] += 1
+                size = _heap_push_or_decrease(heap, pos, size, new_d1 * stride + 2 * v, stride)
+                counters[_PQ_OPS] += 1
+                counters[_PUSH] += 1
+            
+            if new_d2 < old_d2:
+                counters[_D2_UPD] += 1
+                size = _heap_push_or_decrease(heap, pos, size, new_d2 * stride + 2 * v + 1, stride)
+                counters[_PQ_OPS] += 1
+                counters[_PUSH] += 1
+    
+    shortest = d1[target] if d1[target] != _INF else -1
+    second_shortest = d2[target] if d2[target] != _INF else -1
+    return shortest, second_shortest, counters
+
+
+@functools.cache
+def _warm_up_kernels(weight_dtype: np.dtype) -> None:
+    """以给定权重类型在2节点图上各调用一次编译内核（每个进程、每种类型只执行一次）
+    
+    numba 在首次调用时才编译或从磁盘缓存加载内核，耗时可达数百毫秒；在构造实例时
+    预先触发，使计时区间内的第一次求解不包含这部分开销。
+    """
+    indptr = np.array([0, 1, 2], dtype=np.int32)
+    indices = np.array([1, 0], dtype=np.int32)
+    weights = np.ones(2, dtype=weight_dtype)
+    _dijkstra_two_dist(indptr, indices, weights, 0, 1, 2)
+    _dijkstra_two_dist_into(
+        indptr, indices, weights, 0, 1, 2,
+        np.full(2, _INF, np.int64), np.full(2, _INF, np.int64),
+        np.empty(4, np.int64), np.full(4, -1, np.int64)
+    )
+
+
+def _reset_scratch(
+    scratch: Optional[tuple[np.ndarray, ...]],
+    n: int
+) -> tuple[np.ndarray, ...]:
+    """重置并返回内核缓冲区 (d1, d2, heap, pos)，为None或容量不足时重新分配
+    
+    缓冲区由调用方持有并在连续的查询间传递，只重置前 n（pos 为 2n）个元素。
+    """
+    if scratch is None or scratch[0].shape[0] < n:
+        scratch = (
+            np.empty(n, np.int64), np.empty(n, np.int64),
+            np.empty(2 * n, np.int64), np.empty(2 * n, np.int64),
+        )
+    
+    d1, d2, _, pos = scratch
+    d1[:n].fill(_INF)
+    d2[:n].fill(_INF)
+    pos[:2 * n].fill(-1)
+    return scratch
+
+
+def _offer_candidate(best: list, value) -> None:
+    """用候选路径长度更新 best = [最小值, 严格次小值]"""
+    if value < best[0]:
+        best[1] = best[0]
+        best[0] = value
+    elif best[0] < value < best[1]:
+        best[1] = value
+
 
 class TwoDistanceDijkstra:
     """Two-Distance Dijkstra算法实现
@@ -25,6 +243,7 @@ class TwoDistanceDijkstra:
     
     Args:
         graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}
+        enable_stats: 是否记录统计计数器，默认关闭
     
     Examples:
         >>> graph = {0: [(1, 1), (2, 2)], 1: [(2, 1)], 2: []}
@@ -33,23 +252,106 @@ class TwoDistanceDijkstra:
         >>> print(f"最短路径: {shortest}, 次短路径: {second_shortest}")
     """
     
-    def __init__(self, graph: dict[int, list[tuple[int, int]]]):
+    # 固定实例属性，省去每个实例的 __dict__ 并以槽位偏移访问热循环中的计数器
+    __slots__ = (
+        'graph', 'n',
+        'indptr', 'indices', 'weights', '_indptr', '_indices', '_weights',
+        '_int_weights', '_use_kernel', '_reverse_csr',
+        'enable_stats', '_relax_edge', '_relax_tuple_edge',
+        '_pq_operations', '_push_count', '_pop_count', '_edge_relaxations',
+        '_d1_updates', '_d2_updates', '_iterations',
+    )
+    
+    def __init__(
+        self,
+        graph: Optional[dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]]],
+        enable_stats: bool = False,
+        *,
+        _csr: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    ):
         """初始化算法
         
         Args:
-            graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}
+            graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}；
+                节点编号为 0..n-1 时也可直接传入列表 [[(neighbor, weight), ...], ...]
+            enable_stats: 是否记录统计计数器；关闭时热循环不写计数器，
+                ``get_statistics`` 返回全零
+            _csr: 内部参数，``from_csr`` 传入已按权重排序的CSR数组，此时 graph 为 None
         """
+        # from_csr 构建的实例没有邻接表，此时为 None
         self.graph = graph
-        self.n = len(graph)
+        if _csr is None:
+            if graph is None:
+                raise ValueError("graph 不能为 None；由CSR数组构建请使用 from_csr")
+            # 出边按权重升序，便于松弛时提前截断
+            _csr = adjacency_to_csr(graph, sort_by_weight=True)
+        self._setup(*_csr, enable_stats)
+    
+    @classmethod
+    def from_csr(
+        cls,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        enable_stats: bool = False
+    ) -> "TwoDistanceDijkstra":
+        """由CSR数组直接构建实例，不经过邻接表
+        
+        适用于 ``GraphGenerator.generate_random_graph(..., csr=True)`` 或
+        ``edges_to_csr`` 的输出；各行出边会按权重重新排序（已有序时跳过），
+        输入数组不被修改。实例的 ``graph`` 属性为 None。
+        
+        Args:
+            indptr: 长度为 n+1 的行指针数组
+            indices: 各条有向弧的终点
+            weights: 各条有向弧的权重
+            enable_stats: 是否记录统计计数器，默认关闭
+        
+        Returns:
+            与 ``TwoDistanceDijkstra(graph)`` 行为一致的实例
+        
+        Examples:
+            >>> algo = TwoDistanceDijkstra.from_csr(*edges_to_csr([[0, 1], [1, 2]], 3))
+            >>> algo.find_second_shortest(0, 2)
+            (2, 4)
+        """
+        # 经由 __init__ 构建（而非 cls.__new__），mypyc 编译后同样可用
+        return cls(None, enable_stats, _csr=sort_csr_by_weight(indptr, indices, weights))
+    
+    def _setup(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        enable_stats: bool
+    ) -> None:
+        """由（行内按权重升序的）CSR数组初始化其余状态"""
+        self.n = len(indptr) - 1
+        
+        # CSR数组只构建一次：numpy数组供编译内核使用，列表副本供解释执行的热循环使用
+        # （逐元素访问时Python列表比numpy数组快）
+        self.indptr, self.indices, self.weights = indptr, indices, weights
+        self._indptr = self.indptr.tolist()
+        self._indices = self.indices.tolist()
+        self._weights = self.weights.tolist()
+        self._int_weights = bool(np.issubdtype(self.weights.dtype, np.integer))
+        self._use_kernel = _NUMBA_KERNELS and self._fits_kernel()
+        if self._use_kernel:
+            _warm_up_kernels(self.weights.dtype)
+        # 反向图CSR列表，双向搜索首次使用时构建
+        self._reverse_csr: Optional[tuple[list[int], list[int], list]] = None
+        
+        # 松弛函数在初始化时选定，关闭统计时每条边省去计数器的属性读写
+        self.enable_stats = enable_stats
+        self._relax_edge: Callable[..., None] = (
+            self._relax_edge_stats if enable_stats else self._relax_edge_fast
+        )
+        self._relax_tuple_edge: Callable[..., None] = (
+            self._relax_tuple_edge_stats if enable_stats else self._relax_tuple_edge_fast
+        )
         
         # 统计计数器
-        self._pq_operations = 0  # 优先队列操作次数（push + pop）
-        self._push_count = 0  # Push操作次数
-        self._pop_count = 0  # Pop操作次数
-        self._edge_relaxations = 0  # 边松弛次数
-        self._d1_updates = 0  # d1距离标签更新次数
-        self._d2_updates = 0  # d2距离标签更新次数
-        self._iterations = 0  # 主循环迭代次数
+        self.reset_statistics()
         
         logger.debug(f"初始化 TwoDistanceDijkstra，图规模: {self.n} 节点")
     
@@ -57,7 +359,7 @@ class TwoDistanceDijkstra:
         self, 
         source: int, 
         target: int
-    ) -> tuple[Optional[int], Optional[int]]:
+    ) -> tuple[Optional[float], Optional[float]]:
         """查找从源点到目标点的最短和次短路径长度
         
         Args:
@@ -71,19 +373,217 @@ class TwoDistanceDijkstra:
         Raises:
             ValueError: 如果源点或目标点不在图中
         """
-        if source not in self.graph:
+        self._validate(source, target)
+        
+        if self._use_kernel:
+            return self._find_with_kernel(source, target)
+        
+        if not self._int_weights:
+            return self._find_with_tuples(source, target)
+        
+        # 重置统计计数器
+        self.reset_statistics()
+        
+        # 初始化距离数组
+        d1 = [_INF] * self.n  # 最短距离
+        d2 = [_INF] * self.n  # 次短距离
+        
+        # 优先队列元素为打包整数 dist * stride + 2 * node + is_second，
+        # 排序与 (distance, node, is_second) 元组一致，但无需为每次push分配元组
+        stride = 2 * (self.n + 1)
+        pq = [2 * source]
+        d1[source] = 0
+        
+        stats = self.enable_stats
+        if stats:
+            self._pq_operations += 1  # push
+            self._push_count += 1
+        
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        relax_edge = self._relax_edge
+        
+        logger.debug(f"开始搜索从 {source} 到 {target} 的第二短路径")
+        
+        while pq:
+            dist, state = divmod(heapq.heappop(pq), stride)
+            u, is_second = divmod(state, 2)
+            if stats:
+                self._iterations += 1
+                self._pq_operations += 1  # pop
+                self._pop_count += 1
+            
+            # 堆顶距离不小于目标当前的次短距离时，之后弹出的状态只会更远，
+            # 无法再改进目标的标签，可以提前终止（也覆盖弹出目标次短状态的情形）
+            if dist >= d2[target]:
+                logger.debug(
+                    f"找到目标节点的次短路径，"
+                    f"最短: {d1[target]}, 次短: {d2[target]}"
+                )
+                break
+            
+            # 跳过过时的状态
+            if is_second and dist > d2[u]:
+                continue
+            if not is_second and dist > d1[u]:
+                continue
+            
+            # 松弛所有出边
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, weight in zip(indices[lo:hi], weights[lo:hi]):
+                # 出边按权重升序：此后的边都无法改进目标
+                if dist + weight >= d2[target]:
+                    break
+                relax_edge(u, v, weight, dist, d1, d2, pq, stride)
+        
+        # 返回结果
+        shortest = d1[target] if d1[target] != _INF else None
+        second_shortest = d2[target] if d2[target] != _INF else None
+        
+        logger.info(
+            f"搜索完成: 最短={shortest}, 次短={second_shortest}, "
+            f"迭代次数={self._iterations}"
+        )
+        
+        return shortest, second_shortest
+    
+    def find_second_shortest_batch(
+        self,
+        pairs: list[tuple[int, int]]
+    ) -> list[tuple[Optional[float], Optional[float]]]:
+        """在同一张图上批量求解多组源点、目标点的最短和次短路径长度
+        
+        编译内核可用时，本次调用的各查询复用同一组 d1/d2 与堆缓冲区，
+        每个查询只重置缓冲区，不再逐查询分配数组。统计计数器反映最后一个查询。
+        
+        Args:
+            pairs: (source, target) 二元组列表
+        
+        Returns:
+            与输入顺序一致的 (shortest_distance, second_shortest_distance) 列表
+        
+        Raises:
+            ValueError: 如果某个源点或目标点不在图中（在求解任何查询之前检查）
+        """
+        for source, target in pairs:
+            self._validate(source, target)
+        
+        if not self._use_kernel:
+            return [self.find_second_shortest(source, target) for source, target in pairs]
+        
+        scratch = None
+        results: list[tuple[Optional[float], Optional[float]]] = []
+        for source, target in pairs:
+            scratch = _reset_scratch(scratch, self.n)
+            results.append(self._find_with_kernel(source, target, scratch=scratch))
+        return results
+    
+    @classmethod
+    def run_batch(
+        cls,
+        graphs: list[dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]]],
+        sources: list[int],
+        targets: list[int]
+    ) -> list[tuple[Optional[float], Optional[float]]]:
+        """批量求解多个图的最短和次短路径长度
+        
+        编译内核可用时，本次调用的各用例复用同一组 d1/d2 与堆缓冲区：缓冲区
+        按最大规模增长，每个用例只重置前 n 个元素，避免逐用例分配数组。
+        缓冲区只属于本次调用，调用结束即释放，多线程并发调用互不影响。
+        
+        Args:
+            graphs: 图的邻接表列表
+            sources: 各图的源节点
+            targets: 各图的目标节点
+        
+        Returns:
+            与输入顺序一致的 (shortest_distance, second_shortest_distance) 列表
+        
+        Raises:
+            ValueError: 如果某个源点或目标点不在对应的图中
+        """
+        results: list[tuple[Optional[float], Optional[float]]] = []
+        scratch = None
+        
+        for graph, source, target in zip(graphs, sources, targets):
+            algo = cls(graph)
+            if algo._use_kernel:
+                algo._validate(source, target)
+                scratch = _reset_scratch(scratch, algo.n)
+                results.append(algo._find_with_kernel(source, target, scratch=scratch))
+            else:
+                results.append(algo.find_second_shortest(source, target))
+        
+        return results
+    
+    def _validate(self, source: int, target: int) -> None:
+        """检查源点和目标点是否在图中（节点编号为 0..n-1）"""
+        if not 0 <= source < self.n:
             raise ValueError(f"源节点 {source} 不在图中")
-        if target not in self.graph:
+        if not 0 <= target < self.n:
             raise ValueError(f"目标节点 {target} 不在图中")
+    
+    def _fits_kernel(self) -> bool:
+        """判断编译内核能否精确处理该图（整数权重，且打包键不会溢出int64）"""
+        if not self._int_weights:
+            return False
+        if self.weights.size == 0:
+            return True
+        # 次短路径长度不超过所有边权之和加上一次往返
+        max_dist = int(self.weights.sum()) + 2 * int(self.weights.max())
+        return (max_dist + 1) * 2 * (self.n + 1) < _INF
+    
+    def _find_with_kernel(
+        self,
+        source: int,
+        target: int,
+        scratch: Optional[tuple[np.ndarray, ...]] = None
+    ) -> tuple[Optional[int], Optional[int]]:
+        """通过编译内核求解，并同步统计计数器
+        
+        Args:
+            source: 源节点
+            target: 目标节点
+            scratch: 可复用的 (d1, d2, heap, pos) 缓冲区；为None时由内核自行分配
+        """
+        if scratch is None:
+            shortest, second_shortest, counters = _dijkstra_two_dist(
+                self.indptr, self.indices, self.weights, source, target, self.n
+            )
+        else:
+            shortest, second_shortest, counters = _dijkstra_two_dist_into(
+                self.indptr, self.indices, self.weights, source, target, self.n, *scratch
+            )
+        
+        if self.enable_stats:
+            self._pq_operations = int(counters[_PQ_OPS])
+            self._push_count = int(counters[_PUSH])
+            self._pop_count = int(counters[_POP])
+            self._edge_relaxations = int(counters[_RELAX])
+            self._d1_updates = int(counters[_D1_UPD])
+            self._d2_updates = int(counters[_D2_UPD])
+            self._iterations = int(counters[_ITERS])
+        
+        shortest = int(shortest) if shortest >= 0 else None
+        second_shortest = int(second_shortest) if second_shortest >= 0 else None
+        
+        logger.info(
+            f"搜索完成: 最短={shortest}, 次短={second_shortest}, "
+            f"迭代次数={self._iterations}"
+        )
+        
+        return shortest, second_shortest
+    
+    def _find_with_tuples(
+        self,
+        source: int,
+        target: int
+    ) -> tuple[Optional[float], Optional[float]]:
+        """以 (distance, node, is_second) 元组为堆元素求解
         
+        非整数权重无法精确打包为整数键，此时使用该实现。
+        """
         # 重置统计计数器
-        self._pq_operations = 0
-        self._push_count = 0
-        self._pop_count = 0
-        self._edge_relaxations = 0
-        self._d1_updates = 0
-        self._d2_updates = 0
-        self._iterations = 0
+        self.reset_statistics()
         
         # 初始化距离数组
         INF = float('inf')
@@ -92,21 +592,29 @@ class TwoDistanceDijkstra:
         
         # 优先队列: (distance, node, is_second)
         # is_second: False表示这是最短路径，True表示这是次短路径
-        pq = [(0, source, False)]
+        pq: list[tuple[float, int, bool]] = [(0, source, False)]
         d1[source] = 0
-        self._pq_operations += 1  # push
-        self._push_count += 1
+        
+        stats = self.enable_stats
+        if stats:
+            self._pq_operations += 1  # push
+            self._push_count += 1
+        
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        relax_tuple_edge = self._relax_tuple_edge
         
         logger.debug(f"开始搜索从 {source} 到 {target} 的第二短路径")
         
         while pq:
-            self._iterations += 1
             dist, u, is_second = heapq.heappop(pq)
-            self._pq_operations += 1  # pop
-            self._pop_count += 1
+            if stats:
+                self._iterations += 1
+                self._pq_operations += 1  # pop
+                self._pop_count += 1
             
-            # 如果已经找到目标的次短路径，可以提前终止
-            if u == target and is_second:
+            # 堆顶距离不小于目标当前的次短距离时，之后弹出的状态只会更远，
+            # 无法再改进目标的标签，可以提前终止（也覆盖弹出目标次短状态的情形）
+            if dist >= d2[target]:
                 logger.debug(
                     f"找到目标节点的次短路径，"
                     f"最短: {d1[target]}, 次短: {d2[target]}"
@@ -120,9 +628,12 @@ class TwoDistanceDijkstra:
                 continue
             
             # 松弛所有出边
-            if u in self.graph:
-                for v, weight in self.graph[u]:
-                    self._relax_edge(u, v, weight, dist, d1, d2, pq)
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, weight in zip(indices[lo:hi], weights[lo:hi]):
+                # 出边按权重升序：此后的边都无法改进目标
+                if dist + weight >= d2[target]:
+                    break
+                relax_tuple_edge(u, v, weight, dist, d1, d2, pq)
         
         # 返回结果
         shortest = d1[target] if d1[target] != INF else None
@@ -134,18 +645,191 @@ class TwoDistanceDijkstra:
         )
         
         return shortest, second_shortest
+
+    def find_second_shortest_bidi(
+        self,
+        source: int,
+        target: int
+    ) -> tuple[Optional[float], Optional[float]]:
+        """双向搜索查找从源点到目标点的最短和次短路径长度
+        
+        从源点（正向图）和目标点（反向图）同时运行双标签Dijkstra，每次扩展
+        堆顶距离较小的一侧。节点的每个距离标签出堆（确定）时，与另一侧在该节点
+        及其邻居上已确定的标签拼接，得到候选路径长度，并维护最小的两个不同值。
+        
+        次短路径的任意前缀/后缀长度必为对应节点的 d1 或 d2，因此当两侧堆顶之和
+        不小于当前候选次短值时，最短与次短路径都已被拼接到，可以终止。
+        
+        Args:
+            source: 源节点
+            target: 目标节点
+        
+        Returns:
+            (shortest_distance, second_shortest_distance) 元组
+            如果不存在路径，对应值为 None
+        
+        Raises:
+            ValueError: 如果源点或目标点不在图中
+        """
+        self._validate(source, target)
+        
+        if self._reverse_csr is None:
+            self._reverse_csr = self._build_reverse_csr()
+        
+        # 重置统计计数器
+        self.reset_statistics()
+        
+        # 下标0为正向搜索，下标1为反向搜索
+        INF = float('inf')
+        csr = ((self._indptr, self._indices, self._weights), self._reverse_csr)
+        d1 = ([INF] * self.n, [INF] * self.n)
+        d2 = ([INF] * self.n, [INF] * self.n)
+        settled: tuple[list[list[float]], list[list[float]]] = (
+            [[] for _ in range(self.n)], [[] for _ in range(self.n)]
+        )
+        pqs: tuple[list[tuple[float, int, bool]], list[tuple[float, int, bool]]] = (
+            [(0, source, False)], [(0, target, False)]
+        )
+        d1[0][source] = 0
+        d1[1][target] = 0
+        
+        stats = self.enable_stats
+        if stats:
+            self._pq_operations += 2  # push
+            self._push_count += 2
+        
+        best = [INF, INF]  # 候选路径长度中最小的两个不同值
+        
+        def settle(side: int) -> None:
+            """弹出一侧堆顶并确定其标签，拼接另一侧标签后松弛出边"""
+            pq = pqs[side]
+            dist, u, is_second = heapq.heappop(pq)
+            if stats:
+                self._iterations += 1
+                self._pq_operations += 1  # pop
+                self._pop_count += 1
+            
+            # 跳过过时的状态
+            if dist != (d2 if is_second else d1)[side][u]:
+                return
+            settled[side][u].append(dist)
+            
+            other = settled[1 - side]
+            for rest in other[u]:
+                _offer_candidate(best, dist + rest)
+            
+            indptr, indices, weights = csr[side]
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, weight in zip(indices[lo:hi], weights[lo:hi]):
+                for rest in other[v]:
+                    _offer_candidate(best, dist + weight + rest)
+                self._relax_tuple_edge(u, v, weight, dist, d1[side], d2[side], pq)
+        
+        logger.debug(f"开始双向搜索从 {source} 到 {target} 的第二短路径")
+        
+        # 先确定两侧起点，保证任一侧堆耗尽时另一侧的起点标签已可用于拼接
+        settle(0)
+        settle(1)
+        
+        forward, backward = pqs
+        while forward and backward and forward[0][0] + backward[0][0] < best[1]:
+            settle(0 if forward[0][0] <= backward[0][0] else 1)
+        
+        shortest = best[0] if best[0] != INF else None
+        second_shortest = best[1] if best[1] != INF else None
+        
+        logger.info(
+            f"双向搜索完成: 最短={shortest}, 次短={second_shortest}, "
+            f"迭代次数={self._iterations}"
+        )
+        
+        return shortest, second_shortest
     
-    def _relax_edge(
+    def _build_reverse_csr(self) -> tuple[list[int], list[int], list]:
+        """由正向CSR构建反向图的CSR列表（入边视为出边）"""
+        tails = np.repeat(np.arange(self.n, dtype=self.indices.dtype), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind='stable')
+        
+        indptr = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=self.n), out=indptr[1:])
+        
+        return indptr.tolist(), tails[order].tolist(), self.weights[order].tolist()
+    
+    def _relax_tuple_edge_stats(
         self,
         u: int,
         v: int,
-        weight: int,
+        weight: float,
+        current_dist: float,
+        d1: list[float],
+        d2: list[float],
+        pq: list
+    ) -> None:
+        """执行边松弛操作（元组堆版本，逻辑与 ``_relax_edge_stats`` 相同）"""
+        self._edge_relaxations += 1
+        new_dist = current_dist + weight
+        
+        if new_dist < d1[v]:
+            old_d1 = d1[v]
+            d2[v] = old_d1
+            d1[v] = new_dist
+            self._d1_updates += 1
+            
+            heapq.heappush(pq, (d1[v], v, False))
+            self._pq_operations += 1
+            self._push_count += 1
+            
+            if d2[v] != float('inf'):
+                heapq.heappush(pq, (d2[v], v, True))
+                self._pq_operations += 1
+                self._push_count += 1
+                if old_d1 != float('inf'):
+                    self._d2_updates += 1
+        
+        elif d1[v] < new_dist < d2[v]:
+            d2[v] = new_dist
+            self._d2_updates += 1
+            heapq.heappush(pq, (d2[v], v, True))
+            self._pq_operations += 1
+            self._push_count += 1
+    
+    def _relax_tuple_edge_fast(
+        self,
+        u: int,
+        v: int,
+        weight: float,
         current_dist: float,
         d1: list[float],
         d2: list[float],
         pq: list
     ) -> None:
-        """执行边松弛操作
+        """执行边松弛操作（元组堆版本，不记录统计）"""
+        new_dist = current_dist + weight
+        
+        if new_dist < d1[v]:
+            old_d1 = d1[v]
+            d2[v] = old_d1
+            d1[v] = new_dist
+            heapq.heappush(pq, (new_dist, v, False))
+            if old_d1 != float('inf'):
+                heapq.heappush(pq, (old_d1, v, True))
+        
+        elif d1[v] < new_dist < d2[v]:
+            d2[v] = new_dist
+            heapq.heappush(pq, (new_dist, v, True))
+    
+    def _relax_edge_stats(
+        self,
+        u: int,
+        v: int,
+        weight: int,
+        current_dist: int,
+        d1: list[int],
+        d2: list[int],
+        pq: list,
+        stride: int
+    ) -> None:
+        """执行边松弛操作（记录统计计数器）
         
         尝试通过边(u, v)更新节点v的最短和次短距离。
         
@@ -156,7 +840,8 @@ class TwoDistanceDijkstra:
             current_dist: 当前到达u的距离
             d1: 最短距离数组
             d2: 次短距离数组
-            pq: 优先队列
+            pq: 优先队列（打包整数键）
+            stride: 打包键中距离的步长
         """
         self._edge_relaxations += 1
         new_dist = current_dist + weight
@@ -169,28 +854,69 @@ class TwoDistanceDijkstra:
             d1[v] = new_dist
             self._d1_updates += 1
             
-            heapq.heappush(pq, (d1[v], v, False))
+            heapq.heappush(pq, new_dist * stride + 2 * v)
             self._pq_operations += 1
             self._push_count += 1
             
-            if d2[v] != float('inf'):
-                heapq.heappush(pq, (d2[v], v, True))
+            if d2[v] != _INF:
+                heapq.heappush(pq, old_d1 * stride + 2 * v + 1)
                 self._pq_operations += 1
                 self._push_count += 1
-                if old_d1 != float('inf'):
+                if old_d1 != _INF:
                     self._d2_updates += 1
         
         # 如果找到次短路径
         elif d1[v] < new_dist < d2[v]:
             d2[v] = new_dist
             self._d2_updates += 1
-            heapq.heappush(pq, (d2[v], v, True))
+            heapq.heappush(pq, new_dist * stride + 2 * v + 1)
             self._pq_operations += 1
             self._push_count += 1
     
+    def _relax_edge_fast(
+        self,
+        u: int,
+        v: int,
+        weight: int,
+        current_dist: int,
+        d1: list[int],
+        d2: list[int],
+        pq: list,
+        stride: int
+    ) -> None:
+        """执行边松弛操作（不记录统计，逻辑与 ``_relax_edge_stats`` 相同）"""
+        new_dist = current_dist + weight
+        
+        if new_dist < d1[v]:
+            old_d1 = d1[v]
+            d2[v] = old_d1
+            d1[v] = new_dist
+            heapq.heappush(pq, new_dist * stride + 2 * v)
+            if old_d1 != _INF:
+                heapq.heappush(pq, old_d1 * stride + 2 * v + 1)
+        
+        elif d1[v] < new_dist < d2[v]:
+            d2[v] = new_dist
+            heapq.heappush(pq, new_dist * stride + 2 * v + 1)
+    
+    def reset_statistics(self) -> None:
+        """将全部统计计数器清零
+        
+        每次搜索开始时都会自动调用；复用同一实例时也可手动调用。
+        """
+        self._pq_operations = 0  # 优先队列操作次数（push + pop）
+        self._push_count = 0  # Push操作次数
+        self._pop_count = 0  # Pop操作次数
+        self._edge_relaxations = 0  # 边松弛次数
+        self._d1_updates = 0  # d1距离标签更新次数
+        self._d2_updates = 0  # d2距离标签更新次数
+        self._iterations = 0  # 主循环迭代次数
+    
     def get_statistics(self) -> dict[str, int]:
         """获取算法运行的统计信息
         
+        未开启 ``enable_stats`` 时各计数器均为 0。
+        
         Returns:
             包含统计信息的字典：
             - pq_operations: 优先队列操作次数
@@ -7,16 +7,24 @@ State-Extended SPFA算法实现
 
 import logging
 from collections import deque
-from typing import Optional
+from typing import Callable, Optional
+
+import numpy as np
+
+from second_shortest_path.utils.graph import adjacency_to_csr, sort_csr_by_weight
 
 logger = logging.getLogger(__name__)
 
+# 整数"无穷大"距离：整数比较比 float('inf') 更快
+_INF = 1 << 62
+
 
 class StateExtendedSPFA:
     """State-Extended SPFA算法实现
     
     通过扩展状态空间来维护每个节点的最短和次短距离。
-    使用FIFO队列进行Bellman-Ford式的边松弛操作。
+    使用双端队列进行Bellman-Ford式的边松弛操作，并以 SLF（小标签优先入队首）
+    和 LLL（大于平均值的队首移到队尾）启发式使出队顺序接近按距离递增。
     
     理论复杂度:
     - 平均情况: O(M)
@@ -25,6 +33,7 @@ class StateExtendedSPFA:
     
     Args:
         graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}
+        enable_stats: 是否记录统计计数器，默认关闭
     
     Examples:
         >>> graph = {0: [(1, 1), (2, 2)], 1: [(2, 1)], 2: []}
@@ -33,27 +42,87 @@ class StateExtendedSPFA:
         >>> print(f"最短路径: {shortest}, 次短路径: {second_shortest}")
     """
     
-    def __init__(self, graph: dict[int, list[tuple[int, int]]]):
+    # 固定实例属性，省去每个实例的 __dict__ 并以槽位偏移访问热循环中的计数器
+    __slots__ = (
+        'graph', 'n',
+        'indptr', 'indices', 'weights', '_indptr', '_indices', '_weights',
+        'enable_stats', '_relax_edge',
+        '_enqueue_operations', '_dequeue_operations', '_push_count', '_pop_count',
+        '_edge_relaxations', '_d1_updates', '_d2_updates', '_iterations', '_queued_dist_sum',
+    )
+    
+    def __init__(
+        self,
+        graph: Optional[dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]]],
+        enable_stats: bool = False,
+        *,
+        _csr: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    ):
         """初始化算法
         
         Args:
-            graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}
+            graph: 图的邻接表表示，格式为 {node: [(neighbor, weight), ...]}；
+                节点编号为 0..n-1 时也可直接传入列表 [[(neighbor, weight), ...], ...]
+            enable_stats: 是否记录统计计数器；关闭时热循环不写计数器，
+                ``get_statistics`` 返回全零
+            _csr: 内部参数，``from_csr`` 传入已按权重排序的CSR数组，此时 graph 为 None
         """
+        # from_csr 构建的实例没有邻接表，此时为 None
         self.graph = graph
-        self.n = len(graph)
+        if _csr is None:
+            if graph is None:
+                raise ValueError("graph 不能为 None；由CSR数组构建请使用 from_csr")
+            # 出边按权重升序，便于松弛时提前截断
+            _csr = adjacency_to_csr(graph, sort_by_weight=True)
+        
+        # CSR数组只构建一次；热循环使用其列表副本（逐元素访问比numpy数组快）
+        self.indptr, self.indices, self.weights = _csr
+        self.n = len(self.indptr) - 1
+        self._indptr = self.indptr.tolist()
+        self._indices = self.indices.tolist()
+        self._weights = self.weights.tolist()
+        
+        # 松弛函数在初始化时选定，关闭统计时每条边省去计数器的属性读写
+        self.enable_stats = enable_stats
+        self._relax_edge: Callable[..., None] = (
+            self._relax_edge_stats if enable_stats else self._relax_edge_fast
+        )
         
         # 统计计数器
-        self._enqueue_operations = 0  # 入队次数（向后兼容）
-        self._dequeue_operations = 0  # 出队次数（向后兼容）
-        self._push_count = 0  # Push操作次数（入队）
-        self._pop_count = 0  # Pop操作次数（出队）
-        self._edge_relaxations = 0  # 边松弛次数
-        self._d1_updates = 0  # d1距离标签更新次数
-        self._d2_updates = 0  # d2距离标签更新次数
-        self._iterations = 0  # 主循环迭代次数
+        self.reset_statistics()
+        self._queued_dist_sum = 0  # 队列中各元素入队距离之和（LLL 使用）
         
         logger.debug(f"初始化 StateExtendedSPFA，图规模: {self.n} 节点")
     
+    @classmethod
+    def from_csr(
+        cls,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        weights: np.ndarray,
+        enable_stats: bool = False
+    ) -> "StateExtendedSPFA":
+        """由CSR数组直接构建实例，不经过邻接表
+        
+        与 ``TwoDistanceDijkstra.from_csr`` 相同：各行出边会按权重重新排序
+        （已有序时跳过），输入数组不被修改。实例的 ``graph`` 属性为 None。
+        
+        Args:
+            indptr: 长度为 n+1 的行指针数组
+            indices: 各条有向弧的终点
+            weights: 各条有向弧的权重
+            enable_stats: 是否记录统计计数器，默认关闭
+        
+        Returns:
+            与 ``StateExtendedSPFA(graph)`` 行为一致的实例
+        
+        Examples:
+            >>> algo = StateExtendedSPFA.from_csr(*edges_to_csr([[0, 1], [1, 2]], 3))
+            >>> algo.find_second_shortest(0, 2)
+            (2, 4)
+        """
+        return cls(None, enable_stats, _csr=sort_csr_by_weight(indptr, indices, weights))
+    
     def find_second_shortest(
         self, 
         source: int, 
@@ -72,66 +141,74 @@ class StateExtendedSPFA:
         Raises:
             ValueError: 如果源点或目标点不在图中
         """
-        if source not in self.graph:
+        if not 0 <= source < self.n:
             raise ValueError(f"源节点 {source} 不在图中")
-        if target not in self.graph:
+        if not 0 <= target < self.n:
             raise ValueError(f"目标节点 {target} 不在图中")
         
         # 重置统计计数器
-        self._enqueue_operations = 0
-        self._dequeue_operations = 0
-        self._push_count = 0
-        self._pop_count = 0
-        self._edge_relaxations = 0
-        self._d1_updates = 0
-        self._d2_updates = 0
-        self._iterations = 0
+        self.reset_statistics()
         
         # 初始化距离数组
-        INF = float('inf')
-        d1 = [INF] * self.n  # 最短距离
-        d2 = [INF] * self.n  # 次短距离
+        d1 = [_INF] * self.n  # 最短距离
+        d2 = [_INF] * self.n  # 次短距离
         
-        # FIFO队列: (node, distance, is_second)
+        # 双端队列: (node, distance, is_second)
         # is_second: False表示这是最短路径，True表示这是次短路径
+        # distance 为入队时的标签，仅用于 SLF/LLL 排序启发式
         queue = deque([(source, 0, False)])
         d1[source] = 0
+        self._queued_dist_sum = 0  # 队列中各元素入队距离之和（LLL 使用）
         
-        # 记录节点是否在队列中（避免重复入队）
-        in_queue = [[False, False] for _ in range(self.n)]  # [in_queue_d1, in_queue_d2]
-        in_queue[source][0] = True
+        # 记录状态是否在队列中（避免重复入队）：连续字节数组，
+        # 下标 2*v 对应 d1 状态、2*v+1 对应 d2 状态
+        in_queue = bytearray(2 * self.n)
+        in_queue[2 * source] = 1
         
-        self._enqueue_operations += 1
-        self._push_count += 1
+        stats = self.enable_stats
+        if stats:
+            self._enqueue_operations += 1
+            self._push_count += 1
+        
+        indptr, indices, weights = self._indptr, self._indices, self._weights
+        relax_edge = self._relax_edge
         
         logger.debug(f"开始搜索从 {source} 到 {target} 的第二短路径")
         
         while queue:
-            self._iterations += 1
-            u, dist, is_second = queue.popleft()
-            self._dequeue_operations += 1
-            self._pop_count += 1
+            # LLL: 队首距离大于队列平均值时，将其移到队尾一次
+            if queue[0][1] * len(queue) > self._queued_dist_sum:
+                queue.rotate(-1)
             
-            # 标记节点已出队
-            if is_second:
-                in_queue[u][1] = False
-            else:
-                in_queue[u][0] = False
+            u, queued_dist, is_second = queue.popleft()
+            self._queued_dist_sum -= queued_dist
+            if stats:
+                self._iterations += 1
+                self._dequeue_operations += 1
+                self._pop_count += 1
             
-            # 跳过过时的状态
-            if is_second and dist > d2[u]:
-                continue
-            if not is_second and dist > d1[u]:
+            # 标记状态已出队
+            in_queue[2 * u + is_second] = 0
+            
+            # 状态在队列中时标签可能已被进一步改进（此时不会重复入队），
+            # 因此使用当前标签而非入队时的距离进行扩展
+            dist = d2[u] if is_second else d1[u]
+            
+            # 边权非负，距离不小于目标当前次短距离的状态无法再改进目标，无需扩展
+            if dist >= d2[target]:
                 continue
             
             # 松弛所有出边
-            if u in self.graph:
-                for v, weight in self.graph[u]:
-                    self._relax_edge(u, v, weight, dist, d1, d2, queue, in_queue)
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, weight in zip(indices[lo:hi], weights[lo:hi]):
+                # 出边按权重升序：此后的边都无法改进目标
+                if dist + weight >= d2[target]:
+                    break
+                relax_edge(u, v, weight, dist, d1, d2, queue, in_queue)
         
         # 返回结果
-        shortest = d1[target] if d1[target] != INF else None
-        second_shortest = d2[target] if d2[target] != INF else None
+        shortest = d1[target] if d1[target] != _INF else None
+        second_shortest = d2[target] if d2[target] != _INF else None
         
         logger.info(
             f"搜索完成: 最短={shortest}, 次短={second_shortest}, "
@@ -140,18 +217,18 @@ class StateExtendedSPFA:
         
         return shortest, second_shortest
     
-    def _relax_edge(
+    def _relax_edge_stats(
         self,
         u: int,
         v: int,
         weight: int,
-        current_dist: float,
-        d1: list[float],
-        d2: list[float],
+        current_dist: int,
+        d1: list[int],
+        d2: list[int],
         queue: deque,
-        in_queue: list[list[bool]]
+        in_queue: bytearray
     ) -> None:
-        """执行边松弛操作
+        """执行边松弛操作（记录统计计数器）
         
         尝试通过边(u, v)更新节点v的最短和次短距离。
         
@@ -162,8 +239,8 @@ class StateExtendedSPFA:
             current_dist: 当前到达u的距离
             d1: 最短距离数组
             d2: 次短距离数组
-            queue: FIFO队列
-            in_queue: 记录节点是否在队列中
+            queue: 双端队列
+            in_queue: 记录状态是否在队列中（下标 2*v + is_second）
         """
         self._edge_relaxations += 1
         new_dist = current_dist + weight
@@ -177,18 +254,18 @@ class StateExtendedSPFA:
             self._d1_updates += 1
             
             # 将节点加入队列（如果不在队列中）
-            if not in_queue[v][0]:
-                queue.append((v, d1[v], False))
-                in_queue[v][0] = True
+            if not in_queue[2 * v]:
+                self._enqueue(queue, v, d1[v], False)
+                in_queue[2 * v] = 1
                 self._enqueue_operations += 1
                 self._push_count += 1
             
-            if d2[v] != float('inf') and not in_queue[v][1]:
-                queue.append((v, d2[v], True))
-                in_queue[v][1] = True
+            if d2[v] != _INF and not in_queue[2 * v + 1]:
+                self._enqueue(queue, v, d2[v], True)
+                in_queue[2 * v + 1] = 1
                 self._enqueue_operations += 1
                 self._push_count += 1
-                if old_d1 != float('inf'):
+                if old_d1 != _INF:
                     self._d2_updates += 1
         
         # 如果找到次短路径
@@ -196,15 +273,80 @@ class StateExtendedSPFA:
             d2[v] = new_dist
             self._d2_updates += 1
             
-            if not in_queue[v][1]:
-                queue.append((v, d2[v], True))
-                in_queue[v][1] = True
+            if not in_queue[2 * v + 1]:
+                self._enqueue(queue, v, d2[v], True)
+                in_queue[2 * v + 1] = 1
                 self._enqueue_operations += 1
                 self._push_count += 1
     
+    def _relax_edge_fast(
+        self,
+        u: int,
+        v: int,
+        weight: int,
+        current_dist: int,
+        d1: list[int],
+        d2: list[int],
+        queue: deque,
+        in_queue: bytearray
+    ) -> None:
+        """执行边松弛操作（不记录统计，逻辑与 ``_relax_edge_stats`` 相同）"""
+        new_dist = current_dist + weight
+        
+        if new_dist < d1[v]:
+            old_d1 = d1[v]
+            d2[v] = old_d1
+            d1[v] = new_dist
+            
+            if not in_queue[2 * v]:
+                self._enqueue(queue, v, new_dist, False)
+                in_queue[2 * v] = 1
+            
+            if old_d1 != _INF and not in_queue[2 * v + 1]:
+                self._enqueue(queue, v, old_d1, True)
+                in_queue[2 * v + 1] = 1
+        
+        elif d1[v] < new_dist < d2[v]:
+            d2[v] = new_dist
+            
+            if not in_queue[2 * v + 1]:
+                self._enqueue(queue, v, new_dist, True)
+                in_queue[2 * v + 1] = 1
+    
+    def _enqueue(self, queue: deque, v: int, dist: int, is_second: bool) -> None:
+        """按 SLF 策略入队：距离小于队首时插入队首，否则追加到队尾
+        
+        Args:
+            queue: 双端队列
+            v: 入队节点
+            dist: 入队时的距离标签
+            is_second: 是否为次短距离状态
+        """
+        if queue and dist < queue[0][1]:
+            queue.appendleft((v, dist, is_second))
+        else:
+            queue.append((v, dist, is_second))
+        self._queued_dist_sum += dist
+    
+    def reset_statistics(self) -> None:
+        """将全部统计计数器清零
+        
+        每次搜索开始时都会自动调用；复用同一实例时也可手动调用。
+        """
+        self._enqueue_operations = 0  # 入队次数（向后兼容）
+        self._dequeue_operations = 0  # 出队次数（向后兼容）
+        self._push_count = 0  # Push操作次数（入队）
+        self._pop_count = 0  # Pop操作次数（出队）
+        self._edge_relaxations = 0  # 边松弛次数
+        self._d1_updates = 0  # d1距离标签更新次数
+        self._d2_updates = 0  # d2距离标签更新次数
+        self._iterations = 0  # 主循环迭代次数
+    
     def get_statistics(self) -> dict[str, int]:
         """获取算法运行的统计信息
         
+        未开启 ``enable_stats`` 时各计数器均为 0。
+        
         Returns:
             包含统计信息的字典：
             - enqueue_operations: 入队次数（向后兼容）
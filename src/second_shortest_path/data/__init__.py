@@ -5,10 +5,12 @@
 """
 
 from second_shortest_path.data.generator import GraphGenerator
+from second_shortest_path.data.graph_data import GraphData
 from second_shortest_path.data.loader import DataLoader
 
 __all__ = [
     "DataLoader",
     "GraphGenerator",
+    "GraphData",
 ]
 
@@ -5,13 +5,97 @@
 """
 
 import logging
-import random
 from typing import Any
 
 import networkx as nx
+import numpy as np
+
+from second_shortest_path.data.graph_data import GraphData
+from second_shortest_path.utils.graph import edges_to_csr
+
+# 声明为 Any：numba 缺失时回退为 None，与 numba 的装饰器类型不兼容
+njit: Any
+try:
+    from numba import njit
+except ImportError:  # numba 为可选依赖，缺失时使用numpy批量去重
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# 随机图生成流程的版本号：同一 seed 的生成结果改变时递增，作为磁盘缓存键的一部分
+RANDOM_GRAPH_VERSION = 2
+
+# 候选键数超过该值且安装了 numba 时，改用编译的去重内核
+_JIT_SAMPLE_MIN_EDGES = 10_000
+
+
+def _jit(func):
+    """安装了 numba 时以 ``njit(cache=True)`` 编译函数，否则原样返回"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+def _edge_keys(u: np.ndarray, v: np.ndarray, n: int) -> np.ndarray:
+    """将无向边 (u, v) 规范为 u < v 后编码为 int64 键 u * n + v"""
+    u = u.astype(np.int64)
+    v = v.astype(np.int64)
+    return np.minimum(u, v) * n + np.maximum(u, v)
+
+
+@_jit
+def _first_new_keys_kernel(keys, tree_keys, need):
+    """按顺序取出 keys 中前 need 个互不相同、且不在 tree_keys 中的键
+    
+    已见过的键存放在开放寻址（线性探测）哈希表中，表容量为不小于
+    2 * (候选键数 + 树边数) 的2的幂，空槽为 -1。
+    
+    Returns:
+        至多 need 个键组成的 int64 数组，按在 keys 中首次出现的顺序排列
+    """
+    size = 1
+    while size < 2 * (keys.size + tree_keys.size):
+        size <<= 1
+    mask = size - 1
+    table = np.full(size, -1, np.int64)
+    
+    for key in tree_keys:
+        h = (key * 2654435761) & mask
+        while table[h] != -1:
+            h = (h + 1) & mask
+        table[h] = key
+    
+    out = np.empty(need, np.int64)
+    count = 0
+    for key in keys:
+        if count == need:
+            break
+        
+        h = (key * 2654435761) & mask
+        while table[h] != -1 and table[h] != key:
+            h = (h + 1) & mask
+        if table[h] == key:
+            continue
+        
+        table[h] = key
+        out[count] = key
+        count += 1
+    
+    return out[:count]
+
+
+def _first_new_keys(keys: np.ndarray, tree_keys: np.ndarray, need: int) -> np.ndarray:
+    """按顺序取出 keys 中前 need 个互不相同、且不在 tree_keys 中的键
+    
+    安装了 numba 且候选键较多时使用编译内核，否则以numpy批量去重；
+    两条路径结果完全一致，因此生成的图不取决于是否安装了 numba。
+    """
+    if njit is not None and keys.size > _JIT_SAMPLE_MIN_EDGES:
+        return _first_new_keys_kernel(keys, tree_keys, need)
+    
+    keys = keys[~np.isin(keys, tree_keys)]
+    _, first = np.unique(keys, return_index=True)
+    first.sort()
+    return keys[first[:need]]
+
 
 class GraphGenerator:
     """测试图数据生成器
@@ -29,7 +113,9 @@ class GraphGenerator:
         n: int, 
         m: int, 
         weight_range: tuple[int, int] = (1, 10),
-        seed: int | None = None
+        seed: int | None = None,
+        csr: bool = False,
+        build_adjacency: bool = False
     ) -> dict[str, Any]:
         """生成随机图
         
@@ -38,16 +124,15 @@ class GraphGenerator:
             m: 边数
             weight_range: 边权重范围 (min, max)
             seed: 随机种子（用于可重复性）
+            csr: 是否同时返回CSR数组（'indptr'、'indices'、'weights' 字段）
+            build_adjacency: 是否立即构建邻接表；默认在首次访问 'graph' 字段时构建
         
         Returns:
-            图数据字典，包含节点数、边列表和邻接表
+            图数据字典（``GraphData``），包含节点数、边列表和邻接表
         
         Raises:
             ValueError: 如果边数超过最大可能边数
         """
-        if seed is not None:
-            random.seed(seed)
-        
         max_edges = n * (n - 1) // 2  # 无向图的最大边数
         if m > max_edges:
             raise ValueError(
@@ -56,49 +141,60 @@ class GraphGenerator:
         
         logger.debug(f"生成随机图: {n} 节点, {m} 条边")
         
-        # 使用networkx生成随机连通图
-        # 先生成一棵生成树确保连通性
-        edges_set = set()
+        rng = np.random.default_rng(seed)
         
-        # 生成生成树（确保连通）
-        nodes = list(range(n))
-        random.shuffle(nodes)
-        for i in range(1, n):
-            u = nodes[i]
-            v = random.choice(nodes[:i])
-            if u > v:
-                u, v = v, u
-            edges_set.add((u, v))
+        # 边 (u, v)（u < v）编码为 int64 键 u * n + v，批量去重与求差集均在numpy中完成
+        # 先生成一棵随机生成树确保连通：打乱节点顺序后，每个节点连向排在它之前的随机节点
+        nodes = rng.permutation(n).astype(np.int64)
+        if n > 1:
+            parents = nodes[rng.integers(0, np.arange(1, n))]
+            tree_keys = _edge_keys(nodes[1:], parents, n)
+        else:
+            tree_keys = np.empty(0, np.int64)
         
         # 添加剩余的随机边
-        while len(edges_set) < m:
-            u = random.randint(0, n - 1)
-            v = random.randint(0, n - 1)
-            if u != v:
-                if u > v:
-                    u, v = v, u
-                edges_set.add((u, v))
+        need = m - tree_keys.size
+        if need <= 0:
+            extra_keys = np.empty(0, np.int64)
+        elif 2 * m > max_edges:
+            # 稠密图：拒绝采样命中率低，直接从全部非树边中无放回抽取
+            rows, cols = np.triu_indices(n, k=1)
+            free_keys = np.setdiff1d(_edge_keys(rows, cols, n), tree_keys, assume_unique=True)
+            extra_keys = rng.choice(free_keys, size=need, replace=False)
+        else:
+            # 稀疏图：按批次采样端点对，按抽取顺序保留首次出现且不与树边重复的边，
+            # 不足时继续补采；随机数全部来自 rng，结果只取决于 seed
+            candidates = np.empty(0, np.int64)
+            extra_keys = candidates
+            while extra_keys.size < need:
+                pairs = rng.integers(0, n, size=(int((need - extra_keys.size) * 1.3) + 16, 2))
+                pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+                candidates = np.concatenate([candidates, _edge_keys(pairs[:, 0], pairs[:, 1], n)])
+                extra_keys = _first_new_keys(candidates, tree_keys, need)
+        
+        keys = np.concatenate([tree_keys, extra_keys])
+        us, vs = np.divmod(keys, n)
         
         # 为每条边分配随机权重
-        edges = []
-        for u, v in edges_set:
-            weight = random.randint(weight_range[0], weight_range[1])
-            edges.append([u, v, weight])
-        
-        # 构建邻接表
-        graph = {i: [] for i in range(n)}
-        for u, v, weight in edges:
-            graph[u].append((v, weight))
-            graph[v].append((u, weight))
-        
-        return {
+        weights = rng.integers(weight_range[0], weight_range[1] + 1, size=keys.size)
+        
+        result = GraphData({
             'n': n,
-            'edges': [[u, v] for u, v, _ in edges],
-            'graph': graph,
+            'edges': np.column_stack([us, vs]).tolist(),
             'source': 0,
             'target': n - 1,
             'graph_type': 'random',
-        }
+        }, edge_weights=weights.tolist())
+        
+        if build_adjacency:
+            result['graph']  # 访问即触发构建
+        
+        if csr:
+            result['indptr'], result['indices'], result['weights'] = edges_to_csr(
+                np.column_stack([us, vs]), n, weights
+            )
+        
+        return result
     
     @staticmethod
     def generate_test_suite(
@@ -132,7 +228,7 @@ class GraphGenerator:
         return test_suite
     
     @staticmethod
-    def generate_special_cases() -> list[dict[str, Any]]:
+    def generate_special_cases(csr: bool = False) -> list[dict[str, Any]]:
         """生成特殊测试用例
         
         包括：
@@ -142,109 +238,61 @@ class GraphGenerator:
         - 星型图
         - 网格图
         
+        各图的边列表均由numpy向量化生成，所有边权重为1，邻接表按需构建。
+        
+        Args:
+            csr: 是否同时返回CSR数组（'indptr'、'indices'、'weights' 字段）
+        
         Returns:
             特殊测试图数据列表
         """
+        def special_case(
+            n: int,
+            u: np.ndarray,
+            v: np.ndarray,
+            source: int,
+            graph_type: str,
+            test_name: str
+        ) -> GraphData:
+            edges = np.column_stack([u, v])
+            graph_data = GraphData({
+                'n': n,
+                'edges': edges.tolist(),
+                'source': source,
+                'target': n - 1,
+                'graph_type': graph_type,
+                'test_name': test_name,
+            }, edge_weights=1)
+            if csr:
+                graph_data['indptr'], graph_data['indices'], graph_data['weights'] = (
+                    edges_to_csr(edges, n)
+                )
+            return graph_data
+        
         special_cases = []
         
         # 1. 完全图
         n = 20
-        complete_graph = {i: [] for i in range(n)}
-        edges = []
-        for i in range(n):
-            for j in range(i + 1, n):
-                weight = 1
-                complete_graph[i].append((j, weight))
-                complete_graph[j].append((i, weight))
-                edges.append([i, j])
-        
-        special_cases.append({
-            'n': n,
-            'edges': edges,
-            'graph': complete_graph,
-            'source': 0,
-            'target': n - 1,
-            'graph_type': 'complete',
-            'test_name': f'complete_n{n}',
-        })
+        u, v = np.triu_indices(n, k=1)
+        special_cases.append(special_case(n, u, v, 0, 'complete', f'complete_n{n}'))
         
         # 2. 链式图
         n = 100
-        chain_graph = {i: [] for i in range(n)}
-        edges = []
-        for i in range(n - 1):
-            weight = 1
-            chain_graph[i].append((i + 1, weight))
-            chain_graph[i + 1].append((i, weight))
-            edges.append([i, i + 1])
-        
-        special_cases.append({
-            'n': n,
-            'edges': edges,
-            'graph': chain_graph,
-            'source': 0,
-            'target': n - 1,
-            'graph_type': 'chain',
-            'test_name': f'chain_n{n}',
-        })
+        u = np.arange(n - 1)
+        special_cases.append(special_case(n, u, u + 1, 0, 'chain', f'chain_n{n}'))
         
-        # 3. 星型图
+        # 3. 星型图（中心为节点0）
         n = 50
-        star_graph = {i: [] for i in range(n)}
-        edges = []
-        center = 0
-        for i in range(1, n):
-            weight = 1
-            star_graph[center].append((i, weight))
-            star_graph[i].append((center, weight))
-            edges.append([center, i])
-        
-        special_cases.append({
-            'n': n,
-            'edges': edges,
-            'graph': star_graph,
-            'source': 1,
-            'target': n - 1,
-            'graph_type': 'star',
-            'test_name': f'star_n{n}',
-        })
+        v = np.arange(1, n)
+        special_cases.append(special_case(n, np.zeros_like(v), v, 1, 'star', f'star_n{n}'))
         
-        # 4. 网格图
+        # 4. 网格图：节点 (r, c) 编号为 r * cols + c，先列出全部横向边，再列出纵向边
         rows, cols = 10, 10
         n = rows * cols
-        grid_graph = {i: [] for i in range(n)}
-        edges = []
-        
-        def node_id(r: int, c: int) -> int:
-            return r * cols + c
-        
-        for r in range(rows):
-            for c in range(cols):
-                u = node_id(r, c)
-                # 右边
-                if c + 1 < cols:
-                    v = node_id(r, c + 1)
-                    weight = 1
-                    grid_graph[u].append((v, weight))
-                    grid_graph[v].append((u, weight))
-                    edges.append([u, v])
-                # 下边
-                if r + 1 < rows:
-                    v = node_id(r + 1, c)
-                    weight = 1
-                    grid_graph[u].append((v, weight))
-                    grid_graph[v].append((u, weight))
-                    edges.append([u, v])
-        
-        special_cases.append({
-            'n': n,
-            'edges': edges,
-            'graph': grid_graph,
-            'source': 0,
-            'target': n - 1,
-            'graph_type': 'grid',
-            'test_name': f'grid_{rows}x{cols}',
-        })
+        node_id = np.arange(n).reshape(rows, cols)
+        u = np.concatenate([node_id[:, :-1].ravel(), node_id[:-1, :].ravel()])
+        v = np.concatenate([node_id[:, 1:].ravel(), node_id[1:, :].ravel()])
+        special_cases.append(special_case(n, u, v, 0, 'grid', f'grid_{rows}x{cols}'))
         
         logger.info(f"生成 {len(special_cases)} 个特殊测试用例")
         
@@ -0,0 +1,69 @@
+"""
+图数据容器
+
+加载器与生成器返回的图数据字典，邻接表字段按需构建。
+"""
+
+import logging
+from typing import Any
+
+from second_shortest_path.utils.graph import build_adjacency_list
+
+logger = logging.getLogger(__name__)
+
+
+class GraphData(dict):
+    """图数据字典，'graph' 邻接表字段在首次访问时才构建
+    
+    其余字段（'n'、'edges'、'source'、'target' 等）与普通字典相同。只用到
+    边列表的流程（如 ``DataLoader.save_graph_data``）不会为每条边分配邻接表元组。
+    'graph' 构建后缓存在字典中；构建前 ``keys()``/``items()`` 不包含该字段，
+    但 ``in``、``[]`` 与 ``get`` 的行为与已存在该字段时一致。``copy()`` 返回
+    同样按需构建的 ``GraphData``；``dict(graph_data)`` 等转换为普通字典的操作
+    只包含已构建的字段。
+    
+    Args:
+        data: 图数据字段，至少包含 'n' 和 'edges'
+        edge_weights: 各条边的权重列表，或所有边共用的单个权重
+    
+    Examples:
+        >>> graph_data = GraphData({'n': 3, 'edges': [[0, 1], [1, 2]]}, edge_weights=2)
+        >>> graph_data['graph']
+        {0: [(1, 2)], 1: [(0, 2), (2, 2)], 2: [(1, 2)]}
+    """
+    
+    def __init__(self, data: dict[str, Any], edge_weights: int | list[int] = 1):
+        """初始化图数据字典
+        
+        Args:
+            data: 图数据字段
+            edge_weights: 各条边的权重列表，或所有边共用的单个权重
+        """
+        super().__init__(data)
+        self.edge_weights = edge_weights
+    
+    def __missing__(self, key: str) -> Any:
+        """访问缺失字段时调用：'graph' 按边列表构建并缓存，其余字段抛出 KeyError"""
+        if key != 'graph':
+            raise KeyError(key)
+        
+        weights = self.edge_weights
+        if isinstance(weights, int):
+            weights = [weights] * len(self['edges'])
+        
+        logger.debug(f"按需构建邻接表: {self['n']} 节点, {len(self['edges'])} 条边")
+        graph = build_adjacency_list(self['edges'], self['n'], weights)
+        self['graph'] = graph
+        return graph
+    
+    def __contains__(self, key: object) -> bool:
+        """'graph' 字段始终视为存在"""
+        return key == 'graph' or super().__contains__(key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """与 ``dict.get`` 相同，但会按需构建 'graph' 字段"""
+        return self[key] if key in self else default
+    
+    def copy(self) -> "GraphData":
+        """浅拷贝，返回保留边权重与按需构建 'graph' 字段行为的 ``GraphData``"""
+        return GraphData(self, self.edge_weights)
@@ -7,10 +7,28 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import numpy as np
+
+from second_shortest_path.data.graph_data import GraphData
+from second_shortest_path.utils.graph import edges_to_csr
+
+try:
+    import ijson
+except ImportError:  # ijson 为可选依赖，缺失时整体加载
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 超过该大小（字节）且安装了 ijson 时，流式解析测试用例
+STREAM_MIN_BYTES = 100 * 1024 * 1024
+
 
 class DataLoader:
     """数据加载器，处理LeetCode数据和其他格式
@@ -50,7 +68,8 @@ class DataLoader:
         
         Raises:
             FileNotFoundError: 如果文件不存在
-            json.JSONDecodeError: 如果JSON格式无效
+            ValueError: 如果JSON格式无效（``json.JSONDecodeError`` 与
+                ``orjson.JSONDecodeError`` 均为其子类）
         """
         filepath = Path(filepath)
         
@@ -60,8 +79,10 @@ class DataLoader:
         
         logger.info(f"加载LeetCode数据: {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # 安装了 orjson 时直接解析字节，比标准库快数倍
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         num_cases = len(data.get('test_cases', []))
         logger.info(f"成功加载 {num_cases} 个测试用例")
@@ -69,23 +90,52 @@ class DataLoader:
         return data
     
     @staticmethod
-    def convert_to_graph(test_case: dict[str, Any]) -> dict[str, Any]:
+    def iter_test_cases(filepath: str | Path) -> Iterator[dict[str, Any]]:
+        """逐个产出LeetCode数据文件中的测试用例
+        
+        文件不小于 ``STREAM_MIN_BYTES`` 且安装了 ijson 时流式解析 ``test_cases``
+        数组，内存占用只与单个用例相关；否则通过 ``load_leetcode_data`` 整体加载。
+        
+        Args:
+            filepath: JSON文件路径
+        
+        Yields:
+            测试用例字典
+        
+        Raises:
+            FileNotFoundError: 如果文件不存在
+        """
+        filepath = Path(filepath)
+        
+        if ijson is not None and filepath.exists() and filepath.stat().st_size >= STREAM_MIN_BYTES:
+            logger.info(f"流式加载LeetCode数据: {filepath}")
+            with open(filepath, 'rb') as f:
+                yield from ijson.items(f, 'test_cases.item')
+            return
+        
+        yield from DataLoader.load_leetcode_data(filepath).get('test_cases', [])
+    
+    @staticmethod
+    def convert_to_graph(test_case: dict[str, Any], csr: bool = False) -> dict[str, Any]:
         """将测试用例转换为图数据结构
         
-        将LeetCode格式的测试用例转换为算法可以使用的邻接表格式。
+        将LeetCode格式的测试用例转换为算法可以使用的邻接表格式。邻接表在首次
+        访问 'graph' 字段时才构建，只需要边列表的调用方无需承担其开销。
         
         Args:
             test_case: LeetCode测试用例，包含 'n' 和 'edges' 字段
+            csr: 是否同时返回CSR数组（'indptr'、'indices'、'weights' 字段）
         
         Returns:
-            包含图数据的字典：
+            包含图数据的 ``GraphData`` 字典：
             {
                 'n': 节点数,
                 'edges': 边列表,
-                'graph': 邻接表表示 {node: [(neighbor, weight), ...]},
+                'graph': 邻接表表示 {node: [(neighbor, weight), ...]}（按需构建）,
                 'source': 源节点（默认为0）,
                 'target': 目标节点（默认为n-1）,
-                'expected': 期望结果（如果有）
+                'expected': 期望结果（如果有）,
+                'indptr', 'indices', 'weights': CSR数组（仅 csr=True 时）
             }
         
         Examples:
@@ -98,19 +148,18 @@ class DataLoader:
         edges = test_case['edges']
         weight = test_case.get('time', 1)  # 默认边权重为1
         
-        # 构建邻接表（无向图）
-        graph = {i: [] for i in range(n)}
-        for u, v in edges:
-            graph[u].append((v, weight))
-            graph[v].append((u, weight))
-        
-        result = {
+        # 邻接表（无向图）由 GraphData 在首次访问时构建
+        result = GraphData({
             'n': n,
             'edges': edges,
-            'graph': graph,
             'source': 0,  # 默认源点
             'target': n - 1,  # 默认目标点
-        }
+        }, edge_weights=weight)
+        
+        if csr:
+            result['indptr'], result['indices'], result['weights'] = edges_to_csr(
+                edges, n, [weight] * len(edges)
+            )
         
         # 添加期望结果（如果有）
         if 'expected' in test_case:
@@ -138,8 +187,7 @@ class DataLoader:
         if leetcode_dir.exists():
             for json_file in leetcode_dir.glob("*.json"):
                 try:
-                    data = DataLoader.load_leetcode_data(json_file)
-                    for test_case in data.get('test_cases', []):
+                    for test_case in DataLoader.iter_test_cases(json_file):
                         graph_data = DataLoader.convert_to_graph(test_case)
                         graph_data['source_file'] = str(json_file)
                         datasets.append(graph_data)
@@ -149,7 +197,18 @@ class DataLoader:
         # 加载生成的数据
         generated_dir = data_dir / "generated"
         if generated_dir.exists():
+            for npz_file in generated_dir.glob("*.npz"):
+                try:
+                    graph_data = DataLoader.load_graph_data_npz(npz_file)
+                    graph_data['source_file'] = str(npz_file)
+                    datasets.append(graph_data)
+                except Exception as e:
+                    logger.warning(f"加载文件 {npz_file} 时出错: {e}")
+            
             for json_file in generated_dir.glob("*.json"):
+                # 跳过 .npz 文件的元数据
+                if json_file.name.endswith('.meta.json'):
+                    continue
                 try:
                     with open(json_file, 'r', encoding='utf-8') as f:
                         graph_data = json.load(f)
@@ -188,4 +247,94 @@ class DataLoader:
             json.dump(serializable_data, f, indent=2, ensure_ascii=False)
         
         logger.info(f"图数据已保存到: {filepath}")
-
+    
+    @staticmethod
+    def save_graph_data_npz(graph_data: dict[str, Any], filepath: str | Path) -> None:
+        """以二进制格式保存图数据
+        
+        边列表（及 ``GraphData`` 的边权重）以 ``np.savez_compressed`` 写入 .npz 文件，
+        'n'、'source'、'target'、'expected' 等元数据写入同名的 .meta.json 文件。
+        文件比 ``save_graph_data`` 的JSON小且读写更快。
+        
+        边权重按原有类型保存（整数或浮点数），加载后与保存前一致。
+        
+        Args:
+            graph_data: 图数据字典
+            filepath: 输出 .npz 文件路径
+        
+        Raises:
+            ValueError: 如果边权重不是数值；或 graph_data 为普通字典、没有边权重，
+                但其 'graph' 邻接表含有不为1的权重（保存后将无法恢复）
+        """
+        filepath = Path(filepath)
+        
+        edges = np.asarray(graph_data['edges'], dtype=np.int32).reshape(-1, 2)
+        arrays = {'edges': edges}
+        
+        # 只有 GraphData 记录了边权重，普通字典按默认权重1加载
+        edge_weights = getattr(graph_data, 'edge_weights', None)
+        if edge_weights is not None:
+            weights = np.asarray(edge_weights)
+            if not np.issubdtype(weights.dtype, np.number):
+                raise ValueError(f"边权重必须为数值，实际类型为 {weights.dtype}")
+            arrays['weights'] = np.broadcast_to(weights, len(edges))
+        elif 'graph' in graph_data.keys():
+            graph = graph_data['graph']
+            arcs = graph.values() if isinstance(graph, dict) else graph
+            if any(w != 1 for neighbors in arcs for _, w in neighbors):
+                raise ValueError(
+                    "普通字典没有 edge_weights，但 'graph' 含有不为1的边权重；"
+                    "请改用 GraphData 保存以保留权重"
+                )
+        
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        
+        metadata = {
+            'n': graph_data['n'],
+            'source': graph_data.get('source', 0),
+            'target': graph_data.get('target', graph_data['n'] - 1),
+        }
+        
+        if 'expected' in graph_data:
+            metadata['expected'] = graph_data['expected']
+        
+        with open(filepath, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        with open(filepath.with_suffix('.meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False)
+        
+        logger.info(f"图数据已保存到: {filepath}")
+    
+    @staticmethod
+    def load_graph_data_npz(filepath: str | Path) -> GraphData:
+        """加载 ``save_graph_data_npz`` 保存的图数据
+        
+        Args:
+            filepath: .npz 文件路径
+        
+        Returns:
+            包含元数据与 'edges' 字段的 ``GraphData`` 字典，邻接表按需构建
+        
+        Raises:
+            FileNotFoundError: 如果 .npz 文件或其元数据文件不存在
+        """
+        filepath = Path(filepath)
+        meta_path = filepath.with_suffix('.meta.json')
+        
+        for path in (filepath, meta_path):
+            if not path.exists():
+                logger.error(f"数据文件不存在: {path}")
+                raise FileNotFoundError(f"数据文件不存在: {path}")
+        
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        
+        with np.load(filepath) as arrays:
+            edges = arrays['edges'].tolist()
+            weights = arrays['weights'].tolist() if 'weights' in arrays else 1
+        
+        metadata['edges'] = edges
+        
+        logger.debug(f"加载图: {metadata['n']} 节点, {len(edges)} 条边")
+        
+        return GraphData(metadata, edge_weights=weights)
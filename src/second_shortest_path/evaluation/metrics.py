@@ -4,8 +4,12 @@
 提供算法性能测试、统计分析和复杂度验证功能。
 """
 
+import functools
 import logging
+import os
+import pickle
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -13,8 +17,81 @@ import numpy as np
 import pandas as pd
 from tqdm import tqdm
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow 为可选依赖，缺失时使用 pandas 写出
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+# run_benchmark 中预分配为定型numpy数组的列；其余列（结果、统计计数器等）
+# 以对象数组收集，构建DataFrame时再推断类型
+_TYPED_COLUMNS = {
+    'n': np.int64,
+    'm': np.int64,
+    'source': np.int64,
+    'target': np.int64,
+    'time_ns': np.int64,
+    'time': np.float64,
+}
+
+# 经验复杂度分析生成的随机图的磁盘缓存目录
+GRAPH_CACHE_DIR = Path.home() / ".cache" / "sspac"
+
+
+def _linear_fit(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    """一元线性最小二乘拟合 y = slope * x + intercept
+    
+    Returns:
+        (slope, intercept, r_squared)；y 为常数时 r_squared 为 0
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    design = np.column_stack([x, np.ones_like(x)])
+    (slope, intercept), *_ = np.linalg.lstsq(design, y, rcond=None)
+    
+    ss_res = float(((y - design @ (slope, intercept)) ** 2).sum())
+    ss_tot = float(((y - y.mean()) ** 2).sum())
+    r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
+    return float(slope), float(intercept), r_squared
+
+
+@functools.lru_cache(maxsize=32)
+def _random_graph_bytes(n: int, m: int, seed: int, cache_dir: Path | None) -> bytes:
+    """按 (n, m, seed) 生成随机图，返回其pickle序列化结果并缓存在内存与磁盘中
+    
+    内存中最多保留最近使用的32份；cache_dir 不为None时另以pickle持久化，
+    重新运行时无需再次生成。磁盘文件名包含生成器版本号，生成流程改变后
+    不会读到旧版本的图。
+    """
+    from second_shortest_path.data.generator import RANDOM_GRAPH_VERSION, GraphGenerator
+    
+    cache_file = (
+        cache_dir / f"random_v{RANDOM_GRAPH_VERSION}_n{n}_m{m}_seed{seed}.pkl"
+        if cache_dir else None
+    )
+    if cache_file is not None and cache_file.exists():
+        return cache_file.read_bytes()
+    
+    graph_data = GraphGenerator.generate_random_graph(n, m, seed=seed)
+    blob = pickle.dumps(graph_data, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    if cache_file is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(blob)
+    
+    return blob
+
+
+def _cached_random_graph(n: int, m: int, seed: int, cache_dir: Path | None) -> dict[str, Any]:
+    """按 (n, m, seed) 取得缓存的随机图
+    
+    每次调用都反序列化出独立的图数据，调用方修改（包括惰性构建邻接表）
+    不会影响缓存内容。
+    """
+    return pickle.loads(_random_graph_bytes(n, m, seed, cache_dir))
+
 
 class PerformanceMetrics:
     """性能指标计算与统计
@@ -35,7 +112,7 @@ class PerformanceMetrics:
     def run_single_test(
         self,
         algorithm: Any,
-        graph: dict[int, list[tuple[int, int]]],
+        graph: dict[int, list[tuple[int, int]]] | None,
         source: int,
         target: int
     ) -> dict[str, Any]:
@@ -43,7 +120,7 @@ class PerformanceMetrics:
         
         Args:
             algorithm: 算法实例（需要有find_second_shortest和get_statistics方法）
-            graph: 图的邻接表表示
+            graph: 图的邻接表表示；算法实例带有CSR数组（``indptr``）时可为None
             source: 源节点
             target: 目标节点
         
@@ -53,23 +130,32 @@ class PerformanceMetrics:
                 'algorithm': 算法名称,
                 'n': 节点数,
                 'm': 边数,
-                'time': 运行时间(秒),
+                'time_ns': 运行时间(纳秒，整数),
+                'time': 运行时间(秒，由 time_ns 换算),
                 'result': (shortest, second_shortest),
                 'statistics': 算法统计信息,
             }
         """
         algo_name = algorithm.__class__.__name__
-        n = len(graph)
-        m = sum(len(neighbors) for neighbors in graph.values()) // 2
+        # 图或算法实例带有CSR数组时直接由 indptr 得到节点数与有向弧数（O(1)），
+        # 否则回退为遍历邻接表（字典或列表）
+        indptr = getattr(graph, 'indptr', None)
+        if indptr is None:
+            indptr = getattr(algorithm, 'indptr', None)
+        if indptr is not None:
+            n = len(indptr) - 1
+            m = int(indptr[-1]) // 2
+        else:
+            n = len(graph)
+            neighbor_lists = graph.values() if isinstance(graph, dict) else graph
+            m = sum(map(len, neighbor_lists)) // 2
         
         logger.debug(f"运行测试: {algo_name}, n={n}, m={m}")
         
-        # 测量运行时间
-        start_time = time.perf_counter()
+        # 以整数纳秒计时并相减，避免浮点秒在亚微秒级运行时间上丢失精度
+        start_ns = time.perf_counter_ns()
         result = algorithm.find_second_shortest(source, target)
-        end_time = time.perf_counter()
-        
-        elapsed_time = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # 获取算法统计信息
         stats = algorithm.get_statistics()
@@ -80,7 +166,8 @@ class PerformanceMetrics:
             'm': m,
             'source': source,
             'target': target,
-            'time': elapsed_time,
+            'time_ns': elapsed_ns,
+            'time': elapsed_ns * 1e-9,
             'shortest': result[0],
             'second_shortest': result[1],
             **stats,
@@ -94,7 +181,8 @@ class PerformanceMetrics:
         self,
         algorithms: list[Any],
         test_suite: list[dict[str, Any]],
-        show_progress: bool = True
+        show_progress: bool = True,
+        parallel: bool = False
     ) -> pd.DataFrame:
         """运行完整基准测试
         
@@ -102,6 +190,8 @@ class PerformanceMetrics:
             algorithms: 算法实例列表
             test_suite: 测试图数据列表
             show_progress: 是否显示进度条
+            parallel: 是否将各 (测试图, 算法) 组合分发到进程池（每个CPU一个进程）；
+                计时受资源争用影响，结果顺序与串行运行一致
         
         Returns:
             包含所有测试结果的DataFrame
@@ -114,18 +204,46 @@ class PerformanceMetrics:
         self.results = []
         total_tests = len(algorithms) * len(test_suite)
         
+        # 按列预分配结果数组，逐行按下标写入；失败的测试不占行，最后截断到实际行数
+        columns: dict[str, np.ndarray] = {'algorithm': np.empty(total_tests, dtype=object)}
+        for name, dtype in _TYPED_COLUMNS.items():
+            columns[name] = np.empty(total_tests, dtype=dtype)
+        row = 0
+        
         if show_progress:
             pbar = tqdm(total=total_tests, desc="运行基准测试")
         
-        for graph_data in test_suite:
-            graph = graph_data['graph']
-            source = graph_data.get('source', 0)
-            target = graph_data.get('target', graph_data['n'] - 1)
-            test_name = graph_data.get('test_name', 'unknown')
-            
-            for algorithm in algorithms:
-                try:
-                    result = self.run_single_test(algorithm, graph, source, target)
+        cases = [(graph_data, algorithm) for graph_data in test_suite for algorithm in algorithms]
+        # 算法实例已持有CSR数组时 run_single_test 由其 indptr 得到 n、m，不必为此
+        # 构建（GraphData 的邻接表按需构建）或向工作进程传输测试图的邻接表
+        jobs = [
+            (
+                algorithm,
+                None if hasattr(algorithm, 'indptr') else graph_data['graph'],
+                graph_data.get('source', 0),
+                graph_data.get('target', graph_data['n'] - 1),
+            )
+            for graph_data, algorithm in cases
+        ]
+        
+        # 各测试相互独立：并行时在工作进程中运行，结果按提交顺序取回
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count()) if parallel else None
+        if executor is not None:
+            outcomes = executor.map(_run_benchmark_job, jobs, chunksize=4)
+        else:
+            outcomes = map(_run_benchmark_job, jobs)
+        
+        try:
+            for (graph_data, algorithm), (result, error) in zip(cases, outcomes):
+                test_name = graph_data.get('test_name', 'unknown')
+                
+                if error is not None:
+                    logger.error(
+                        f"测试失败: {algorithm.__class__.__name__}, "
+                        f"{test_name}, 错误: {error}"
+                    )
+                else:
+                    self.results.append(result)
                     result['test_name'] = test_name
                     result['graph_type'] = graph_data.get('graph_type', 'unknown')
                     
@@ -140,20 +258,26 @@ class PerformanceMetrics:
                                 f"期望={expected}, 实际={actual}"
                             )
                     
-                except Exception as e:
-                    logger.error(
-                        f"测试失败: {algorithm.__class__.__name__}, "
-                        f"{test_name}, 错误: {e}"
-                    )
+                    for key, value in result.items():
+                        if key not in columns:
+                            columns[key] = np.full(total_tests, np.nan, dtype=object)
+                        columns[key][row] = value
+                    row += 1
                 
                 if show_progress:
                     pbar.update(1)
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         if show_progress:
             pbar.close()
         
-        df = pd.DataFrame(self.results)
-        logger.info(f"基准测试完成，共 {len(self.results)} 个结果")
+        df = pd.DataFrame({
+            key: values[:row] if key in _TYPED_COLUMNS else pd.Series(values[:row].tolist())
+            for key, values in columns.items()
+        })
+        logger.info(f"基准测试完成，共 {row} 个结果")
         
         return df
     
@@ -171,30 +295,30 @@ class PerformanceMetrics:
             - p99: 99百分位数
             - std: 标准差
         """
-        stats = {}
+        grouped = df.groupby('algorithm', sort=False)
         
-        for algo in df['algorithm'].unique():
-            algo_df = df[df['algorithm'] == algo]
-            
-            stats[algo] = {
-                'time_mean': algo_df['time'].mean(),
-                'time_median': algo_df['time'].median(),
-                'time_p95': algo_df['time'].quantile(0.95),
-                'time_p99': algo_df['time'].quantile(0.99),
-                'time_std': algo_df['time'].std(),
-            }
-            
-            # 如果有操作次数统计
-            if 'pq_operations' in algo_df.columns:
-                stats[algo]['pq_operations_mean'] = algo_df['pq_operations'].mean()
-            if 'enqueue_operations' in algo_df.columns:
-                stats[algo]['queue_operations_mean'] = (
-                    algo_df['enqueue_operations'].mean()
-                )
-            if 'edge_relaxations' in algo_df.columns:
-                stats[algo]['edge_relaxations_mean'] = (
-                    algo_df['edge_relaxations'].mean()
-                )
+        # 一次分组完成全部聚合；分位数用分组 quantile 计算，避免逐组调用 Python 函数
+        aggregations = {
+            'time_mean': ('time', 'mean'),
+            'time_median': ('time', 'median'),
+            'time_std': ('time', 'std'),
+        }
+        # 如果有操作次数统计
+        for column, name in (
+            ('pq_operations', 'pq_operations_mean'),
+            ('enqueue_operations', 'queue_operations_mean'),
+            ('edge_relaxations', 'edge_relaxations_mean'),
+        ):
+            if column in df.columns:
+                aggregations[name] = (column, 'mean')
+        
+        table = grouped.agg(**aggregations)
+        table['time_p95'] = grouped['time'].quantile(0.95)
+        table['time_p99'] = grouped['time'].quantile(0.99)
+        
+        order = ['time_mean', 'time_median', 'time_p95', 'time_p99', 'time_std']
+        order += [name for name in aggregations if name not in order]
+        stats = table[order].to_dict('index')
         
         logger.info("统计数据计算完成")
         
@@ -203,6 +327,8 @@ class PerformanceMetrics:
     def export_results(self, filepath: str | Path) -> None:
         """导出结果到CSV
         
+        安装了 pyarrow 时使用其多线程 C++ CSV 写出器，否则回退到 ``DataFrame.to_csv``。
+        
         Args:
             filepath: 输出CSV文件路径
         """
@@ -210,11 +336,28 @@ class PerformanceMetrics:
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
         df = pd.DataFrame(self.results)
-        df.to_csv(filepath, index=False)
+        if pa is not None:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(filepath))
+        else:
+            df.to_csv(filepath, index=False)
         
         logger.info(f"结果已导出到: {filepath}")
 
 
+def _run_benchmark_job(
+    job: tuple[Any, dict[int, list[tuple[int, int]]] | None, int, int]
+) -> tuple[dict[str, Any] | None, str | None]:
+    """运行单个 (算法, 图, 源点, 目标点) 基准测试，可在工作进程中执行
+    
+    Returns:
+        (测试结果, None)；测试抛出异常时为 (None, 错误信息)
+    """
+    try:
+        return PerformanceMetrics().run_single_test(*job), None
+    except Exception as e:
+        return None, str(e)
+
+
 class ComplexityAnalyzer:
     """时间复杂度验证
     
@@ -230,22 +373,26 @@ class ComplexityAnalyzer:
         algorithm: Any,
         graph_sizes: list[int],
         density: float = 0.3,
-        num_trials: int = 5
+        num_trials: int = 5,
+        cache_dir: str | Path | None = GRAPH_CACHE_DIR
     ) -> dict[str, Any]:
         """经验复杂度分析
         
-        通过在不同规模的图上运行算法，拟合时间复杂度。
+        通过在不同规模的图上运行算法，拟合时间复杂度。第 i 次试验使用种子 i
+        生成的随机图，图按 (n, m, seed) 缓存；每张图上以 ``type(algorithm)(graph)``
+        构建新实例，计时只覆盖 ``find_second_shortest`` 本身。
         
         Args:
-            algorithm: 算法实例
+            algorithm: 算法实例，只用于确定算法类型
             graph_sizes: 测试的图规模列表
             density: 图的密度
             num_trials: 每个规模重复测试的次数
+            cache_dir: 随机图的磁盘缓存目录，为None时只在内存中缓存
         
         Returns:
             包含拟合结果的字典
         """
-        from second_shortest_path.data.generator import GraphGenerator
+        cache_dir = Path(cache_dir) if cache_dir is not None else None
         
         logger.info(f"开始经验复杂度分析: {graph_sizes}")
         
@@ -256,20 +403,24 @@ class ComplexityAnalyzer:
             m = int(max_edges * density)
             m = max(m, n - 1)
             
-            times = []
-            for _ in range(num_trials):
-                graph_data = GraphGenerator.generate_random_graph(n, m)
-                graph = graph_data['graph']
-                source = graph_data['source']
-                target = graph_data['target']
-                
-                start_time = time.perf_counter()
-                algorithm.find_second_shortest(source, target)
-                end_time = time.perf_counter()
-                
-                times.append(end_time - start_time)
+            # 计时前先准备好全部试验的图，并在各图上构建同类算法实例
+            trials = []
+            for seed in range(num_trials):
+                graph_data = _cached_random_graph(n, m, seed, cache_dir)
+                trials.append((
+                    type(algorithm)(graph_data['graph']),
+                    graph_data['source'],
+                    graph_data['target'],
+                ))
+            
+            times_ns = []
+            for trial_algorithm, source, target in trials:
+                start_ns = time.perf_counter_ns()
+                trial_algorithm.find_second_shortest(source, target)
+                times_ns.append(time.perf_counter_ns() - start_ns)
             
-            avg_time = np.mean(times)
+            # 只在汇总时换算为秒
+            avg_time = sum(times_ns) / len(times_ns) * 1e-9
             data_points.append({
                 'n': n,
                 'm': m,
@@ -277,48 +428,44 @@ class ComplexityAnalyzer:
             })
         
         # 尝试拟合 O(M log N) 和 O(MN)
-        df = pd.DataFrame(data_points)
+        n_arr = np.array([p['n'] for p in data_points], dtype=np.float64)
+        m_arr = np.array([p['m'] for p in data_points], dtype=np.float64)
+        t_arr = np.array([p['time'] for p in data_points], dtype=np.float64)
         
         # 计算理论值
-        df['m_log_n'] = df['m'] * np.log(df['n'])
-        df['m_n'] = df['m'] * df['n']
-        
-        # 线性拟合
-        from scipy import stats
+        m_log_n = m_arr * np.log(n_arr)
+        m_n = m_arr * n_arr
         
+        # 线性拟合（闭式最小二乘，无需导入scipy）
         # 拟合 O(M log N)
-        slope1, intercept1, r_value1, _, _ = stats.linregress(
-            df['m_log_n'], df['time']
-        )
+        slope1, intercept1, r_squared1 = _linear_fit(m_log_n, t_arr)
         
         # 拟合 O(MN)
-        slope2, intercept2, r_value2, _, _ = stats.linregress(
-            df['m_n'], df['time']
-        )
+        slope2, intercept2, r_squared2 = _linear_fit(m_n, t_arr)
         
         result = {
             'data_points': data_points,
             'o_m_log_n': {
                 'slope': slope1,
                 'intercept': intercept1,
-                'r_squared': r_value1 ** 2,
+                'r_squared': r_squared1,
             },
             'o_m_n': {
                 'slope': slope2,
                 'intercept': intercept2,
-                'r_squared': r_value2 ** 2,
+                'r_squared': r_squared2,
             },
         }
         
         # 判断更符合哪个复杂度
-        if r_value1 ** 2 > r_value2 ** 2:
+        if r_squared1 > r_squared2:
             result['best_fit'] = 'O(M log N)'
         else:
             result['best_fit'] = 'O(MN)'
         
         logger.info(
             f"复杂度分析完成: {result['best_fit']}, "
-            f"R²={max(r_value1**2, r_value2**2):.4f}"
+            f"R²={max(r_squared1, r_squared2):.4f}"
         )
         
         return result
@@ -5,22 +5,310 @@
 完全符合 docs/01_visual.md 的要求。
 """
 
+import functools
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from scipy.optimize import curve_fit
-from scipy import stats
 
 logger = logging.getLogger(__name__)
 
-# 设置绘图风格
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['font.size'] = 12
+# plot_all 生成的图表：(Visualizer方法名, 输出文件名)
+PLOT_ALL_TASKS = (
+    ('plot_runtime_comparison', 'runtime_comparison.png'),
+    ('plot_scalability', 'scalability.png'),
+    ('plot_complexity_verification', 'complexity_verification.png'),
+    ('plot_operations_comparison', 'operations_comparison.png'),
+    ('plot_percentile_comparison', 'percentile_comparison.png'),
+    ('plot_heatmap', 'performance_heatmap.png'),
+)
+
+# plot_all 中只依赖汇总统计量的图表：工作进程只接收 ``Visualizer._prepare_summary``
+# 的结果而不是原始DataFrame
+_SUMMARY_PLOTS = frozenset({
+    'plot_scalability',
+    'plot_operations_comparison',
+    'plot_distance_updates_comparison',
+    'plot_heatmap',
+})
+
+# 操作次数对比图的列：(列名, 子图标题)
+_OPERATION_TYPES = (
+    ('operations', 'Queue/PQ Operations'),
+    ('edge_relaxations', 'Edge Relaxations'),
+    ('push_count', 'Push Operations'),
+)
+
+# 热力图的密度与规模分箱标签
+_DENSITY_LABELS = np.array(['Very Sparse', 'Sparse', 'Medium', 'Dense', 'Very Dense'])
+_SIZE_LABELS = np.array(['XS', 'S', 'M', 'L', 'XL'])
+
+# 散点图最多绘制的点数，超过时用 LTTB 降采样（拟合仍使用全部数据）
+_MAX_SCATTER_POINTS = 2000
+
+
+def _ensure_parent_dir(output_path: str | Path) -> Path:
+    """转换为 Path 并确保其父目录存在
+    
+    每次调用都检查目录：目录可能在两次绘图之间被删除，而 mkdir 的开销
+    相对 savefig 可以忽略。
+    """
+    if not isinstance(output_path, Path):
+        output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+@functools.cache
+def _import_plotting() -> tuple[Any, Any]:
+    """按需导入 matplotlib 与 seaborn 并设置绘图风格（只执行一次）
+    
+    两者导入耗时较长，只导入本包而不绘图的调用方无需承担该开销。
+    
+    Returns:
+        (matplotlib.pyplot, seaborn) 模块
+    """
+    import matplotlib
+    
+    # 所有图表只保存为文件，使用无GUI的 Agg 后端（须在导入 pyplot 之前设置）
+    matplotlib.use('Agg')
+    
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # 设置绘图风格
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (10, 6)
+    plt.rcParams['font.size'] = 12
+    # 长路径分块光栅化，避免 Agg 在大量数据点时超出单次绘制的顶点上限
+    plt.rcParams['agg.path.chunksize'] = 10000
+    
+    return plt, sns
+
+
+def _save_fig(fig: Any, output_path: Path, dpi: int) -> None:
+    """以白色背景保存图表，格式由输出路径后缀决定
+    
+    PNG：图表颜色很少，先用 Agg 渲染再量化为256色调色板图像，以低压缩级别写出，
+    比 ``savefig`` 的RGBA PNG编码更快，文件也更小。其余后缀（如 ``.svg``、
+    ``.pdf``）交给 ``savefig`` 输出矢量图，不做光栅化。
+    """
+    fig.patch.set_facecolor('white')
+    if output_path.suffix.lower() != '.png':
+        fig.savefig(output_path, dpi=dpi, facecolor='white')
+        return
+    
+    from PIL import Image
+    
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    
+    image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB')
+    image.quantize(colors=256).save(output_path, format='PNG', compress_level=1)
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets 降采样，保留曲线形状的同时将点数降为 n_out
+    
+    点按 x 排序后分为 n_out - 2 个桶，首末点保留，每个桶选取与上一个选中点、
+    下一个桶均值点构成三角形面积最大的点。
+    
+    Returns:
+        按 x 升序排列的 (x, y)；点数不超过 n_out 时返回全部点
+    """
+    order = np.argsort(x, kind='stable')
+    x = x[order]
+    y = y[order]
+    n = x.size
+    if n <= n_out or n_out < 3:
+        return x, y
+    
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = bounds[i], bounds[i + 1]
+        next_end = bounds[i + 2] if i + 2 < bounds.size else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+
+def _fit_line(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    """一元线性最小二乘拟合 y = slope * x + intercept（闭式解，两次遍历）
+    
+    Returns:
+        (slope, intercept, r_squared)；y 为常数时 r_squared 为 0
+    
+    Raises:
+        ValueError: 如果没有数据点或 x 全部相同
+    """
+    if x.size == 0:
+        raise ValueError("没有可拟合的数据点")
+    
+    x_mean = x.mean()
+    y_mean = y.mean()
+    dx = x - x_mean
+    sxx = float(np.dot(dx, dx))
+    if sxx == 0:
+        raise ValueError("x 全部相同，无法拟合")
+    
+    dy = y - y_mean
+    sxy = float(np.dot(dx, dy))
+    syy = float(np.dot(dy, dy))
+    slope = sxy / sxx
+    
+    # 最小二乘拟合的 R² 等于相关系数的平方，无需再计算残差
+    r_squared = sxy * sxy / (sxx * syy) if syy > 0 else 0
+    return slope, float(y_mean - slope * x_mean), r_squared
+
+
+def _equal_width_codes(values: np.ndarray, bins: int) -> np.ndarray:
+    """将数值划分为 bins 个等宽区间并返回 int8 区间编号（与 ``pd.cut(values, bins)`` 一致）
+    
+    区间为左开右闭，最小值归入第 0 个区间；所有值相同时按 ``pd.cut`` 的规则
+    将取值范围向两侧各扩展 0.1%。
+    """
+    low, high = values.min(), values.max()
+    if low == high:
+        adj = 0.001 * abs(low) if low != 0 else 0.001
+        low, high = low - adj, high + adj
+    edges = np.linspace(low, high, bins + 1)
+    return np.digitize(values, edges[1:-1], right=True).astype(np.int8)
+
+
+def _mean_by_key(keys: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """按键分组求均值（等价于 ``groupby(keys).mean()``，结果按键升序）
+    
+    Returns:
+        (唯一键, 各键对应的均值)
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    sums = np.bincount(inverse, weights=values, minlength=unique_keys.size)
+    counts = np.bincount(inverse, minlength=unique_keys.size)
+    return unique_keys, sums / counts
+
+
+def _per_algorithm_stats(results: pd.DataFrame) -> pd.DataFrame:
+    """按算法汇总运行时间均值/百分位数与平均规模
+    
+    Returns:
+        按算法索引（保持出现顺序）的DataFrame，含 time_mean/p50/p95/p99/n_mean 列；
+        存在 'd1_updates'/'d2_updates' 列时另含 d1_mean/d2_mean
+    """
+    groups = results.groupby('algorithm', sort=False, observed=True)
+    
+    aggregations = {'time_mean': ('time', 'mean'), 'n_mean': ('n', 'mean')}
+    for column, name in (('d1_updates', 'd1_mean'), ('d2_updates', 'd2_mean')):
+        if column in results.columns:
+            aggregations[name] = (column, 'mean')
+    stats = groups.agg(**aggregations)
+    
+    percentiles = groups['time'].quantile([0.50, 0.95, 0.99]).unstack()
+    percentiles.columns = ['p50', 'p95', 'p99']
+    return stats.join(percentiles)
+
+
+def _time_means_by(
+    results: pd.DataFrame,
+    column: str,
+    factorized: tuple[np.ndarray, pd.Index] | None = None
+) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+    """各算法按 column 分组的平均运行时间
+    
+    Args:
+        results: 测试结果DataFrame
+        column: 分组列名
+        factorized: 已计算的 ``pd.factorize(results['algorithm'])``，为 None 时自行计算
+    
+    Returns:
+        {算法名: (升序的唯一键, 对应的平均运行时间)}，算法保持出现顺序
+    """
+    if factorized is None:
+        factorized = pd.factorize(results['algorithm'])
+    algo_codes, algo_names = factorized
+    times = results['time'].to_numpy(dtype=np.float64)
+    keys = results[column].to_numpy()
+    
+    means = {}
+    for code, algo in enumerate(algo_names):
+        mask = algo_codes == code
+        means[algo] = _mean_by_key(keys[mask], times[mask])
+    return means
+
+
+def _operation_means(results: pd.DataFrame) -> pd.DataFrame:
+    """各算法的平均操作次数，只包含结果中存在的 ``_OPERATION_TYPES`` 列"""
+    op_columns = [op_col for op_col, _ in _OPERATION_TYPES if op_col in results.columns]
+    return results.groupby('algorithm', sort=False, observed=True)[op_columns].mean()
+
+
+def _density_pivots(
+    results: pd.DataFrame,
+    factorized: tuple[np.ndarray, pd.Index] | None = None
+) -> dict[str, pd.DataFrame]:
+    """各算法的平均运行时间透视表（行为密度分箱，列为规模分箱）
+    
+    Args:
+        results: 测试结果DataFrame
+        factorized: 已计算的 ``pd.factorize(results['algorithm'])``，为 None 时自行计算
+    
+    Returns:
+        {算法名: 透视表}，算法保持出现顺序；分箱标签见 ``_DENSITY_LABELS``/``_SIZE_LABELS``
+    """
+    # 计算图密度
+    n_values = results['n'].to_numpy(dtype=np.float64)
+    density = results['m'].to_numpy(dtype=np.float64) / (n_values * (n_values - 1) / 2)
+    
+    density_codes = _equal_width_codes(density, len(_DENSITY_LABELS))
+    size_codes = _equal_width_codes(n_values, len(_SIZE_LABELS))
+    times = results['time'].to_numpy(dtype=np.float64)
+    if factorized is None:
+        factorized = pd.factorize(results['algorithm'])
+    algo_codes, algorithms = factorized
+    
+    # (算法, 密度分箱, 规模分箱) 编码为一个整数键，bincount 一次得到所有单元格的
+    # 计数与时间和；缺失的算法名（编号 -1）与时间（NaN）不参与计算，与 groupby 一致
+    shape = (len(algorithms), len(_DENSITY_LABELS), len(_SIZE_LABELS))
+    keep = algo_codes >= 0
+    keys = np.ravel_multi_index(
+        (algo_codes[keep], density_codes[keep], size_codes[keep]), shape
+    )
+    times = times[keep]
+    valid = ~np.isnan(times)
+    size = int(np.prod(shape))
+    present = np.bincount(keys, minlength=size).reshape(shape) > 0
+    counts = np.bincount(keys[valid], minlength=size).reshape(shape)
+    sums = np.bincount(keys[valid], weights=times[valid], minlength=size).reshape(shape)
+    with np.errstate(invalid='ignore'):
+        means = sums / counts
+    
+    pivots = {}
+    for idx, algo in enumerate(algorithms):
+        # 透视表只保留该算法出现过的密度行与规模列，其余空单元格为 NaN
+        rows = present[idx].any(axis=1)
+        cols = present[idx].any(axis=0)
+        pivots[algo] = pd.DataFrame(
+            means[idx][np.ix_(rows, cols)],
+            index=pd.Index(_DENSITY_LABELS[rows], name='density_bin'),
+            columns=pd.Index(_SIZE_LABELS[cols], name='size_bin'),
+        )
+    return pivots
 
 
 class Visualizer:
@@ -37,7 +325,8 @@ class Visualizer:
     @staticmethod
     def plot_runtime_comparison(
         results: pd.DataFrame,
-        output_path: str | Path
+        output_path: str | Path,
+        dpi: int = 150
     ) -> None:
         """运行时间对比箱线图
         
@@ -46,78 +335,49 @@ class Visualizer:
         Args:
             results: 测试结果DataFrame，需包含 'algorithm' 和 'time' 列
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
         logger.info(f"生成运行时间对比图: {output_path}")
-        
-        plt.figure(figsize=(12, 7))
-        
-        # 绘制箱线图
-        ax = sns.boxplot(
-            x='algorithm', 
-            y='time', 
-            data=results, 
-            palette=['#3498db', '#e74c3c'],
-            showmeans=True,
-            meanprops={'marker': 'D', 'markerfacecolor': 'gold', 'markersize': 10, 'markeredgecolor': 'black', 'markeredgewidth': 1.5}
-        )
-        
-        ax.set_xlabel('Algorithm', fontsize=14, fontweight='bold')
-        ax.set_ylabel('Runtime (seconds)', fontsize=14, fontweight='bold')
-        ax.set_title('Algorithm Runtime Comparison (Box Plot)', fontsize=16, fontweight='bold')
-        ax.tick_params(axis='x', rotation=0)
-        
-        # 添加图例说明
-        from matplotlib.patches import Patch
-        from matplotlib.lines import Line2D
-        
-        legend_elements = [
-            Line2D([0], [0], marker='_', color='w', label='Median (P50)',
-                   markerfacecolor='black', markersize=12, markeredgecolor='black', linewidth=2),
-            Line2D([0], [0], marker='D', color='w', label='Mean',
-                   markerfacecolor='gold', markersize=8, markeredgecolor='black', markeredgewidth=1.5),
-            Patch(facecolor='#3498db', label='Dijkstra', alpha=0.7),
-            Patch(facecolor='#e74c3c', label='Queue-Optimized Bellman-Ford', alpha=0.7),
-        ]
-        
-        ax.legend(handles=legend_elements, loc='upper left', fontsize=11, framealpha=0.95, edgecolor='black')
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
+        Visualizer._render_boxplot(results, output_path, dpi, annotate_percentiles=False)
         logger.info(f"运行时间对比图已保存")
     
     @staticmethod
     def plot_scalability(
-        results: pd.DataFrame,
-        output_path: str | Path
+        results: pd.DataFrame | None,
+        output_path: str | Path,
+        dpi: int = 150,
+        summary: dict[str, Any] | None = None
     ) -> None:
         """可扩展性分析折线图
         
         展示算法性能随图规模的变化。
         
         Args:
-            results: 测试结果DataFrame，需包含 'algorithm', 'n', 'time' 列
+            results: 测试结果DataFrame，需包含 'algorithm', 'n', 'm', 'time' 列；
+                提供 summary 时可为 None
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
+            summary: ``Visualizer._prepare_summary`` 的结果，提供时不再扫描 results
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_parent_dir(output_path)
+        plt, sns = _import_plotting()
         
         logger.info(f"生成可扩展性分析图: {output_path}")
         
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
         
+        if summary is None:
+            per_n_mean = _time_means_by(results, 'n')
+            per_m_mean = _time_means_by(results, 'm')
+        else:
+            per_n_mean = summary['per_n_mean']
+            per_m_mean = summary['per_m_mean']
+        
         # 左图：按节点数n分组
-        for algo in results['algorithm'].unique():
-            algo_df = results[results['algorithm'] == algo]
-            grouped = algo_df.groupby('n')['time'].mean()
-            
+        for algo, (keys, means) in per_n_mean.items():
             color = '#3498db' if 'Dijkstra' in algo else '#e74c3c'
             ax1.plot(
-                grouped.index, grouped.values, 
+                keys, means, 
                 marker='o', label=algo, linewidth=2, 
                 markersize=6, color=color
             )
@@ -129,13 +389,10 @@ class Visualizer:
         ax1.grid(True, alpha=0.3)
         
         # 右图：按边数m分组
-        for algo in results['algorithm'].unique():
-            algo_df = results[results['algorithm'] == algo]
-            grouped = algo_df.groupby('m')['time'].mean()
-            
+        for algo, (keys, means) in per_m_mean.items():
             color = '#3498db' if 'Dijkstra' in algo else '#e74c3c'
             ax2.plot(
-                grouped.index, grouped.values, 
+                keys, means, 
                 marker='s', label=algo, linewidth=2, 
                 markersize=6, color=color
             )
@@ -147,7 +404,7 @@ class Visualizer:
         ax2.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_fig(plt.gcf(), output_path, dpi)
         plt.close()
         
         logger.info(f"可扩展性分析图已保存")
@@ -155,59 +412,56 @@ class Visualizer:
     @staticmethod
     def plot_complexity_verification(
         results: pd.DataFrame,
-        output_path: str | Path
+        output_path: str | Path,
+        dpi: int = 150
     ) -> None:
         """复杂度验证散点图+拟合曲线
 
-        使用scipy进行完整的曲线拟合：
+        使用闭式最小二乘进行线性拟合：
         - Dijkstra: 拟合 T = c * M * log(N)
         - Queue-Optimized Bellman-Ford: 同时拟合 O(M log N) 和 O(MN)，选择R²更高的
         
         Args:
             results: 测试结果DataFrame
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_parent_dir(output_path)
+        plt, sns = _import_plotting()
         
         logger.info(f"生成复杂度验证图: {output_path}")
         
         fig, axes = plt.subplots(1, 2, figsize=(18, 7))
         
-        algorithms = results['algorithm'].unique()
+        # 理论复杂度值直接在 NumPy 数组上计算，不复制 DataFrame 添加派生列
+        algo_codes, algorithms = pd.factorize(results['algorithm'])
+        n_values = results['n'].to_numpy(dtype=np.float64)
+        m_values = results['m'].to_numpy(dtype=np.float64)
+        times = results['time'].to_numpy(dtype=np.float64)
+        
+        # 计算理论复杂度值（所有算法共用，循环内只按掩码取子集）
+        all_m_log_n = m_values * np.log(n_values)
+        all_m_n = m_values * n_values
         
         for idx, algo in enumerate(algorithms):
-            algo_df = results[results['algorithm'] == algo].copy()
+            mask = algo_codes == idx
             
             ax = axes[idx]
             
-            # 计算理论复杂度值
-            algo_df['m_log_n'] = algo_df['m'] * np.log(algo_df['n'])
-            algo_df['m_n'] = algo_df['m'] * algo_df['n']
-            
-            # 定义拟合函数
-            def linear_func(x, a, b):
-                """线性函数: y = ax + b"""
-                return a * x + b
+            m_log_n = all_m_log_n[mask]
+            m_n = all_m_n[mask]
+            y_data = times[mask]
             
             # 拟合 O(M log N)
             try:
-                x_data_log = algo_df['m_log_n'].values
-                y_data = algo_df['time'].values
+                x_data_log = m_log_n
                 
                 # 过滤掉无效值
                 valid_mask = np.isfinite(x_data_log) & np.isfinite(y_data) & (x_data_log > 0)
                 x_data_log_valid = x_data_log[valid_mask]
                 y_data_valid = y_data[valid_mask]
                 
-                popt_log, _ = curve_fit(linear_func, x_data_log_valid, y_data_valid)
-                slope_log, intercept_log = popt_log
-                
-                # 计算R²
-                y_pred_log = linear_func(x_data_log_valid, *popt_log)
-                ss_res_log = np.sum((y_data_valid - y_pred_log) ** 2)
-                ss_tot_log = np.sum((y_data_valid - np.mean(y_data_valid)) ** 2)
-                r2_log = 1 - (ss_res_log / ss_tot_log) if ss_tot_log > 0 else 0
+                slope_log, intercept_log, r2_log = _fit_line(x_data_log_valid, y_data_valid)
                 
                 logger.info(f"{algo} - O(M log N) 拟合: R² = {r2_log:.4f}")
             except Exception as e:
@@ -218,20 +472,13 @@ class Visualizer:
             
             # 拟合 O(MN)
             try:
-                x_data_mn = algo_df['m_n'].values
+                x_data_mn = m_n
                 
                 valid_mask_mn = np.isfinite(x_data_mn) & np.isfinite(y_data) & (x_data_mn > 0)
                 x_data_mn_valid = x_data_mn[valid_mask_mn]
                 y_data_mn_valid = y_data[valid_mask_mn]
                 
-                popt_mn, _ = curve_fit(linear_func, x_data_mn_valid, y_data_mn_valid)
-                slope_mn, intercept_mn = popt_mn
-                
-                # 计算R²
-                y_pred_mn = linear_func(x_data_mn_valid, *popt_mn)
-                ss_res_mn = np.sum((y_data_mn_valid - y_pred_mn) ** 2)
-                ss_tot_mn = np.sum((y_data_mn_valid - np.mean(y_data_mn_valid)) ** 2)
-                r2_mn = 1 - (ss_res_mn / ss_tot_mn) if ss_tot_mn > 0 else 0
+                slope_mn, intercept_mn, r2_mn = _fit_line(x_data_mn_valid, y_data_mn_valid)
                 
                 logger.info(f"{algo} - O(MN) 拟合: R² = {r2_mn:.4f}")
             except Exception as e:
@@ -244,29 +491,40 @@ class Visualizer:
             if r2_log >= r2_mn:
                 best_complexity = 'O(M log N)'
                 best_r2 = r2_log
-                x_plot = algo_df['m_log_n']
+                x_plot = m_log_n
                 x_label = 'M log N'
                 
-                # 绘制散点图
-                ax.scatter(x_plot, algo_df['time'], alpha=0.6, s=50, label='Actual Data')
+                # 绘制散点图（共用颜色与大小，单个 Line2D 比 PathCollection 绘制更快；
+                # 矢量输出时光栅化为位图）
+                x_scatter, y_scatter = _lttb(x_plot, y_data, _MAX_SCATTER_POINTS)
+                ax.plot(
+                    x_scatter, y_scatter, marker='o', linestyle='none',
+                    markersize=np.sqrt(50), alpha=0.6, label='Actual Data',
+                    rasterized=True
+                )
                 
-                # 绘制拟合曲线
-                x_line = np.linspace(x_plot.min(), x_plot.max(), 100)
-                y_line = linear_func(x_line, slope_log, intercept_log)
+                # 绘制拟合直线（线性坐标轴上两个端点即可确定）
+                x_line = np.array([x_plot.min(), x_plot.max()])
+                y_line = slope_log * x_line + intercept_log
                 ax.plot(x_line, y_line, 'r--', linewidth=2, 
                        label=f'Fit: T = {slope_log:.2e} * x + {intercept_log:.2e}')
             else:
                 best_complexity = 'O(MN)'
                 best_r2 = r2_mn
-                x_plot = algo_df['m_n']
+                x_plot = m_n
                 x_label = 'M * N'
                 
                 # 绘制散点图
-                ax.scatter(x_plot, algo_df['time'], alpha=0.6, s=50, label='Actual Data')
+                x_scatter, y_scatter = _lttb(x_plot, y_data, _MAX_SCATTER_POINTS)
+                ax.plot(
+                    x_scatter, y_scatter, marker='o', linestyle='none',
+                    markersize=np.sqrt(50), alpha=0.6, label='Actual Data',
+                    rasterized=True
+                )
                 
-                # 绘制拟合曲线
-                x_line = np.linspace(x_plot.min(), x_plot.max(), 100)
-                y_line = linear_func(x_line, slope_mn, intercept_mn)
+                # 绘制拟合直线（线性坐标轴上两个端点即可确定）
+                x_line = np.array([x_plot.min(), x_plot.max()])
+                y_line = slope_mn * x_line + intercept_mn
                 ax.plot(x_line, y_line, 'r--', linewidth=2, 
                        label=f'Fit: T = {slope_mn:.2e} * x + {intercept_mn:.2e}')
             
@@ -281,81 +539,61 @@ class Visualizer:
             ax.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_fig(plt.gcf(), output_path, dpi)
         plt.close()
         
         logger.info(f"复杂度验证图已保存")
     
     @staticmethod
     def plot_operations_comparison(
-        results: pd.DataFrame,
-        output_path: str | Path
+        results: pd.DataFrame | None,
+        output_path: str | Path,
+        dpi: int = 150,
+        summary: dict[str, Any] | None = None
     ) -> None:
         """操作次数对比分组柱状图
         
         展示：Push次数、Pop次数、边松弛次数。
         
         Args:
-            results: 测试结果DataFrame
+            results: 测试结果DataFrame；提供 summary 时可为 None
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
+            summary: ``Visualizer._prepare_summary`` 的结果，提供时不再扫描 results
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_parent_dir(output_path)
+        plt, sns = _import_plotting()
         
         logger.info(f"生成操作次数对比图: {output_path}")
         
-        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-        
-        # 准备数据
-        operation_types = [
-            ('operations', 'Queue/PQ Operations'),
-            ('edge_relaxations', 'Edge Relaxations'),
-            ('push_count', 'Push Operations')
-        ]
+        # 按算法分组计算平均值（一次聚合全部操作列，保持算法出现顺序）
+        op_means = _operation_means(results) if summary is None else summary['op_means']
         
         # 检查数据列是否存在
-        available_ops = []
-        if 'operations' in results.columns:
-            available_ops.append(('operations', 'Queue/PQ Operations'))
-        if 'edge_relaxations' in results.columns:
-            available_ops.append(('edge_relaxations', 'Edge Relaxations'))
-        if 'push_count' in results.columns:
-            available_ops.append(('push_count', 'Push Operations'))
+        available_ops = [
+            (op_col, op_name) for op_col, op_name in _OPERATION_TYPES
+            if op_col in op_means.columns
+        ]
         
         if not available_ops:
             logger.warning("没有操作次数数据可供绘图")
             return
         
+        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        
+        algo_names = op_means.index.tolist()
+        colors = ['#3498db' if 'Dijkstra' in algo else '#e74c3c' 
+                 for algo in algo_names]
+        
         for idx, (op_col, op_name) in enumerate(available_ops[:3]):
             ax = axes[idx] if len(available_ops) >= 3 else axes[idx % len(axes)]
             
-            # 按算法分组计算平均值
-            data_for_plot = []
-            for algo in results['algorithm'].unique():
-                algo_df = results[results['algorithm'] == algo]
-                if op_col in algo_df.columns:
-                    avg_ops = algo_df[op_col].mean()
-                    data_for_plot.append({
-                        'Algorithm': algo,
-                        'Operations': avg_ops
-                    })
-            
-            if data_for_plot:
-                df_plot = pd.DataFrame(data_for_plot)
-                
-                colors = ['#3498db' if 'Dijkstra' in algo else '#e74c3c' 
-                         for algo in df_plot['Algorithm']]
-                
-                bars = ax.bar(df_plot['Algorithm'], df_plot['Operations'], color=colors, alpha=0.7)
+            if algo_names:
+                avg_ops = op_means[op_col].to_numpy()
+                bars = ax.bar(algo_names, avg_ops, color=colors, alpha=0.7)
                 
                 # 添加数值标签
-                for bar in bars:
-                    height = bar.get_height()
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2., height,
-                        f'{int(height):,}',
-                        ha='center', va='bottom', fontsize=10
-                    )
+                ax.bar_label(bars, labels=[f'{int(v):,}' for v in avg_ops], fontsize=10)
                 
                 ax.set_xlabel('Algorithm', fontsize=12, fontweight='bold')
                 ax.set_ylabel('Average Count', fontsize=12, fontweight='bold')
@@ -368,7 +606,7 @@ class Visualizer:
             axes[idx].set_visible(False)
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_fig(plt.gcf(), output_path, dpi)
         plt.close()
         
         logger.info(f"操作次数对比图已保存")
@@ -376,7 +614,8 @@ class Visualizer:
     @staticmethod
     def plot_percentile_comparison(
         results: pd.DataFrame,
-        output_path: str | Path
+        output_path: str | Path,
+        dpi: int = 150
     ) -> None:
         """百分位数箱线图
         
@@ -385,201 +624,309 @@ class Visualizer:
         Args:
             results: 测试结果DataFrame
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
         logger.info(f"生成百分位数对比图: {output_path}")
+        Visualizer._render_boxplot(results, output_path, dpi, annotate_percentiles=True)
+        logger.info(f"百分位数对比图已保存")
+    
+    @staticmethod
+    def _render_boxplot(
+        results: pd.DataFrame,
+        output_path: str | Path,
+        dpi: int,
+        *,
+        annotate_percentiles: bool
+    ) -> None:
+        """运行时间箱线图与百分位数箱线图共用的绘制流程
+        
+        Args:
+            results: 测试结果DataFrame，需包含 'algorithm' 和 'time' 列
+            output_path: 输出图片路径
+            dpi: 输出分辨率
+            annotate_percentiles: 为 True 时标注P50/P95/P99，否则绘制中位数/均值/算法图例
+        """
+        output_path = _ensure_parent_dir(output_path)
+        plt, _ = _import_plotting()
         
-        plt.figure(figsize=(12, 7))
+        fig, ax = plt.subplots(figsize=(12, 7))
+        
+        # 各算法的运行时间数组（按出现顺序），箱线图与百分位数共用
+        groups = results.groupby('algorithm', sort=False, observed=True)['time']
+        algo_names = [algo for algo, _ in groups]
+        data = [times.dropna().to_numpy() for _, times in groups]
+        positions = np.arange(len(data))
         
         # 箱线图
-        ax = sns.boxplot(
-            x='algorithm', 
-            y='time', 
-            data=results, 
-            palette=['#3498db', '#e74c3c'],
+        palette = ['#3498db', '#e74c3c']
+        boxplot = ax.boxplot(
+            data,
+            positions=positions,
+            widths=0.8,
+            patch_artist=True,
             showmeans=True,
-            meanprops={'marker': 'D', 'markerfacecolor': 'yellow', 'markersize': 10, 'label': 'Mean'}
+            medianprops={'color': '#444444'},
+            meanprops={'marker': 'D', 'markerfacecolor': 'gold', 'markersize': 10, 'markeredgecolor': 'black', 'markeredgewidth': 1.5}
         )
+        for idx, box in enumerate(boxplot['boxes']):
+            box.set_facecolor(palette[idx % len(palette)])
+        # 离群点数量可能很大，矢量输出（SVG/PDF）时光栅化为位图，箱体与文字仍为矢量
+        for fliers in boxplot['fliers']:
+            fliers.set_rasterized(True)
+        ax.set_xticks(positions)
+        ax.set_xticklabels(algo_names)
         
         ax.set_xlabel('Algorithm', fontsize=14, fontweight='bold')
         ax.set_ylabel('Runtime (seconds)', fontsize=14, fontweight='bold')
-        ax.set_title('Algorithm Runtime Distribution (Percentile Comparison)', fontsize=16, fontweight='bold')
         ax.tick_params(axis='x', rotation=0)
         
-        # 添加百分位数标注
-        algorithms = results['algorithm'].unique()
-        for i, algo in enumerate(algorithms):
-            algo_df = results[results['algorithm'] == algo]
+        if annotate_percentiles:
+            ax.set_title('Algorithm Runtime Distribution (Percentile Comparison)', fontsize=16, fontweight='bold')
+            if boxplot['means']:
+                boxplot['means'][0].set_label('Mean')
             
-            p50 = algo_df['time'].quantile(0.50)
-            p95 = algo_df['time'].quantile(0.95)
-            p99 = algo_df['time'].quantile(0.99)
+            # 添加百分位数标注：每种标记一次绘制
+            percentiles = np.array([np.quantile(times, [0.50, 0.95, 0.99]) for times in data])
             
             # P50 标注（中位数）
-            ax.plot(i, p50, 'go', markersize=8, label='P50' if i == 0 else '')
-            
+            ax.plot(positions, percentiles[:, 0], 'go', markersize=8, label='P50')
             # P95 标注
-            ax.plot(i, p95, 'ro', markersize=8, label='P95' if i == 0 else '')
-            ax.text(
-                i + 0.15, p95, f'P95: {p95:.6f}s',
-                ha='left', va='center', fontsize=9, color='red',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7)
-            )
-            
+            ax.plot(positions, percentiles[:, 1], 'ro', markersize=8, label='P95')
             # P99 标注
-            ax.plot(i, p99, 'mo', markersize=8, label='P99' if i == 0 else '')
-            ax.text(
-                i + 0.15, p99, f'P99: {p99:.6f}s',
-                ha='left', va='center', fontsize=9, color='purple',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7)
-            )
-        
-        ax.legend(loc='upper right', fontsize=10)
+            ax.plot(positions, percentiles[:, 2], 'mo', markersize=8, label='P99')
+            
+            for i, (_, p95, p99) in enumerate(percentiles):
+                ax.text(
+                    i + 0.15, p95, f'P95: {p95:.6f}s',
+                    ha='left', va='center', fontsize=9, color='red',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7)
+                )
+                ax.text(
+                    i + 0.15, p99, f'P99: {p99:.6f}s',
+                    ha='left', va='center', fontsize=9, color='purple',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.7)
+                )
+            
+            ax.legend(loc='upper right', fontsize=10)
+        else:
+            ax.set_title('Algorithm Runtime Comparison (Box Plot)', fontsize=16, fontweight='bold')
+            
+            # 添加图例说明
+            from matplotlib.patches import Patch
+            from matplotlib.lines import Line2D
+            
+            legend_elements = [
+                Line2D([0], [0], marker='_', color='w', label='Median (P50)',
+                       markerfacecolor='black', markersize=12, markeredgecolor='black', linewidth=2),
+                Line2D([0], [0], marker='D', color='w', label='Mean',
+                       markerfacecolor='gold', markersize=8, markeredgecolor='black', markeredgewidth=1.5),
+                Patch(facecolor='#3498db', label='Dijkstra', alpha=0.7),
+                Patch(facecolor='#e74c3c', label='Queue-Optimized Bellman-Ford', alpha=0.7),
+            ]
+            
+            ax.legend(handles=legend_elements, loc='upper left', fontsize=11, framealpha=0.95, edgecolor='black')
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-        
-        logger.info(f"百分位数对比图已保存")
+        _save_fig(fig, output_path, dpi)
+        plt.close(fig)
     
     @staticmethod
     def plot_distance_updates_comparison(
-        results: pd.DataFrame,
-        output_path: str | Path
+        results: pd.DataFrame | None,
+        output_path: str | Path,
+        dpi: int = 150,
+        summary: dict[str, Any] | None = None
     ) -> None:
         """距离标签更新次数对比图
         
         对比d1和d2的更新次数，验证理论上限。
         
         Args:
-            results: 测试结果DataFrame，需包含 'd1_updates' 和 'd2_updates' 列
+            results: 测试结果DataFrame，需包含 'd1_updates' 和 'd2_updates' 列；
+                提供 summary 时可为 None
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
+            summary: ``Visualizer._prepare_summary`` 的结果，提供时不再扫描 results
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_parent_dir(output_path)
+        plt, sns = _import_plotting()
         
         logger.info(f"生成距离更新对比图: {output_path}")
         
+        per_algo_stats = _per_algorithm_stats(results) if summary is None else summary['per_algo_stats']
+        
         # 检查必需的列是否存在
-        if 'd1_updates' not in results.columns or 'd2_updates' not in results.columns:
+        if 'd1_mean' not in per_algo_stats.columns or 'd2_mean' not in per_algo_stats.columns:
             logger.warning("缺少 'd1_updates' 或 'd2_updates' 列，跳过距离更新对比图")
             return
         
         fig, axes = plt.subplots(1, 2, figsize=(16, 6))
         
-        algorithms = results['algorithm'].unique()
-        
-        for idx, algo in enumerate(algorithms):
-            algo_df = results[results['algorithm'] == algo]
-            
+        for idx, (algo, stats) in enumerate(per_algo_stats.iterrows()):
             ax = axes[idx]
             
-            # 计算平均更新次数
-            avg_d1 = algo_df['d1_updates'].mean()
-            avg_d2 = algo_df['d2_updates'].mean()
-            
-            # 绘制柱状图
+            # 绘制平均更新次数柱状图
             categories = ['d1 Updates', 'd2 Updates']
-            values = [avg_d1, avg_d2]
+            values = [stats['d1_mean'], stats['d2_mean']]
             colors = ['#3498db', '#e74c3c']
             
             bars = ax.bar(categories, values, color=colors, alpha=0.7)
             
             # 添加数值标签
-            for bar, val in zip(bars, values):
-                height = bar.get_height()
-                ax.text(
-                    bar.get_x() + bar.get_width() / 2., height,
-                    f'{int(val):,}',
-                    ha='center', va='bottom', fontsize=11, fontweight='bold'
-                )
+            ax.bar_label(
+                bars, labels=[f'{int(val):,}' for val in values], fontsize=11, fontweight='bold'
+            )
             
             ax.set_ylabel('Average Update Count', fontsize=12, fontweight='bold')
             ax.set_title(f'{algo} - Distance Label Updates', fontsize=14, fontweight='bold')
             ax.grid(True, alpha=0.3, axis='y')
             
-            # 添加理论上限参考线（如果有足够的数据）
-            if len(algo_df) > 0:
-                avg_n = algo_df['n'].mean()
-                theoretical_limit = avg_n * np.log(avg_n)  # O(N log N) 理论上限
-                ax.axhline(
-                    y=theoretical_limit, 
-                    color='green', 
-                    linestyle='--', 
-                    linewidth=2,
-                    label=f'Theoretical O(N log N): {int(theoretical_limit):,}'
-                )
-                ax.legend(fontsize=10)
+            # 添加理论上限参考线
+            avg_n = stats['n_mean']
+            theoretical_limit = avg_n * np.log(avg_n)  # O(N log N) 理论上限
+            ax.axhline(
+                y=theoretical_limit, 
+                color='green', 
+                linestyle='--', 
+                linewidth=2,
+                label=f'Theoretical O(N log N): {int(theoretical_limit):,}'
+            )
+            ax.legend(fontsize=10)
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_fig(plt.gcf(), output_path, dpi)
         plt.close()
         
         logger.info(f"距离更新对比图已保存")
     
     @staticmethod
     def plot_heatmap(
-        results: pd.DataFrame,
-        output_path: str | Path
+        results: pd.DataFrame | None,
+        output_path: str | Path,
+        dpi: int = 150,
+        summary: dict[str, Any] | None = None
     ) -> None:
         """性能热力图（图密度 x 规模）
         
         Args:
-            results: 测试结果DataFrame
+            results: 测试结果DataFrame；提供 summary 时可为 None
             output_path: 输出图片路径
+            dpi: 输出分辨率，出版质量的图可设为300
+            summary: ``Visualizer._prepare_summary`` 的结果，提供时不再扫描 results
         """
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path = _ensure_parent_dir(output_path)
+        plt, sns = _import_plotting()
         
         logger.info(f"生成性能热力图: {output_path}")
         
-        # 计算图密度
-        results = results.copy()
-        results['density'] = results['m'] / (results['n'] * (results['n'] - 1) / 2)
-        
-        # 离散化密度和规模
-        results['density_bin'] = pd.cut(
-            results['density'], 
-            bins=5, 
-            labels=['Very Sparse', 'Sparse', 'Medium', 'Dense', 'Very Dense']
-        )
-        results['size_bin'] = pd.cut(
-            results['n'], 
-            bins=5, 
-            labels=['XS', 'S', 'M', 'L', 'XL']
-        )
+        density_pivot = _density_pivots(results) if summary is None else summary['density_pivot']
         
         fig, axes = plt.subplots(1, 2, figsize=(16, 6))
         
-        for idx, algo in enumerate(results['algorithm'].unique()):
-            algo_df = results[results['algorithm'] == algo]
-            
-            # 创建透视表
-            pivot_table = algo_df.pivot_table(
-                values='time',
-                index='density_bin',
-                columns='size_bin',
-                aggfunc='mean'
-            )
-            
-            # 热力图
+        for idx, (algo, pivot_table) in enumerate(density_pivot.items()):
+            # 热力图：imshow 一次绘制整个网格，NaN 单元格保持空白；注释文字颜色
+            # 按单元格亮度选择（与 seaborn 一致）
             ax = axes[idx]
-            sns.heatmap(
-                pivot_table,
-                annot=True,
-                fmt='.6f',
-                cmap='YlOrRd',
-                ax=ax,
-                cbar_kws={'label': 'Runtime (s)'}
-            )
+            values = pivot_table.to_numpy(dtype=np.float64)
+            image = ax.imshow(np.ma.masked_invalid(values), cmap='YlOrRd', aspect='auto')
+            fig.colorbar(image, ax=ax, label='Runtime (s)')
+            ax.set_xticks(np.arange(values.shape[1]), pivot_table.columns)
+            ax.set_yticks(np.arange(values.shape[0]), pivot_table.index)
+            ax.grid(False)
+            
+            rgb = image.cmap(image.norm(values))[..., :3]
+            rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+            luminance = rgb @ np.array([0.2126, 0.7152, 0.0722])
+            for row, col in zip(*np.nonzero(~np.isnan(values))):
+                ax.text(
+                    col, row, f'{values[row, col]:.6f}',
+                    ha='center', va='center',
+                    color='black' if luminance[row, col] > 0.408 else 'white'
+                )
             ax.set_title(f'{algo} Performance Heatmap', fontsize=14, fontweight='bold')
             ax.set_xlabel('Graph Size', fontsize=12, fontweight='bold')
             ax.set_ylabel('Graph Density', fontsize=12, fontweight='bold')
         
         plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+        _save_fig(plt.gcf(), output_path, dpi)
         plt.close()
         
         logger.info(f"性能热力图已保存")
+    
+    @staticmethod
+    def _prepare_summary(results: pd.DataFrame) -> dict[str, Any]:
+        """一次计算各汇总图所需的全部统计量
+        
+        汇总结果只有每个算法若干行，``plot_all`` 将其（而非原始结果）发送给
+        ``_SUMMARY_PLOTS`` 中图表的工作进程。
+        
+        Args:
+            results: 测试结果DataFrame，需包含 'algorithm', 'n', 'm', 'time' 列
+        
+        Returns:
+            汇总字典，算法均保持出现顺序：
+            - 'per_algo_stats': 见 ``_per_algorithm_stats``
+            - 'per_n_mean' / 'per_m_mean': {算法名: (n 或 m 的唯一值, 平均运行时间)}
+            - 'density_pivot': {算法名: 密度 x 规模 平均运行时间透视表}
+            - 'op_means': 各算法的平均操作次数
+        """
+        # 算法列只编码一次，各项汇总共用
+        factorized = pd.factorize(results['algorithm'])
+        return {
+            'per_algo_stats': _per_algorithm_stats(results),
+            'per_n_mean': _time_means_by(results, 'n', factorized),
+            'per_m_mean': _time_means_by(results, 'm', factorized),
+            'density_pivot': _density_pivots(results, factorized),
+            'op_means': _operation_means(results),
+        }
+    
+    @classmethod
+    def plot_all(
+        cls,
+        results: pd.DataFrame,
+        output_dir: str | Path,
+        dpi: int = 150
+    ) -> list[Path]:
+        """并行生成 ``PLOT_ALL_TASKS`` 中的全部图表
+        
+        各图相互独立且为CPU密集型，每张图在进程池的工作进程中渲染。汇总统计量在
+        主进程中只计算一次，``_SUMMARY_PLOTS`` 中的图表只接收汇总结果，
+        其余图表（箱线图、复杂度散点图）需要原始数据。
+        
+        Args:
+            results: 测试结果DataFrame
+            output_dir: 输出目录
+            dpi: 输出分辨率
+        
+        Returns:
+            按 ``PLOT_ALL_TASKS`` 顺序排列的输出图片路径
+        """
+        output_dir = Path(output_dir)
+        summary = cls._prepare_summary(results)
+        jobs = [
+            (method_name, results, None, output_dir / filename, dpi)
+            if method_name not in _SUMMARY_PLOTS
+            else (method_name, None, summary, output_dir / filename, dpi)
+            for method_name, filename in PLOT_ALL_TASKS
+        ]
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(_render_plot, jobs))
+        
+        return [output_path for _, _, _, output_path, _ in jobs]
+
+
+def _render_plot(job: tuple[str, pd.DataFrame | None, dict[str, Any] | None, Path, int]) -> None:
+    """在工作进程中渲染单张图表
+    
+    Args:
+        job: (Visualizer方法名, 结果DataFrame, 汇总字典, 输出路径, 分辨率) 五元组；
+            结果与汇总二者只提供其一，另一项为 None
+    """
+    method_name, results, summary, output_path, dpi = job
+    plot = getattr(Visualizer, method_name)
+    if summary is None:
+        plot(results, output_path, dpi=dpi)
+    else:
+        plot(results, output_path, dpi=dpi, summary=summary)
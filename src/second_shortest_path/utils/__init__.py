@@ -5,14 +5,24 @@
 """
 
 from second_shortest_path.utils.graph import (
+    adjacency_to_csr,
     build_adjacency_list,
+    csr_statistics,
+    edges_to_csr,
     graph_statistics,
+    sort_csr_by_weight,
+    validate_csr,
     validate_graph,
 )
 
 __all__ = [
     "build_adjacency_list",
+    "adjacency_to_csr",
+    "edges_to_csr",
+    "sort_csr_by_weight",
     "validate_graph",
+    "validate_csr",
     "graph_statistics",
+    "csr_statistics",
 ]
 
@@ -5,21 +5,25 @@
 """
 
 import logging
+from itertools import chain
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 def build_adjacency_list(
-    edges: list[list[int]],
+    edges: list[list[int]] | np.ndarray,
     n: int,
-    weights: list[int] | None = None,
+    weights: list[int] | np.ndarray | None = None,
     directed: bool = False
 ) -> dict[int, list[tuple[int, int]]]:
     """构建邻接表表示
     
     Args:
-        edges: 边列表，格式为 [[u, v], ...]
+        edges: 边列表，格式为 [[u, v], ...]，或形状为 (m, 2) 的整数数组
         n: 节点数
         weights: 边权重列表，如果为None则所有边权重为1
         directed: 是否为有向图
@@ -35,6 +39,17 @@ def build_adjacency_list(
     """
     graph = {i: [] for i in range(n)}
     
+    if isinstance(edges, np.ndarray):
+        # 数组输入：一次向量化越界检查，再转为Python整数列表（逐行解包numpy标量较慢，
+        # 邻接表中也不应混入numpy整数）。列表输入不转换为数组，转换开销高于逐边检查
+        edges = edges.reshape(-1, 2)
+        if edges.size and (edges.min() < 0 or edges.max() >= n):
+            u, v = edges[((edges < 0) | (edges >= n)).any(axis=1)][0]
+            raise ValueError(f"节点索引越界: u={u}, v={v}, n={n}")
+        edges = edges.tolist()
+    if isinstance(weights, np.ndarray):
+        weights = weights.tolist()
+    
     if weights is None:
         weights = [1] * len(edges)
     
@@ -54,6 +69,145 @@ def build_adjacency_list(
     return graph
 
 
+def adjacency_to_csr(
+    graph: dict[int, list[tuple[int, int]]] | list[list[tuple[int, int]]],
+    sort_by_weight: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """将邻接表转换为CSR（压缩稀疏行）数组
+    
+    节点 u 的出边为 ``indices[indptr[u]:indptr[u + 1]]``，对应权重为
+    ``weights[indptr[u]:indptr[u + 1]]``，默认顺序与邻接表中一致。
+    
+    Args:
+        graph: 图的邻接表表示（字典或列表），节点编号为 0..n-1
+        sort_by_weight: 是否将每个节点的出边按权重升序排列（权重相同时保持原顺序）
+    
+    Returns:
+        (indptr, indices, weights) 三元组：indptr 长度为 n+1，
+        indices 与 weights 长度为有向边数
+    
+    Examples:
+        >>> indptr, indices, weights = adjacency_to_csr({0: [(1, 2)], 1: [(0, 2)]})
+        >>> indptr.tolist(), indices.tolist(), weights.tolist()
+        ([0, 1, 2], [1, 0], [2, 2])
+    """
+    n = len(graph)
+    
+    degrees = np.fromiter((len(graph[u]) for u in range(n)), dtype=np.int64, count=n)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(degrees, out=indptr[1:])
+    
+    arcs = [arc for u in range(n) for arc in graph[u]]
+    if arcs:
+        pairs = np.array(arcs)
+        indices = pairs[:, 0].astype(np.int32)
+        weights = pairs[:, 1]
+        
+        if sort_by_weight:
+            # 以所属节点为主键、权重为次键排序，出边仍在各自的行内
+            tails = np.repeat(np.arange(n), degrees)
+            order = np.lexsort((weights, tails))
+            indices = indices[order]
+            weights = weights[order]
+    else:
+        indices = np.empty(0, dtype=np.int32)
+        weights = np.empty(0, dtype=np.int64)
+    
+    return indptr, indices, weights
+
+
+def edges_to_csr(
+    edges: list[list[int]] | np.ndarray,
+    n: int,
+    weights: list[int] | np.ndarray | None = None,
+    directed: bool = False,
+    sort_by_weight: bool = False
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """由边列表直接构建CSR（压缩稀疏行）数组，无需经过邻接表
+    
+    出边顺序与 ``adjacency_to_csr(build_adjacency_list(edges, n, weights, directed))``
+    一致：按节点度数前缀和得到 indptr，再以稳定排序将各条弧散布到所属节点的行内。
+    
+    Args:
+        edges: 边列表，格式为 [[u, v], ...]，或形状为 (m, 2) 的整数数组
+        n: 节点数
+        weights: 边权重列表，如果为None则所有边权重为1
+        directed: 是否为有向图
+        sort_by_weight: 是否将每个节点的出边按权重升序排列（权重相同时保持原顺序）
+    
+    Returns:
+        (indptr, indices, weights) 三元组，格式与 ``adjacency_to_csr`` 相同
+    
+    Examples:
+        >>> indptr, indices, weights = edges_to_csr([[0, 1], [1, 2]], 3)
+        >>> indptr.tolist(), indices.tolist(), weights.tolist()
+        ([0, 1, 3, 4], [1, 0, 2, 1], [1, 1, 1, 1])
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if weights is None:
+        weights = np.ones(len(edges), dtype=np.int64)
+    weights = np.asarray(weights) if len(weights) else np.empty(0, dtype=np.int64)
+    
+    if len(edges) != len(weights):
+        raise ValueError(f"边数({len(edges)})与权重数({len(weights)})不匹配")
+    if edges.size and (edges.min() < 0 or edges.max() >= n):
+        raise ValueError(f"节点索引越界: n={n}")
+    
+    if directed:
+        tails, heads = edges[:, 0], edges[:, 1]
+    else:
+        # 每条边展开为相邻的两条弧 u->v、v->u，与邻接表的插入顺序相同
+        tails = edges.ravel()
+        heads = edges[:, ::-1].ravel()
+        weights = np.repeat(weights, 2)
+    
+    degrees = np.bincount(tails, minlength=n)
+    indptr = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(degrees, out=indptr[1:])
+    
+    if sort_by_weight:
+        order = np.lexsort((weights, tails))
+    else:
+        order = np.argsort(tails, kind='stable')
+    
+    return indptr, heads[order].astype(np.int32), weights[order]
+
+
+def sort_csr_by_weight(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """将CSR数组每个节点的出边按权重升序排列（权重相同时保持原顺序）
+    
+    结果与 ``adjacency_to_csr(..., sort_by_weight=True)`` 一致；输入数组不被修改。
+    各行已经有序时（如 ``adjacency_to_csr(..., sort_by_weight=True)`` 的输出）
+    不再排序，只转换下标数组的类型。
+    
+    Args:
+        indptr: 长度为 n+1 的行指针数组
+        indices: 各条有向弧的终点
+        weights: 各条有向弧的权重
+    
+    Returns:
+        (indptr, indices, weights) 三元组，indptr 与 indices 为 int32
+    """
+    indptr = np.asarray(indptr)
+    indices = np.asarray(indices)
+    weights = np.asarray(weights)
+    
+    # 权重下降的位置都落在行首时各行已有序
+    descents = np.flatnonzero(np.diff(weights) < 0) + 1
+    if not np.isin(descents, indptr).all():
+        # 以所属节点为主键、权重为次键排序，出边仍在各自的行内
+        tails = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        order = np.lexsort((weights, tails))
+        indices = indices[order]
+        weights = weights[order]
+    
+    return indptr.astype(np.int32, copy=False), indices.astype(np.int32, copy=False), weights
+
+
 def validate_graph(graph: dict[int, list[tuple[int, int]]], n: int) -> bool:
     """验证图的合法性
     
@@ -98,6 +252,55 @@ def validate_graph(graph: dict[int, list[tuple[int, int]]], n: int) -> bool:
     return True
 
 
+def validate_csr(
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    weights: np.ndarray,
+    n: int
+) -> bool:
+    """验证CSR数组表示的图的合法性
+    
+    检查条件与 ``validate_graph`` 相同，全部以向量化方式完成。
+    
+    Args:
+        indptr: 行指针数组，长度为 n+1
+        indices: 各条弧的终点
+        weights: 各条弧的权重
+        n: 节点数
+    
+    Returns:
+        True 如果图合法，否则 False
+    """
+    if len(indptr) != n + 1:
+        logger.error(f"图节点数不匹配: 期望 {n}, 实际 {len(indptr) - 1}")
+        return False
+    
+    tails = np.repeat(np.arange(n), np.diff(indptr))
+    
+    # 检查节点范围
+    bad = np.flatnonzero((indices < 0) | (indices >= n))
+    if bad.size:
+        i = bad[0]
+        logger.error(f"邻居节点越界: u={tails[i]}, v={indices[i]}, n={n}")
+        return False
+    
+    # 检查权重
+    bad = np.flatnonzero(weights <= 0)
+    if bad.size:
+        i = bad[0]
+        logger.error(f"边权重非正: ({tails[i]}, {indices[i]}) 权重={weights[i]}")
+        return False
+    
+    # 检查自环
+    bad = np.flatnonzero(tails == indices)
+    if bad.size:
+        logger.error(f"存在自环: 节点 {tails[bad[0]]}")
+        return False
+    
+    logger.debug("图验证通过")
+    return True
+
+
 def graph_statistics(graph: dict[int, list[tuple[int, int]]]) -> dict[str, Any]:
     """计算图的统计信息
     
@@ -116,14 +319,41 @@ def graph_statistics(graph: dict[int, list[tuple[int, int]]]) -> dict[str, Any]:
     """
     n = len(graph)
     
+    # 度数与权重收集到 NumPy 数组中归约，不构建Python整数列表
+    degrees = np.fromiter(map(len, graph.values()), dtype=np.int64, count=n)
+    weights = np.fromiter(
+        map(itemgetter(1), chain.from_iterable(graph.values())),
+        dtype=np.float64,
+        count=int(degrees.sum()),
+    )
+    
+    return _degree_weight_statistics(degrees, weights)
+
+
+def csr_statistics(indptr: np.ndarray, weights: np.ndarray) -> dict[str, Any]:
+    """由CSR数组计算图的统计信息，结果与 ``graph_statistics`` 相同
+    
+    Args:
+        indptr: 行指针数组，长度为 n+1
+        weights: 各条弧的权重
+    
+    Returns:
+        包含统计信息的字典，字段同 ``graph_statistics``
+    """
+    return _degree_weight_statistics(np.diff(indptr), weights)
+
+
+def _degree_weight_statistics(degrees: np.ndarray, weights: np.ndarray) -> dict[str, Any]:
+    """由各节点度数与各条弧的权重计算统计信息"""
+    n = len(degrees)
+    
     # 计算度数
-    degrees = [len(neighbors) for neighbors in graph.values()]
-    avg_degree = sum(degrees) / n if n > 0 else 0
-    max_degree = max(degrees) if degrees else 0
-    min_degree = min(degrees) if degrees else 0
+    total_edges = int(degrees.sum())
+    avg_degree = total_edges / n if n > 0 else 0
+    max_degree = int(degrees.max()) if n > 0 else 0
+    min_degree = int(degrees.min()) if n > 0 else 0
     
     # 计算边数（假设无向图，每条边被计算两次）
-    total_edges = sum(degrees)
     m = total_edges // 2 if total_edges % 2 == 0 else (total_edges + 1) // 2
     
     # 计算密度
@@ -131,11 +361,7 @@ def graph_statistics(graph: dict[int, list[tuple[int, int]]]) -> dict[str, Any]:
     density = m / max_edges if max_edges > 0 else 0
     
     # 计算平均权重
-    all_weights = []
-    for neighbors in graph.values():
-        for _, weight in neighbors:
-            all_weights.append(weight)
-    avg_weight = sum(all_weights) / len(all_weights) if all_weights else 0
+    avg_weight = float(np.mean(weights, dtype=np.float64)) if len(weights) else 0
     
     stats = {
         'n': n,
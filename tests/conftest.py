@@ -4,8 +4,12 @@ Pytest配置文件
 定义测试fixtures和全局配置。
 """
 
+import numpy as np
 import pytest
 
+from second_shortest_path.data import GraphGenerator
+from second_shortest_path.utils import edges_to_csr
+
 
 @pytest.fixture
 def simple_graph():
@@ -67,3 +71,31 @@ def disconnected_graph():
     }
     return graph
 
+
+
+@pytest.fixture(scope="module")
+def special_cases():
+    """特殊用例fixture
+    
+    返回 ``GraphGenerator.generate_special_cases()`` 的结果，同一测试模块内只生成一次。
+    使用者只应读取，不应修改其中的图数据。
+    """
+    return GraphGenerator.generate_special_cases()
+
+
+@pytest.fixture(params=[np.float64, np.float32], ids=["float64", "float32"])
+def weight_dtype(request):
+    """浮点权重类型fixture，依次为 float64 和 float32"""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def star_graph_csr():
+    """大规模星型图fixture
+    
+    返回以节点0为中心、10000个节点、边权均为1的星型图CSR数组
+    (indptr, indices, weights)，同一测试模块内只构建一次，使用者不应修改。
+    """
+    n = 10_000
+    leaves = np.arange(1, n)
+    return edges_to_csr(np.column_stack([np.zeros_like(leaves), leaves]), n)
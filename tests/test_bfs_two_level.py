@@ -0,0 +1,40 @@
+"""
+两层BFS算法测试
+"""
+
+import pytest
+
+from second_shortest_path.algorithms import (
+    TwoDistanceDijkstra,
+    find_second_shortest_bfs,
+    is_unit_weight,
+)
+
+
+class TestTwoLevelBFS:
+    """测试单位权图上的两层BFS"""
+    
+    @pytest.mark.parametrize(
+        "graph_fixture", ["chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_matches_dijkstra(self, graph_fixture, request):
+        """单位权图上BFS与Dijkstra结果一致"""
+        graph = request.getfixturevalue(graph_fixture)
+        target = len(graph) - 1
+        
+        expected = TwoDistanceDijkstra(graph).find_second_shortest(0, target)
+        assert find_second_shortest_bfs(graph, 0, target) == expected
+    
+    def test_same_source_target(self, chain_graph):
+        """测试源点等于目标点：次短路径为一次往返"""
+        assert find_second_shortest_bfs(chain_graph, 0, 0) == (0, 2)
+    
+    def test_invalid_source(self, chain_graph):
+        """测试无效源节点"""
+        with pytest.raises(ValueError):
+            find_second_shortest_bfs(chain_graph, 100, 0)
+    
+    def test_is_unit_weight(self, chain_graph, simple_graph):
+        """测试单位权判断"""
+        assert is_unit_weight(chain_graph)
+        assert not is_unit_weight(simple_graph)
@@ -6,9 +6,11 @@ import json
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from second_shortest_path.data import DataLoader
+from second_shortest_path.data import DataLoader, GraphData, loader
+from second_shortest_path.utils import adjacency_to_csr
 
 
 class TestDataLoader:
@@ -37,6 +39,41 @@ class TestDataLoader:
         assert (1, 2) in graph[0]  # 0 -> 1
         assert (0, 2) in graph[1]  # 1 -> 0
     
+    def test_convert_to_graph_lazy_adjacency(self):
+        """测试邻接表在首次访问时才构建并被缓存"""
+        test_case = {'n': 3, 'edges': [[0, 1], [1, 2]], 'time': 4}
+        
+        graph_data = DataLoader.convert_to_graph(test_case)
+        assert 'graph' not in graph_data.keys()
+        
+        graph = graph_data['graph']
+        assert graph == {0: [(1, 4)], 1: [(0, 4), (2, 4)], 2: [(1, 4)]}
+        assert graph_data.get('graph') is graph
+        assert 'graph' in graph_data.keys()
+    
+    def test_graph_data_copy(self):
+        """测试拷贝仍为 GraphData，且可按原边权重按需构建邻接表"""
+        graph_data = DataLoader.convert_to_graph({'n': 3, 'edges': [[0, 1], [1, 2]], 'time': 4})
+        
+        copied = graph_data.copy()
+        
+        assert isinstance(copied, GraphData)
+        assert 'graph' in copied
+        assert copied['graph'] == {0: [(1, 4)], 1: [(0, 4), (2, 4)], 2: [(1, 4)]}
+        assert 'graph' not in graph_data.keys()
+    
+    def test_convert_to_graph_csr(self):
+        """测试CSR数组与由邻接表转换的结果一致"""
+        test_case = {'n': 4, 'edges': [[0, 1], [1, 2], [2, 3], [0, 3], [1, 3]], 'time': 3}
+        
+        graph_data = DataLoader.convert_to_graph(test_case, csr=True)
+        
+        expected = adjacency_to_csr(graph_data['graph'])
+        actual = (graph_data['indptr'], graph_data['indices'], graph_data['weights'])
+        for actual_array, expected_array in zip(actual, expected):
+            np.testing.assert_array_equal(actual_array, expected_array)
+        assert 'indptr' not in DataLoader.convert_to_graph(test_case)
+    
     def test_load_leetcode_data(self):
         """测试加载LeetCode数据"""
         # 创建临时JSON文件
@@ -69,6 +106,19 @@ class TestDataLoader:
             # 清理临时文件
             Path(temp_path).unlink()
     
+    @pytest.mark.parametrize("stream_min_bytes", [0, loader.STREAM_MIN_BYTES])
+    def test_iter_test_cases(self, tmp_path, monkeypatch, stream_min_bytes):
+        """测试流式与整体加载逐个产出相同的测试用例"""
+        test_cases = [
+            {'id': 1, 'n': 3, 'edges': [[0, 1], [1, 2]], 'time': 1},
+            {'id': 2, 'n': 2, 'edges': [[0, 1]], 'time': 5},
+        ]
+        data_file = tmp_path / 'cases.json'
+        data_file.write_text(json.dumps({'problem_id': 2045, 'test_cases': test_cases}))
+        monkeypatch.setattr(loader, 'STREAM_MIN_BYTES', stream_min_bytes)
+        
+        assert list(DataLoader.iter_test_cases(data_file)) == test_cases
+    
     def test_load_nonexistent_file(self):
         """测试加载不存在的文件"""
         with pytest.raises(FileNotFoundError):
@@ -100,3 +150,48 @@ class TestDataLoader:
             assert loaded_data['target'] == 2
             assert loaded_data['expected'] == 2
 
+    
+    def test_save_graph_data_npz_roundtrip(self, tmp_path):
+        """测试二进制格式保存后加载得到相同的图数据"""
+        test_case = {'n': 4, 'edges': [[0, 1], [1, 2], [2, 3]], 'time': 3, 'expected': 12}
+        graph_data = DataLoader.convert_to_graph(test_case)
+        
+        filepath = tmp_path / 'generated' / 'test_graph.npz'
+        DataLoader.save_graph_data_npz(graph_data, filepath)
+        
+        assert filepath.exists()
+        assert (tmp_path / 'generated' / 'test_graph.meta.json').exists()
+        
+        loaded = DataLoader.load_graph_data_npz(filepath)
+        assert loaded['n'] == 4
+        assert loaded['edges'] == test_case['edges']
+        assert loaded['source'] == 0
+        assert loaded['target'] == 3
+        assert loaded['expected'] == 12
+        assert loaded['graph'] == graph_data['graph']
+        
+        # 元数据文件不会被当作JSON数据集重复加载
+        datasets = DataLoader.load_all_datasets(tmp_path)
+        assert [d['source_file'] for d in datasets] == [str(filepath)]
+    
+    def test_save_graph_data_npz_float_weights(self, tmp_path):
+        """测试浮点权重按原类型保存，加载后不被截断"""
+        graph_data = GraphData({'n': 3, 'edges': [[0, 1], [1, 2]]}, edge_weights=[2.5, 0.75])
+        
+        filepath = tmp_path / 'float_graph.npz'
+        DataLoader.save_graph_data_npz(graph_data, filepath)
+        loaded = DataLoader.load_graph_data_npz(filepath)
+        
+        assert loaded.edge_weights == [2.5, 0.75]
+        assert loaded['graph'] == graph_data['graph']
+    
+    def test_save_graph_data_npz_plain_dict_weights(self, tmp_path):
+        """测试普通字典的 'graph' 含非单位权重时报错，而不是丢弃权重"""
+        weighted = {'n': 2, 'edges': [[0, 1]], 'graph': {0: [(1, 3)], 1: [(0, 3)]}}
+        with pytest.raises(ValueError, match="edge_weights"):
+            DataLoader.save_graph_data_npz(weighted, tmp_path / 'weighted.npz')
+        assert not (tmp_path / 'weighted.npz').exists()
+        
+        unit = {'n': 2, 'edges': [[0, 1]], 'graph': {0: [(1, 1)], 1: [(0, 1)]}}
+        DataLoader.save_graph_data_npz(unit, tmp_path / 'unit.npz')
+        assert DataLoader.load_graph_data_npz(tmp_path / 'unit.npz')['graph'] == unit['graph']
@@ -5,91 +5,272 @@ Two-Distance Dijkstra算法测试
 import pytest
 
 from second_shortest_path.algorithms import TwoDistanceDijkstra
+from second_shortest_path.algorithms.dijkstra_two_dist import (
+    _NUMBA_KERNELS,
+    _dijkstra_two_dist,
+    _dijkstra_two_dist_into,
+    _reset_scratch,
+    _warm_up_kernels,
+)
+from second_shortest_path.utils import adjacency_to_csr
 
 
 class TestTwoDistanceDijkstra:
     """测试Two-Distance Dijkstra算法"""
     
-    def test_simple_graph(self, simple_graph):
-        """测试简单图"""
+    @pytest.mark.parametrize(
+        "graph_name, source, target, expected",
+        [
+            # 0-1-2-3-4 = 5，次短为 0-1-3-4 = 6
+            ("simple_graph", 0, 4, (5, 6)),
+            # 链式图的最短路径唯一，次短路径需要绕回一条边
+            ("chain_graph", 0, 9, (9, 11)),
+            # 完全图中最短路径是直接边，次短路径经过一个中间节点
+            ("complete_graph", 0, 4, (1, 2)),
+            # 0和4不连通，应该返回None
+            ("disconnected_graph", 0, 4, (None, None)),
+            # 源点到自己的最短距离是0，次短为走到邻居再返回
+            ("simple_graph", 0, 0, (0, 2)),
+        ],
+        ids=["simple", "chain", "complete", "disconnected", "same_source_target"],
+    )
+    @pytest.mark.parametrize("use_kernel", [True, False], ids=["kernel", "python"])
+    def test_find_second_shortest(self, graph_name, source, target, expected, use_kernel, request):
+        """测试各类图上的最短与次短路径长度（编译内核与纯Python实现）"""
+        graph = request.getfixturevalue(graph_name)
+        algo = TwoDistanceDijkstra(graph)
+        algo._use_kernel = use_kernel
+        
+        assert algo.find_second_shortest(source, target) == expected
+    
+    @pytest.mark.parametrize(
+        "source, target", [(10, 0), (0, 10)], ids=["invalid_source", "invalid_target"]
+    )
+    def test_invalid_endpoints(self, simple_graph, source, target):
+        """测试无效的源点或目标点"""
         algo = TwoDistanceDijkstra(simple_graph)
-        shortest, second_shortest = algo.find_second_shortest(0, 4)
         
-        assert shortest is not None
-        assert second_shortest is not None
-        assert shortest <= second_shortest
+        with pytest.raises(ValueError):
+            algo.find_second_shortest(source, target)
+    
+    def test_statistics_collected(self, simple_graph):
+        """测试开启统计时记录各项计数"""
+        algo = TwoDistanceDijkstra(simple_graph, enable_stats=True)
+        algo.find_second_shortest(0, 4)
         
-        # 验证统计信息
         stats = algo.get_statistics()
         assert stats['pq_operations'] > 0
         assert stats['edge_relaxations'] > 0
         assert stats['iterations'] > 0
     
-    def test_chain_graph(self, chain_graph):
-        """测试链式图"""
-        algo = TwoDistanceDijkstra(chain_graph)
-        shortest, second_shortest = algo.find_second_shortest(0, 9)
+    def test_statistics_reset(self, simple_graph):
+        """测试统计信息在多次运行间正确重置"""
+        algo = TwoDistanceDijkstra(simple_graph, enable_stats=True)
         
-        # 链式图的最短路径应该是唯一的
-        assert shortest == 9
-        # 次短路径需要绕路
-        assert second_shortest > shortest
+        # 第一次运行
+        algo.find_second_shortest(0, 4)
+        stats1 = algo.get_statistics()
+        
+        # 第二次运行
+        algo.find_second_shortest(0, 3)
+        stats2 = algo.get_statistics()
+        
+        # 第二次运行的统计只反映本次搜索，与新实例的结果相同
+        fresh = TwoDistanceDijkstra(simple_graph, enable_stats=True)
+        fresh.find_second_shortest(0, 3)
+        assert stats1['iterations'] > 0
+        assert stats2 == fresh.get_statistics()
+        
+        # 手动重置后计数器全部清零
+        algo.reset_statistics()
+        assert all(value == 0 for value in algo.get_statistics().values())
     
-    def test_complete_graph(self, complete_graph):
-        """测试完全图"""
-        algo = TwoDistanceDijkstra(complete_graph)
-        shortest, second_shortest = algo.find_second_shortest(0, 4)
+    def test_statistics_disabled(self, simple_graph):
+        """测试关闭统计时结果不变且计数器均为 0"""
+        expected = TwoDistanceDijkstra(simple_graph, enable_stats=True).find_second_shortest(0, 4)
         
-        # 完全图中，最短路径是直接边
-        assert shortest == 1
-        # 次短路径是通过一个中间节点
-        assert second_shortest == 2
+        algo = TwoDistanceDijkstra(simple_graph)
+        assert algo.find_second_shortest(0, 4) == expected
+        assert all(value == 0 for value in algo.get_statistics().values())
+        
+        algo._use_kernel = False
+        assert algo.find_second_shortest(0, 4) == expected
+        assert algo.find_second_shortest_bidi(0, 4) == expected
+        assert all(value == 0 for value in algo.get_statistics().values())
     
-    def test_disconnected_graph(self, disconnected_graph):
-        """测试非连通图"""
-        algo = TwoDistanceDijkstra(disconnected_graph)
-        shortest, second_shortest = algo.find_second_shortest(0, 4)
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_kernel_matches_python(self, graph_name, request):
+        """测试CSR内核与纯Python实现的结果和统计信息一致
         
-        # 0和4不连通，应该返回None
-        assert shortest is None
-        assert second_shortest is None
+        内核的索引堆不产生过时状态，弹出次数不多于纯Python实现，
+        其余松弛与标签更新计数完全相同。
+        """
+        graph = request.getfixturevalue(graph_name)
+        n = len(graph)
+        same_keys = ('edge_relaxations', 'd1_updates', 'd2_updates')
+        
+        for target in range(n):
+            algo = TwoDistanceDijkstra(graph, enable_stats=True)
+            algo._use_kernel = False
+            expected = algo.find_second_shortest(0, target)
+            expected_stats = algo.get_statistics()
+            
+            algo._use_kernel = True
+            assert algo.find_second_shortest(0, target) == expected
+            stats = algo.get_statistics()
+            assert {k: stats[k] for k in same_keys} == {k: expected_stats[k] for k in same_keys}
+            assert stats['pop_count'] <= expected_stats['pop_count']
     
-    def test_same_source_target(self, simple_graph):
-        """测试源点和目标点相同的情况"""
+    def test_kernel_warmed_up_on_construction(self, simple_graph):
+        """测试启用内核的实例在构造时即完成内核编译，首次计时不含编译开销"""
+        if not _NUMBA_KERNELS:
+            pytest.skip("需要 numba 编译内核")
+        _warm_up_kernels.cache_clear()
+        
         algo = TwoDistanceDijkstra(simple_graph)
-        shortest, second_shortest = algo.find_second_shortest(0, 0)
         
-        # 源点到自己的最短距离是0
-        assert shortest == 0
+        assert algo._use_kernel
+        assert _warm_up_kernels.cache_info().currsize == 1
+        assert _dijkstra_two_dist.signatures
+        assert _dijkstra_two_dist_into.signatures
+    
+    def test_kernel_unreachable(self, disconnected_graph):
+        """测试内核对不可达目标返回 -1"""
+        algo = TwoDistanceDijkstra(disconnected_graph)
+        shortest, second_shortest, _ = _dijkstra_two_dist(
+            algo.indptr, algo.indices, algo.weights, 0, 4, algo.n
+        )
+        
+        assert shortest == -1
+        assert second_shortest == -1
+    
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_bidi_matches_unidirectional(self, graph_name, request):
+        """测试双向搜索与单向搜索结果一致"""
+        graph = request.getfixturevalue(graph_name)
+        algo = TwoDistanceDijkstra(graph)
+        
+        for source in range(len(graph)):
+            for target in range(len(graph)):
+                expected = algo.find_second_shortest(source, target)
+                assert algo.find_second_shortest_bidi(source, target) == expected
+    
+    def test_bidi_directed_graph(self):
+        """测试双向搜索在有向图上使用反向边"""
+        graph = {
+            0: [(1, 1), (2, 4)],
+            1: [(2, 1)],
+            2: [(3, 1)],
+            3: [(1, 2)],
+        }
+        algo = TwoDistanceDijkstra(graph)
+        
+        # 0->1->2->3 = 3，0->2->3 = 5
+        assert algo.find_second_shortest_bidi(0, 3) == (3, 5)
+        # 有向图中 3 无法到达 0
+        assert algo.find_second_shortest_bidi(3, 0) == (None, None)
     
-    def test_invalid_source(self, simple_graph):
-        """测试无效的源点"""
+    def test_run_batch(self, simple_graph, chain_graph, disconnected_graph):
+        """测试批量求解与逐个求解结果一致"""
+        graphs = [simple_graph, chain_graph, disconnected_graph]
+        sources = [0, 0, 0]
+        targets = [4, 9, 4]
+        
+        expected = [
+            TwoDistanceDijkstra(graph).find_second_shortest(source, target)
+            for graph, source, target in zip(graphs, sources, targets)
+        ]
+        assert TwoDistanceDijkstra.run_batch(graphs, sources, targets) == expected
+    
+    @pytest.mark.parametrize("use_kernel", [True, False], ids=["kernel", "python"])
+    def test_find_second_shortest_batch(self, simple_graph, use_kernel):
+        """测试同一张图上的批量查询与逐个查询结果一致"""
         algo = TwoDistanceDijkstra(simple_graph)
+        algo._use_kernel = use_kernel
+        pairs = [(0, 4), (0, 3), (4, 0), (2, 2), (0, 4)]
+        
+        expected = [algo.find_second_shortest(source, target) for source, target in pairs]
+        assert algo.find_second_shortest_batch(pairs) == expected
         
         with pytest.raises(ValueError):
-            algo.find_second_shortest(10, 0)
+            algo.find_second_shortest_batch([(0, 4), (0, 10)])
     
-    def test_invalid_target(self, simple_graph):
-        """测试无效的目标点"""
-        algo = TwoDistanceDijkstra(simple_graph)
+    def test_kernel_reuses_scratch(self, chain_graph, simple_graph):
+        """测试内核在同一组缓冲区上连续求解不同规模的图"""
+        scratch = None
+        for graph, target in [(chain_graph, 9), (simple_graph, 4), (chain_graph, 5)]:
+            algo = TwoDistanceDijkstra(graph)
+            algo._use_kernel = False
+            expected = algo.find_second_shortest(0, target)
+            
+            scratch = _reset_scratch(scratch, algo.n)
+            assert algo._find_with_kernel(0, target, scratch=scratch) == expected
+    
+    def test_list_adjacency(self, simple_graph):
+        """测试以列表形式传入邻接表时结果与字典一致"""
+        graph_list = [simple_graph[u] for u in range(len(simple_graph))]
+        
+        expected = TwoDistanceDijkstra(simple_graph).find_second_shortest(0, 4)
+        assert TwoDistanceDijkstra(graph_list).find_second_shortest(0, 4) == expected
         
         with pytest.raises(ValueError):
-            algo.find_second_shortest(0, 10)
+            TwoDistanceDijkstra(graph_list).find_second_shortest(0, len(graph_list))
     
-    def test_statistics_reset(self, simple_graph):
-        """测试统计信息在多次运行间正确重置"""
-        algo = TwoDistanceDijkstra(simple_graph)
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    @pytest.mark.parametrize("use_kernel", [True, False])
+    def test_from_csr(self, graph_name, use_kernel, request):
+        """测试由未排序的CSR数组构建的实例与由邻接表构建的结果一致"""
+        graph = request.getfixturevalue(graph_name)
+        algo = TwoDistanceDijkstra(graph)
+        csr_algo = TwoDistanceDijkstra.from_csr(*adjacency_to_csr(graph))
+        algo._use_kernel = csr_algo._use_kernel = use_kernel
         
-        # 第一次运行
-        algo.find_second_shortest(0, 4)
-        stats1 = algo.get_statistics()
+        assert csr_algo.graph is None
+        for target in range(len(graph)):
+            expected = algo.find_second_shortest(0, target)
+            assert csr_algo.find_second_shortest(0, target) == expected
+    
+    @pytest.mark.parametrize("use_kernel", [True, False], ids=["kernel", "python"])
+    def test_star_graph(self, star_graph_csr, use_kernel):
+        """测试大规模星型图上优先队列操作次数随节点数线性增长
         
-        # 第二次运行
-        algo.find_second_shortest(0, 3)
-        stats2 = algo.get_statistics()
+        叶子间的路径都经过中心，每个节点的 d1、d2 至多各入队一次。
+        """
+        algo = TwoDistanceDijkstra.from_csr(*star_graph_csr, enable_stats=True)
+        algo._use_kernel = use_kernel
+        n = algo.n
         
-        # 统计信息应该不同（因为目标不同）
-        # 至少验证统计信息被重置了
-        assert stats1['iterations'] >= 0
-        assert stats2['iterations'] >= 0
-
+        # 1-0-(n-1) = 2，次短为 1-0-1-0-(n-1) = 4
+        assert algo.find_second_shortest(1, n - 1) == (2, 4)
+        
+        stats = algo.get_statistics()
+        assert stats['push_count'] <= 2 * n
+        assert stats['pq_operations'] < 4 * n
+    
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_float_weights(self, graph_name, weight_dtype, request):
+        """测试浮点权重下的结果与整数权重按比例一致
+        
+        权重统一乘以 0.5（二进制下精确），路径长度的相等关系与整数权重相同。
+        """
+        graph = request.getfixturevalue(graph_name)
+        indptr, indices, weights = adjacency_to_csr(graph)
+        algo = TwoDistanceDijkstra(graph)
+        float_algo = TwoDistanceDijkstra.from_csr(
+            indptr, indices, weights.astype(weight_dtype) * weight_dtype(0.5)
+        )
+        
+        for target in range(len(graph)):
+            expected = tuple(
+                None if dist is None else pytest.approx(dist * 0.5, rel=1e-6)
+                for dist in algo.find_second_shortest(0, target)
+            )
+            assert float_algo.find_second_shortest(0, target) == expected
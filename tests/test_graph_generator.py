@@ -2,9 +2,13 @@
 图生成器测试
 """
 
+import numpy as np
 import pytest
 
 from second_shortest_path.data import GraphGenerator
+from second_shortest_path.data import generator
+from second_shortest_path.data.generator import _first_new_keys, _first_new_keys_kernel
+from second_shortest_path.utils import adjacency_to_csr
 
 
 class TestGraphGenerator:
@@ -44,21 +48,71 @@ class TestGraphGenerator:
         # 使用相同种子应该生成相同的图
         assert graph1['edges'] == graph2['edges']
     
+    @pytest.mark.parametrize("n, m", [(50, 60), (50, 49), (20, 150), (20, 190)])
+    def test_generate_random_graph_structure(self, n, m):
+        """测试随机图边互不重复、无自环且连通（覆盖稀疏与稠密采样分支）"""
+        graph_data = GraphGenerator.generate_random_graph(n, m, weight_range=(2, 5), seed=7)
+        
+        edges = {tuple(edge) for edge in graph_data['edges']}
+        assert len(edges) == len(graph_data['edges']) == m
+        assert all(0 <= u < v < n for u, v in edges)
+        assert all(
+            2 <= weight <= 5 for neighbors in graph_data['graph'].values() for _, weight in neighbors
+        )
+        
+        # 从节点0出发应能到达所有节点
+        graph = graph_data['graph']
+        seen = {0}
+        stack = [0]
+        while stack:
+            for v, _ in graph[stack.pop()]:
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        assert len(seen) == n
+    
+    def test_first_new_keys(self):
+        """测试去重内核与numpy实现一致：按顺序取首次出现且不与树边重复的键"""
+        rng = np.random.default_rng(11)
+        keys = rng.integers(0, 200, size=500)
+        tree_keys = np.arange(0, 200, 7, dtype=np.int64)
+        
+        expected = _first_new_keys(keys, tree_keys, 60)
+        
+        assert len(np.unique(expected)) == 60
+        assert not np.isin(expected, tree_keys).any()
+        np.testing.assert_array_equal(_first_new_keys_kernel(keys, tree_keys, 60), expected)
+        np.testing.assert_array_equal(_first_new_keys_kernel(keys, tree_keys, 10**4),
+                                      _first_new_keys(keys, tree_keys, 10**4))
+    
+    def test_random_graph_independent_of_numba(self, monkeypatch):
+        """测试同一 seed 生成的大规模稀疏图与是否使用编译内核无关"""
+        with_kernel = GraphGenerator.generate_random_graph(5000, 20000, seed=3)
+        monkeypatch.setattr(generator, 'njit', None)
+        without_kernel = GraphGenerator.generate_random_graph(5000, 20000, seed=3)
+        
+        assert with_kernel['edges'] == without_kernel['edges']
+        assert with_kernel.edge_weights == without_kernel.edge_weights
+    
+    def test_generate_random_graph_csr(self):
+        """测试随机图的CSR数组与邻接表一致"""
+        graph_data = GraphGenerator.generate_random_graph(30, 80, seed=3, csr=True)
+        
+        expected = adjacency_to_csr(graph_data['graph'])
+        actual = (graph_data['indptr'], graph_data['indices'], graph_data['weights'])
+        for actual_array, expected_array in zip(actual, expected):
+            np.testing.assert_array_equal(actual_array, expected_array)
+    
     def test_generate_test_suite(self):
         """测试生成测试套件"""
         sizes = [10, 20, 30]
         test_suite = GraphGenerator.generate_test_suite(sizes)
         
-        assert len(test_suite) == len(sizes)
-        
-        for i, graph_data in enumerate(test_suite):
-            assert graph_data['n'] == sizes[i]
-            assert 'test_name' in graph_data
+        assert [graph_data['n'] for graph_data in test_suite] == sizes
+        assert all('test_name' in graph_data for graph_data in test_suite)
     
-    def test_generate_special_cases(self):
+    def test_generate_special_cases(self, special_cases):
         """测试生成特殊用例"""
-        special_cases = GraphGenerator.generate_special_cases()
-        
         assert len(special_cases) > 0
         
         # 验证每个特殊用例都有必要的字段
@@ -70,36 +124,38 @@ class TestGraphGenerator:
             assert 'test_name' in graph_data
         
         # 验证包含不同类型的图
-        graph_types = [g['graph_type'] for g in special_cases]
-        assert 'complete' in graph_types
-        assert 'chain' in graph_types
-        assert 'star' in graph_types
-        assert 'grid' in graph_types
+        graph_types = {g['graph_type'] for g in special_cases}
+        assert {'complete', 'chain', 'star', 'grid'} <= graph_types
     
-    def test_complete_graph_structure(self):
+    def test_generate_special_cases_csr(self):
+        """测试特殊用例的CSR数组与邻接表一致"""
+        for graph_data in GraphGenerator.generate_special_cases(csr=True):
+            expected = adjacency_to_csr(graph_data['graph'])
+            actual = (graph_data['indptr'], graph_data['indices'], graph_data['weights'])
+            for actual_array, expected_array in zip(actual, expected):
+                np.testing.assert_array_equal(actual_array, expected_array)
+    
+    def test_complete_graph_structure(self, special_cases):
         """测试完全图的结构"""
-        special_cases = GraphGenerator.generate_special_cases()
         complete_graph = next(g for g in special_cases if g['graph_type'] == 'complete')
         
         n = complete_graph['n']
         graph = complete_graph['graph']
         
         # 完全图中，每个节点应该连接到其他所有节点
-        for node in range(n):
-            assert len(graph[node]) == n - 1
+        degrees = np.array([len(graph[node]) for node in range(n)])
+        np.testing.assert_array_equal(degrees, n - 1)
     
-    def test_chain_graph_structure(self):
+    def test_chain_graph_structure(self, special_cases):
         """测试链式图的结构"""
-        special_cases = GraphGenerator.generate_special_cases()
         chain_graph = next(g for g in special_cases if g['graph_type'] == 'chain')
         
         n = chain_graph['n']
         graph = chain_graph['graph']
         
-        # 链式图中，除了两端，每个节点应该有2个邻居
-        assert len(graph[0]) == 1  # 起点
-        assert len(graph[n - 1]) == 1  # 终点
-        
-        for node in range(1, n - 1):
-            assert len(graph[node]) == 2  # 中间节点
+        # 链式图中，除了两端（度为1），每个节点应该有2个邻居
+        degrees = np.array([len(graph[node]) for node in range(n)])
+        expected = np.full(n, 2)
+        expected[[0, -1]] = 1
+        np.testing.assert_array_equal(degrees, expected)
 
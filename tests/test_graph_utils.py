@@ -0,0 +1,61 @@
+"""
+图工具函数测试
+"""
+
+import numpy as np
+import pytest
+
+from second_shortest_path.utils import (
+    adjacency_to_csr,
+    build_adjacency_list,
+    csr_statistics,
+    graph_statistics,
+    sort_csr_by_weight,
+    validate_csr,
+    validate_graph,
+)
+
+
+class TestGraphUtils:
+    """测试图工具函数"""
+    
+    def test_csr_statistics_matches_adjacency(self, simple_graph):
+        """测试CSR统计信息与邻接表统计信息一致"""
+        indptr, _, weights = adjacency_to_csr(simple_graph)
+        
+        assert csr_statistics(indptr, weights) == graph_statistics(simple_graph)
+    
+    @pytest.mark.parametrize("graph", [
+        {0: [(1, 1)], 1: [(0, 1)]},
+        {0: [(2, 1)], 1: []},
+        {0: [(1, 0)], 1: [(0, 0)]},
+        {0: [(0, 1)], 1: []},
+    ])
+    def test_validate_csr_matches_validate_graph(self, graph):
+        """测试CSR验证结果与邻接表验证结果一致"""
+        n = len(graph)
+        
+        assert validate_csr(*adjacency_to_csr(graph), n) == validate_graph(graph, n)
+    
+    def test_build_adjacency_list_accepts_array(self):
+        """测试数组形式的边列表与列表形式构建结果一致，且越界时报错"""
+        edges = [[0, 1], [1, 2], [2, 0]]
+        weights = [3, 1, 2]
+        
+        graph = build_adjacency_list(np.array(edges), 3, np.array(weights))
+        
+        assert graph == build_adjacency_list(edges, 3, weights)
+        assert all(type(v) is int for arcs in graph.values() for arc in arcs for v in arc)
+        
+        with pytest.raises(ValueError, match="越界"):
+            build_adjacency_list(np.array([[0, 1], [1, 3]]), 3)
+    
+    def test_sort_csr_by_weight(self, simple_graph):
+        """测试CSR行内排序与 adjacency_to_csr(sort_by_weight=True) 一致，已有序时原样返回"""
+        expected = adjacency_to_csr(simple_graph, sort_by_weight=True)
+        
+        for actual, expected_array in zip(sort_csr_by_weight(*adjacency_to_csr(simple_graph)), expected):
+            np.testing.assert_array_equal(actual, expected_array)
+        
+        presorted = sort_csr_by_weight(*expected)
+        assert all(actual is array for actual, array in zip(presorted, expected))
@@ -7,14 +7,27 @@
 
 import json
 import logging
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时回退到标准库
+    orjson = None
+
 # src布局路径修正
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-from second_shortest_path.algorithms import StateExtendedSPFA, TwoDistanceDijkstra
+from second_shortest_path.algorithms import (
+    StateExtendedSPFA,
+    TwoDistanceDijkstra,
+    find_second_shortest_bfs,
+    is_unit_weight,
+)
 from second_shortest_path.data import DataLoader
 
 # 配置日志
@@ -25,22 +38,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def convert_leetcode_case_to_graph(test_case: dict) -> dict:
+def convert_leetcode_case_to_graph(test_case: dict) -> tuple:
     """将LeetCode测试用例转换为图表示
     
     Args:
         test_case: LeetCode测试用例
     
     Returns:
-        图的邻接表表示
+        (graph, source, target) 三元组，graph 为以节点编号为下标的邻接表列表
     """
     n = test_case['n']
     edges = test_case['edges']
     source = test_case['source']
     target = test_case['target']
     
-    # 构建邻接表（无向图，边权重为1）
-    graph = {i: [] for i in range(n + 1)}  # LeetCode使用1-indexed
+    # 构建邻接表（无向图，边权重为1）；节点编号连续，用列表代替字典
+    graph = [[] for _ in range(n + 1)]  # LeetCode使用1-indexed
     
     for u, v in edges:
         graph[u].append((v, 1))
@@ -49,12 +62,148 @@ def convert_leetcode_case_to_graph(test_case: dict) -> dict:
     return graph, source, target
 
 
-def test_on_leetcode_data(data_file: str, output_file: str = None) -> None:
+def _run_one_case(job: tuple) -> dict:
+    """在单个测试用例上运行SPFA与BFS，并验证Dijkstra的求解结果
+    
+    日志以 (级别, 消息) 形式收集并返回，由主进程按用例顺序输出，
+    以便在多进程下保持与串行运行一致的日志顺序。
+    
+    Args:
+        job: (用例序号, 用例总数, 测试用例, (graph, source, target), Dijkstra结果) 元组；
+            Dijkstra结果为 (最短, 次短, 耗时) 三元组，求解出错时为None
+    
+    Returns:
+        包含日志行、BFS/SPFA耗时以及各算法验证结果的字典；验证结果为
+        ('correct' | 'incorrect' | 'errors', 详情或None)，无预期结果时为None
+    """
+    idx, total_cases, test_case, (graph, source, target), dijkstra_result = job
+    case_id = test_case.get('id', idx)
+    name = test_case.get('name', f'Test {case_id}')
+    n = test_case['n']
+    edges = test_case['edges']
+    expected_shortest = test_case.get('expected_shortest')
+    expected_second = test_case.get('expected_second_shortest')
+    has_expected = expected_shortest is not None and expected_second is not None
+    
+    lines = []
+    result = {
+        'lines': lines,
+        'bfs': None,
+        'spfa_time': 0,
+        'dijkstra': None,
+        'spfa': None,
+    }
+    
+    lines.append((logging.INFO, f"[{idx}/{total_cases}] {name} (n={n}, m={len(edges)})"))
+    
+    # LeetCode图边权均为1，直接使用BFS求解
+    if is_unit_weight(graph):
+        start_time = time.perf_counter()
+        b_shortest, b_second = find_second_shortest_bfs(graph, source, target)
+        elapsed_time = time.perf_counter() - start_time
+        
+        outcome = None
+        if has_expected:
+            b_correct = b_shortest == expected_shortest and b_second == expected_second
+            outcome = 'correct' if b_correct else 'incorrect'
+        result['bfs'] = {'time': elapsed_time, 'outcome': outcome}
+        
+        lines.append((logging.INFO, f"  BFS:      最短={b_shortest}, 次短={b_second} "
+                                    f"(耗时: {elapsed_time*1000:.2f}ms)"))
+    
+    # 如果没有预期结果，跳过验证
+    if not has_expected:
+        lines.append((logging.INFO, "  ⚠️  无预期结果，仅记录运行结果"))
+        
+        if dijkstra_result is not None:
+            d_shortest, d_second, d_time = dijkstra_result
+            lines.append((logging.INFO, f"  Dijkstra: 最短={d_shortest}, 次短={d_second} "
+                                        f"(耗时: {d_time*1000:.2f}ms)"))
+        else:
+            lines.append((logging.ERROR, "  Dijkstra: ERROR - 无结果"))
+        
+        try:
+            spfa = StateExtendedSPFA(graph)
+            start_time = time.perf_counter()
+            s_shortest, s_second = spfa.find_second_shortest(source, target)
+            elapsed_time = time.perf_counter() - start_time
+            result['spfa_time'] = elapsed_time
+            lines.append((logging.INFO, f"  SPFA: 最短={s_shortest}, 次短={s_second} "
+                                        f"(耗时: {elapsed_time*1000:.2f}ms)"))
+        except Exception as e:
+            lines.append((logging.ERROR, f"  SPFA: ERROR - {e}"))
+        
+        lines.append((logging.INFO, ""))
+        return result
+    
+    # 验证 Two-Distance Dijkstra 的求解结果
+    if dijkstra_result is not None:
+        d_shortest, d_second, d_time = dijkstra_result
+        d_correct = (d_shortest == expected_shortest and 
+                    d_second == expected_second)
+        status = "✅ PASS" if d_correct else "❌ FAIL"
+        
+        result['dijkstra'] = ('correct' if d_correct else 'incorrect', {
+            'case_id': case_id,
+            'name': name,
+            'status': status,
+            'expected': (expected_shortest, expected_second),
+            'actual': (d_shortest, d_second),
+            'time': d_time,
+        })
+        
+        lines.append((logging.INFO, f"  Dijkstra: {status} - 最短={d_shortest}, 次短={d_second} "
+                                    f"(耗时: {d_time*1000:.2f}ms)"))
+    
+    else:
+        result['dijkstra'] = ('errors', None)
+        lines.append((logging.ERROR, "  Dijkstra: ❌ ERROR - 无结果"))
+    
+    # 测试 State-Extended SPFA
+    try:
+        spfa = StateExtendedSPFA(graph)
+        start_time = time.perf_counter()
+        s_shortest, s_second = spfa.find_second_shortest(source, target)
+        elapsed_time = time.perf_counter() - start_time
+        
+        result['spfa_time'] = elapsed_time
+        
+        # 验证结果
+        s_correct = (s_shortest == expected_shortest and 
+                    s_second == expected_second)
+        status = "✅ PASS" if s_correct else "❌ FAIL"
+        
+        result['spfa'] = ('correct' if s_correct else 'incorrect', {
+            'case_id': case_id,
+            'name': name,
+            'status': status,
+            'expected': (expected_shortest, expected_second),
+            'actual': (s_shortest, s_second),
+            'time': elapsed_time,
+        })
+        
+        lines.append((logging.INFO, f"  SPFA:     {status} - 最短={s_shortest}, 次短={s_second} "
+                                    f"(耗时: {elapsed_time*1000:.2f}ms)"))
+    
+    except Exception as e:
+        result['spfa'] = ('errors', None)
+        lines.append((logging.ERROR, f"  SPFA:     ❌ ERROR - {e}"))
+    
+    lines.append((logging.INFO, ""))
+    return result
+
+
+def test_on_leetcode_data(
+    data_file: str,
+    output_file: str = None,
+    parallel: bool = False
+) -> None:
     """在LeetCode数据上运行测试
     
     Args:
         data_file: LeetCode数据文件路径
         output_file: 输出报告文件路径
+        parallel: 是否用多进程并行运行各用例（计时受资源争用影响）
     """
     logger.info("=" * 70)
     logger.info("LeetCode数据集测试")
@@ -86,120 +235,71 @@ def test_on_leetcode_data(data_file: str, output_file: str = None) -> None:
         'details': [],
     }
     
-    # 运行测试
-    for idx, test_case in enumerate(test_cases, 1):
-        case_id = test_case.get('id', idx)
-        name = test_case.get('name', f'Test {case_id}')
-        n = test_case['n']
-        edges = test_case['edges']
-        expected_shortest = test_case.get('expected_shortest')
-        expected_second = test_case.get('expected_second_shortest')
-        
-        logger.info(f"[{idx}/{total_cases}] {name} (n={n}, m={len(edges)})")
-        
-        # 转换图
-        graph, source, target = convert_leetcode_case_to_graph(test_case)
+    # 单位权图额外使用两层BFS求解（无需优先队列）
+    bfs_stats = {
+        'total_time': 0,
+        'cases': 0,
+        'correct': 0,
+        'incorrect': 0,
+    }
+    
+    # 预处理阶段：所有用例先转换为图，计时循环只包含求解本身；
+    # 并行模式下转换与逐用例测试共用同一个进程池
+    executor = ProcessPoolExecutor(max_workers=os.cpu_count()) if parallel else None
+    map_cases = partial(executor.map, chunksize=8) if parallel else map
+    
+    try:
+        converted = list(map_cases(convert_leetcode_case_to_graph, test_cases))
         
-        # 如果没有预期结果，跳过验证
-        if expected_shortest is None or expected_second is None:
-            logger.info(f"  ⚠️  无预期结果，仅记录运行结果")
-            
+        # Dijkstra 在主进程中逐用例求解：实例（CSR构建与内核预热）在计时前创建，
+        # 计时只包含 find_second_shortest 本身；单个用例出错只影响该用例。
+        # 各用例的耗时与结果一起传给 _run_one_case，写入明细与日志
+        dijkstra_results = []
+        for idx, (graph, source, target) in enumerate(converted, 1):
             try:
                 dijkstra = TwoDistanceDijkstra(graph)
                 start_time = time.perf_counter()
                 d_shortest, d_second = dijkstra.find_second_shortest(source, target)
                 elapsed_time = time.perf_counter() - start_time
+                dijkstra_results.append((d_shortest, d_second, elapsed_time))
                 dijkstra_stats['total_time'] += elapsed_time
-                logger.info(f"  Dijkstra: 最短={d_shortest}, 次短={d_second} (耗时: {elapsed_time*1000:.2f}ms)")
-            except Exception as e:
-                logger.error(f"  Dijkstra: ERROR - {e}")
-            
-            try:
-                spfa = StateExtendedSPFA(graph)
-                start_time = time.perf_counter()
-                s_shortest, s_second = spfa.find_second_shortest(source, target)
-                elapsed_time = time.perf_counter() - start_time
-                spfa_stats['total_time'] += elapsed_time
-                logger.info(f"  SPFA: 最短={s_shortest}, 次短={s_second} (耗时: {elapsed_time*1000:.2f}ms)")
             except Exception as e:
-                logger.error(f"  SPFA: ERROR - {e}")
-            
-            logger.info("")
-            continue
-        
-        # 测试 Two-Distance Dijkstra
-        try:
-            dijkstra = TwoDistanceDijkstra(graph)
-            start_time = time.perf_counter()
-            d_shortest, d_second = dijkstra.find_second_shortest(source, target)
-            elapsed_time = time.perf_counter() - start_time
-            
-            dijkstra_stats['total_time'] += elapsed_time
-            
-            # 验证结果
-            d_correct = (d_shortest == expected_shortest and 
-                        d_second == expected_second)
-            
-            if d_correct:
-                dijkstra_stats['correct'] += 1
-                status = "✅ PASS"
-            else:
-                dijkstra_stats['incorrect'] += 1
-                status = "❌ FAIL"
-            
-            dijkstra_stats['details'].append({
-                'case_id': case_id,
-                'name': name,
-                'status': status,
-                'expected': (expected_shortest, expected_second),
-                'actual': (d_shortest, d_second),
-                'time': elapsed_time,
-            })
-            
-            logger.info(f"  Dijkstra: {status} - 最短={d_shortest}, 次短={d_second} "
-                       f"(耗时: {elapsed_time*1000:.2f}ms)")
+                logger.error(f"Dijkstra 求解用例 {idx} 失败: {e}")
+                dijkstra_results.append(None)
         
-        except Exception as e:
-            dijkstra_stats['errors'] += 1
-            logger.error(f"  Dijkstra: ❌ ERROR - {e}")
+        # 各用例相互独立：SPFA与BFS在工作进程中运行，日志收集后按用例顺序输出
+        jobs = [
+            (idx, total_cases, test_case, converted[idx - 1], dijkstra_results[idx - 1])
+            for idx, test_case in enumerate(test_cases, 1)
+        ]
         
-        # 测试 State-Extended SPFA
-        try:
-            spfa = StateExtendedSPFA(graph)
-            start_time = time.perf_counter()
-            s_shortest, s_second = spfa.find_second_shortest(source, target)
-            elapsed_time = time.perf_counter() - start_time
-            
-            spfa_stats['total_time'] += elapsed_time
+        case_results = map_cases(_run_one_case, jobs)
+        for case_result in case_results:
+            for level, message in case_result['lines']:
+                logger.log(level, message)
             
-            # 验证结果
-            s_correct = (s_shortest == expected_shortest and 
-                        s_second == expected_second)
+            bfs_result = case_result['bfs']
+            if bfs_result is not None:
+                bfs_stats['total_time'] += bfs_result['time']
+                bfs_stats['cases'] += 1
+                if bfs_result['outcome'] is not None:
+                    bfs_stats[bfs_result['outcome']] += 1
             
-            if s_correct:
-                spfa_stats['correct'] += 1
-                status = "✅ PASS"
-            else:
-                spfa_stats['incorrect'] += 1
-                status = "❌ FAIL"
+            spfa_stats['total_time'] += case_result['spfa_time']
             
-            spfa_stats['details'].append({
-                'case_id': case_id,
-                'name': name,
-                'status': status,
-                'expected': (expected_shortest, expected_second),
-                'actual': (s_shortest, s_second),
-                'time': elapsed_time,
-            })
-            
-            logger.info(f"  SPFA:     {status} - 最短={s_shortest}, 次短={s_second} "
-                       f"(耗时: {elapsed_time*1000:.2f}ms)")
-        
-        except Exception as e:
-            spfa_stats['errors'] += 1
-            logger.error(f"  SPFA:     ❌ ERROR - {e}")
-        
-        logger.info("")
+            for stats, outcome in (
+                (dijkstra_stats, case_result['dijkstra']),
+                (spfa_stats, case_result['spfa']),
+            ):
+                if outcome is None:
+                    continue
+                key, detail = outcome
+                stats[key] += 1
+                if detail is not None:
+                    stats['details'].append(detail)
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     # 生成总结
     logger.info("=" * 70)
@@ -222,6 +322,13 @@ def test_on_leetcode_data(data_file: str, output_file: str = None) -> None:
     logger.info(f"  正确率: {spfa_stats['correct']/total_cases*100:.1f}%")
     logger.info(f"  平均耗时: {spfa_stats['total_time']/total_cases*1000:.2f}ms/case")
     
+    if bfs_stats['cases'] > 0:
+        logger.info("\n📈 Two-Level BFS（单位权图）:")
+        logger.info(f"  总耗时: {bfs_stats['total_time']:.3f}s")
+        logger.info(f"  用例数: {bfs_stats['cases']}/{total_cases}")
+        logger.info(f"  通过: {bfs_stats['correct']}")
+        logger.info(f"  失败: {bfs_stats['incorrect']}")
+    
     # 性能对比
     if dijkstra_stats['total_time'] > 0 and spfa_stats['total_time'] > 0:
         speedup = dijkstra_stats['total_time'] / spfa_stats['total_time']
@@ -253,13 +360,18 @@ def test_on_leetcode_data(data_file: str, output_file: str = None) -> None:
                     'total_time': spfa_stats['total_time'],
                     'accuracy': spfa_stats['correct'] / total_cases,
                 },
+                'bfs': bfs_stats,
             },
             'dijkstra_details': dijkstra_stats['details'],
             'spfa_details': spfa_stats['details'],
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # orjson 直接输出UTF-8字节，元组序列化为列表，与标准库结果一致
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
         
         logger.info(f"\n📄 详细报告已保存到: {output_path}")
 
@@ -283,6 +395,11 @@ def main():
         default='results/leetcode_test_report.json',
         help='输出报告文件路径'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='多进程并行运行各用例（计时受争用影响，仅用于吞吐量测试）'
+    )
     
     args = parser.parse_args()
     
@@ -292,7 +409,7 @@ def main():
         sys.exit(1)
     
     try:
-        test_on_leetcode_data(str(data_path), args.output)
+        test_on_leetcode_data(str(data_path), args.output, args.parallel)
         logger.info("\n✅ 测试完成！")
     except Exception as e:
         logger.error(f"❌ 测试失败: {e}", exc_info=True)
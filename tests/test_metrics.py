@@ -0,0 +1,69 @@
+"""
+性能指标与复杂度分析测试
+"""
+
+import pandas as pd
+import pytest
+
+from second_shortest_path.algorithms import TwoDistanceDijkstra
+from second_shortest_path.evaluation import ComplexityAnalyzer, PerformanceMetrics
+from second_shortest_path.evaluation import metrics as metrics_module
+from second_shortest_path.evaluation.metrics import _cached_random_graph
+
+
+class TestPerformanceMetrics:
+    """测试性能指标收集与导出"""
+    
+    def test_export_results_pyarrow_matches_pandas(self, tmp_path, monkeypatch, disconnected_graph):
+        """测试 pyarrow 与 pandas 写出的CSV读回后内容一致（含不可达时的空值）"""
+        pytest.importorskip("pyarrow")
+        metrics = PerformanceMetrics()
+        metrics.run_single_test(TwoDistanceDijkstra(disconnected_graph, enable_stats=True),
+                                disconnected_graph, 0, 2)
+        metrics.run_single_test(TwoDistanceDijkstra(disconnected_graph), disconnected_graph, 0, 4)
+        
+        metrics.export_results(tmp_path / "pyarrow.csv")
+        monkeypatch.setattr(metrics_module, 'pa', None)
+        metrics.export_results(tmp_path / "pandas.csv")
+        
+        from_pyarrow = pd.read_csv(tmp_path / "pyarrow.csv")
+        from_pandas = pd.read_csv(tmp_path / "pandas.csv")
+        
+        pd.testing.assert_frame_equal(from_pyarrow, from_pandas)
+        assert list(from_pyarrow.columns) == list(metrics.results[0])
+        assert from_pyarrow['shortest'].iloc[0] == 2
+        assert from_pyarrow['shortest'].isna().iloc[1]
+
+
+class TestComplexityAnalyzer:
+    """测试经验复杂度分析"""
+    
+    def test_cached_random_graph_returns_copies(self):
+        """测试缓存的随机图每次返回独立副本，修改不影响后续调用"""
+        first = _cached_random_graph(20, 40, 0, None)
+        first['edges'].clear()
+        first['source'] = 5
+        
+        second = _cached_random_graph(20, 40, 0, None)
+        
+        assert len(second['edges']) == 40
+        assert second['source'] == 0
+    
+    def test_empirical_complexity_runs_on_generated_graphs(self, simple_graph, monkeypatch):
+        """测试在每张生成的图上构建新实例计时，而非复用传入实例的图"""
+        sizes = []
+        original_init = TwoDistanceDijkstra.__init__
+        
+        def recording_init(self, graph, *args, **kwargs):
+            sizes.append(len(graph))
+            original_init(self, graph, *args, **kwargs)
+        
+        algorithm = TwoDistanceDijkstra(simple_graph)
+        monkeypatch.setattr(TwoDistanceDijkstra, '__init__', recording_init)
+        
+        result = ComplexityAnalyzer().empirical_complexity(
+            algorithm, [10, 20], num_trials=2, cache_dir=None
+        )
+        
+        assert sizes == [10, 10, 20, 20]
+        assert [p['n'] for p in result['data_points']] == [10, 20]
@@ -4,7 +4,8 @@ State-Extended SPFA算法测试
 
 import pytest
 
-from second_shortest_path.algorithms import StateExtendedSPFA
+from second_shortest_path.algorithms import StateExtendedSPFA, TwoDistanceDijkstra
+from second_shortest_path.utils import adjacency_to_csr
 
 
 class TestStateExtendedSPFA:
@@ -12,7 +13,7 @@ class TestStateExtendedSPFA:
     
     def test_simple_graph(self, simple_graph):
         """测试简单图"""
-        algo = StateExtendedSPFA(simple_graph)
+        algo = StateExtendedSPFA(simple_graph, enable_stats=True)
         shortest, second_shortest = algo.find_second_shortest(0, 4)
         
         assert shortest is not None
@@ -79,7 +80,7 @@ class TestStateExtendedSPFA:
     
     def test_statistics_reset(self, simple_graph):
         """测试统计信息在多次运行间正确重置"""
-        algo = StateExtendedSPFA(simple_graph)
+        algo = StateExtendedSPFA(simple_graph, enable_stats=True)
         
         # 第一次运行
         algo.find_second_shortest(0, 4)
@@ -89,8 +90,57 @@ class TestStateExtendedSPFA:
         algo.find_second_shortest(0, 3)
         stats2 = algo.get_statistics()
         
-        # 统计信息应该不同（因为目标不同）
-        # 至少验证统计信息被重置了
-        assert stats1['iterations'] >= 0
-        assert stats2['iterations'] >= 0
-
+        # 第二次运行的统计只反映本次搜索，与新实例的结果相同
+        fresh = StateExtendedSPFA(simple_graph, enable_stats=True)
+        fresh.find_second_shortest(0, 3)
+        assert stats1['iterations'] > 0
+        assert stats2 == fresh.get_statistics()
+        
+        # 手动重置后计数器全部清零
+        algo.reset_statistics()
+        assert all(value == 0 for value in algo.get_statistics().values())
+    
+    def test_statistics_disabled(self, simple_graph):
+        """测试关闭统计时结果不变且计数器均为 0"""
+        expected = StateExtendedSPFA(simple_graph, enable_stats=True).find_second_shortest(0, 4)
+        
+        algo = StateExtendedSPFA(simple_graph)
+        assert algo.find_second_shortest(0, 4) == expected
+        assert all(value == 0 for value in algo.get_statistics().values())
+    
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_matches_dijkstra(self, graph_name, request):
+        """测试与Two-Distance Dijkstra结果一致"""
+        graph = request.getfixturevalue(graph_name)
+        
+        for target in range(len(graph)):
+            expected = TwoDistanceDijkstra(graph).find_second_shortest(0, target)
+            assert StateExtendedSPFA(graph).find_second_shortest(0, target) == expected
+    
+    @pytest.mark.parametrize(
+        "graph_name", ["simple_graph", "chain_graph", "complete_graph", "disconnected_graph"]
+    )
+    def test_from_csr(self, graph_name, request):
+        """测试由未排序的CSR数组构建的实例与由邻接表构建的结果一致"""
+        graph = request.getfixturevalue(graph_name)
+        algo = StateExtendedSPFA(graph)
+        csr_algo = StateExtendedSPFA.from_csr(*adjacency_to_csr(graph))
+        
+        assert csr_algo.graph is None
+        assert csr_algo.n == algo.n
+        for target in range(len(graph)):
+            assert csr_algo.find_second_shortest(0, target) == algo.find_second_shortest(0, target)
+    
+    def test_label_improved_while_queued(self):
+        """测试状态在队列中时标签被改进，出队后按当前标签扩展"""
+        graph = {
+            0: [(2, 8), (1, 2)],
+            1: [(2, 10), (0, 7), (2, 1)],
+            2: [(0, 1), (0, 6)],
+        }
+        algo = StateExtendedSPFA(graph)
+        
+        # 最短为 1->2 = 1，次短为 1->2->0->1->2 = 1+1+2+1 = 5
+        assert algo.find_second_shortest(1, 2) == (1, 5)